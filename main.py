@@ -8,12 +8,8 @@ import sys
 from datetime import datetime
 from uuid import uuid4, UUID
 
-from src.database.connection import ScyllaDBConnection
-from src.database.init_db import initialize_database
-from src.database.repositories.hospital_repository import HospitalRepository
-from src.database.repositories.department_repository import DepartmentRepository
-from src.database.repositories.patient_repository import PatientRepository
-from src.database.repositories.staff_repository import StaffRepository
+from src.database.connection import close_shared_connection, get_repositories
+from src.database.hierarchy import HierarchyLoader
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -101,21 +97,20 @@ def get_staff_input(departments):
 # ------------------------------------------------------------------ #
 # Display helpers
 # ------------------------------------------------------------------ #
-def display_all(hosp_repo, dept_repo, patient_repo, staff_repo):
+def display_all(hosp_repo, dept_repo, patient_repo, staff_repo, include_members=True):
     """Print a full tree: Hospital → Departments → Patients & Staff."""
-    hospitals = hosp_repo.get_all()
+    loader = HierarchyLoader(hosp_repo, dept_repo, patient_repo, staff_repo)
+    hospitals = loader.load(include_members=include_members)
     if not hospitals:
         logger.info("No hospitals in the system.")
         return hospitals, []
 
-    all_departments = []
+    all_departments = [d for h in hospitals for d in h.departments]
     for hospital in hospitals:
         logger.info(f"\n🏥  {hospital.name} | {hospital.location} | {hospital.phone}")
         logger.info(f"    Hospital ID: {hospital.hospital_id}")
 
-        departments = dept_repo.find_by_hospital(hospital.hospital_id)
-        all_departments.extend(departments)
-
+        departments = hospital.departments
         if not departments:
             logger.info("    └─ (no departments)")
             continue
@@ -123,22 +118,23 @@ def display_all(hosp_repo, dept_repo, patient_repo, staff_repo):
         for dept in departments:
             logger.info(f"    🏢  {dept.name} – {dept.description or 'no description'}")
             logger.info(f"        Department ID: {dept.department_id}")
+            if not include_members:
+                continue
 
             # Patients managed by this department
-            patients = patient_repo.find_by_department(dept.department_id)
+            patients = dept.patients
             if patients:
                 logger.info("        👥 Patients:")
                 for p in patients:
                     logger.info(
                         f"            • {p.first_name} {p.last_name} | "
-                        f"Age: {p.age} | Phone: {p.phone} | "
-                        f"Medical Record: {p.medical_record or 'N/A'}"
+                        f"Age: {p.age} | Phone: {p.phone}"
                     )
             else:
                 logger.info("        👥 Patients: (none)")
 
             # Staff employed by this department
-            staff = staff_repo.find_by_department(dept.department_id)
+            staff = dept.staff_members
             if staff:
                 logger.info("        👔 Staff:")
                 for s in staff:
@@ -161,14 +157,11 @@ def main():
     logger.info("=" * 60)
 
     try:
-        db = ScyllaDBConnection()
-        session = db.connect()
-        initialize_database(session)
-
-        hosp_repo = HospitalRepository(session=session)
-        dept_repo = DepartmentRepository(session=session)
-        patient_repo = PatientRepository(session=session)
-        staff_repo = StaffRepository(session=session)
+        repos = get_repositories()
+        hosp_repo = repos.hospitals
+        dept_repo = repos.departments
+        patient_repo = repos.patients
+        staff_repo = repos.staff
 
         while True:
             logger.info("\n--- Menu ---")
@@ -190,7 +183,9 @@ def main():
                     logger.error(f"Input error: {ve}")
 
             elif choice == "2":
-                hospitals, _ = display_all(hosp_repo, dept_repo, patient_repo, staff_repo)
+                hospitals, _ = display_all(
+                    hosp_repo, dept_repo, patient_repo, staff_repo, include_members=False
+                )
                 try:
                     hospital_id, name, description = get_department_input(hospitals)
                     did = dept_repo.create(name, hospital_id, description)
@@ -199,7 +194,9 @@ def main():
                     logger.error(f"Input error: {e}")
 
             elif choice == "3":
-                _, departments = display_all(hosp_repo, dept_repo, patient_repo, staff_repo)
+                _, departments = display_all(
+                    hosp_repo, dept_repo, patient_repo, staff_repo, include_members=False
+                )
                 try:
                     dept_id, fn, ln, dob, age, phone, med = get_patient_input(departments)
                     pid = patient_repo.create(fn, ln, dob, age, phone, dept_id, med)
@@ -208,7 +205,9 @@ def main():
                     logger.error(f"Input error: {e}")
 
             elif choice == "4":
-                _, departments = display_all(hosp_repo, dept_repo, patient_repo, staff_repo)
+                _, departments = display_all(
+                    hosp_repo, dept_repo, patient_repo, staff_repo, include_members=False
+                )
                 try:
                     dept_id, fn, ln, age, position = get_staff_input(departments)
                     sid = staff_repo.create(fn, ln, age, position, dept_id)
@@ -225,7 +224,7 @@ def main():
             else:
                 logger.warning("Invalid choice.")
 
-        db.close()
+        close_shared_connection()
 
     except Exception as e:
         logger.error(f"❌ Application error: {e}")
@@ -7,13 +7,32 @@ env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
 
+def _host_list(value: str) -> list:
+    return [host.strip() for host in value.split(",") if host.strip()]
+
+
 class DatabaseConfig:
     """Database configuration settings"""
 
-    SCYLLA_HOSTS = os.getenv("SCYLLA_HOSTS", "172.17.0.2").split(",")
+    # Contact points: SCYLLA_HOSTS="a,b,c", falling back to a single SCYLLA_HOST
+    SCYLLA_HOSTS = _host_list(
+        os.getenv("SCYLLA_HOSTS") or os.getenv("SCYLLA_HOST", "new-scylla-node")
+    )
     SCYLLA_PORT = int(os.getenv("SCYLLA_PORT", "9042"))
     SCYLLA_KEYSPACE = os.getenv("SCYLLA_KEYSPACE", "hospital_db")
     SCYLLA_REPLICATION_FACTOR = int(os.getenv("SCYLLA_REPLICATION_FACTOR", "1"))
+    SCYLLA_LOCAL_DC = os.getenv("SCYLLA_LOCAL_DC", "datacenter1")
+    # Connect one pool per shard (needs the scylla-driver build of the driver)
+    SCYLLA_SHARD_AWARE = os.getenv("SCYLLA_SHARD_AWARE", "true").lower() in (
+        "1", "true", "yes",
+    )
+    # Speculative retries of idempotent reads: off, constant or percentile
+    SPECULATIVE_EXECUTION = os.getenv("SPECULATIVE_EXECUTION", "percentile").lower()
+    SPECULATIVE_DELAY_MS = float(os.getenv("SPECULATIVE_DELAY_MS", "50"))
+    SPECULATIVE_PERCENTILE = float(os.getenv("SPECULATIVE_PERCENTILE", "99"))
+    SPECULATIVE_MAX_ATTEMPTS = int(os.getenv("SPECULATIVE_MAX_ATTEMPTS", "1"))
+    # Partitions per department for patients/staff; fixed once data exists
+    PARTITION_BUCKETS = int(os.getenv("PARTITION_BUCKETS", "8"))
 
 
 class AppConfig:
@@ -21,6 +40,14 @@ class AppConfig:
 
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = os.getenv("LOG_FILE", "logs/app.log")
+    DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "10"))
+    MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "100"))
+    CACHE_TTL = float(os.getenv("CACHE_TTL", "300"))
+    RECENT_LOOKBACK_DAYS = int(os.getenv("RECENT_LOOKBACK_DAYS", "30"))
+    # Requests slower than this are written to the slow-query log
+    SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "250"))
+    # Serve Prometheus metrics on this port (0 = disabled)
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
 
 
 class Config:
@@ -0,0 +1,35 @@
+"""Bucketed partitioning for the patient and staff tables.
+
+A department's rows are spread over ``PARTITION_BUCKETS`` partitions keyed
+by ``(department_id, bucket)``, so one busy department never becomes a
+single huge partition. The bucket comes from the entity's own UUID, which
+makes it stable: any row can be located again from its id alone.
+
+Changing the bucket count re-routes existing ids, so it must stay fixed
+once data has been written (or the data must be copied again).
+"""
+from uuid import UUID
+
+from src.config.settings import DatabaseConfig
+
+
+def bucket_count() -> int:
+    """Number of buckets per department."""
+    return DatabaseConfig.PARTITION_BUCKETS
+
+
+def bucket_for(entity_id) -> int:
+    """Return the bucket an entity id is routed to."""
+    if isinstance(entity_id, str):
+        entity_id = UUID(entity_id)
+    return entity_id.int % bucket_count()
+
+
+def all_buckets() -> range:
+    """Every bucket of a department, for fan-out reads."""
+    return range(bucket_count())
+
+
+def concat(*lists) -> list:
+    """Join the per-bucket result lists of a fan-out read."""
+    return [item for items in lists for item in items]
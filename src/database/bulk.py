@@ -0,0 +1,169 @@
+"""Bulk ingestion engine used by the repositories' create_many() methods."""
+import time
+from collections import defaultdict, namedtuple
+from itertools import islice
+
+from cassandra.concurrent import execute_concurrent
+from cassandra.query import BatchStatement, BatchType
+from src.database.instrumentation import BULK_METRICS
+from src.database.profiles import BULK_WRITE
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# One record ready to write: the main-table insert plus its index writes.
+BulkRow = namedtuple("BulkRow", ["entity_id", "partition_key", "main", "extras"])
+
+DEFAULT_CONCURRENCY = 50
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class BulkWriteResult:
+    """Per-row outcome and throughput of one bulk write.
+
+    A row counts as written once its main-table insert succeeded. Failed
+    index, lookup or feed writes of such a row are listed separately in
+    ``index_errors``: the row exists, so retrying it would duplicate it;
+    its side tables can be repaired with the repository's rebuild_lookups().
+    """
+
+    def __init__(self):
+        self.results = []  # (position, entity_id or None, error or None)
+        self.index_errors = []  # (position, error) of failed extras
+        self.elapsed = 0.0
+
+    def add(self, position, entity_id, error=None):
+        self.results.append((position, entity_id, error))
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for _, _, error in self.results if error is None)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.succeeded / self.elapsed if self.elapsed else 0.0
+
+    def errors(self) -> list:
+        """Return ``(position, error)`` for every row that was not written."""
+        return [(pos, error) for pos, _, error in self.results if error is not None]
+
+    def summary(self) -> dict:
+        return {
+            "rows": len(self.results),
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "index_failed": len({pos for pos, _ in self.index_errors}),
+            "elapsed_seconds": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def bulk_write(
+    repository,
+    records,
+    build_row,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    group_by_partition: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_written=None,
+) -> BulkWriteResult:
+    """
+    Stream ``records`` into the database with bounded concurrency.
+
+    Args:
+        repository:         Repository providing the session and statement cache
+        records:            Iterable of records (consumed ``chunk_size`` at a time)
+        build_row:          Callable turning one record into a BulkRow
+        concurrency:        Maximum requests in flight at once
+        group_by_partition: Send main-table rows as UNLOGGED batches per partition
+        batch_size:         Maximum rows per partition batch
+        chunk_size:         Records buffered in memory between waves
+        on_written:         Optional callable given the BulkRows of each chunk
+                            that were written without error
+
+    Returns:
+        BulkWriteResult: per-row success/failure plus throughput
+    """
+    result = BulkWriteResult()
+    started = time.perf_counter()
+    records = iter(records)
+    offset = 0
+
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+
+        rows = {}
+        for pos, record in enumerate(chunk, start=offset):
+            try:
+                rows[pos] = build_row(record)
+            except Exception as e:
+                result.add(pos, None, e)
+
+        units = _plan(repository, rows, group_by_partition, batch_size)
+        outcomes = execute_concurrent(
+            repository.session,
+            [(statement, params) for statement, params, _, _ in units],
+            concurrency=concurrency,
+            raise_on_first_error=False,
+            execution_profile=BULK_WRITE,
+        )
+
+        # Only the main insert decides whether a row was written
+        errors = {}
+        for (_, _, positions, main), (success, outcome) in zip(units, outcomes):
+            if success:
+                continue
+            for pos in positions:
+                if main:
+                    errors[pos] = outcome
+                else:
+                    result.index_errors.append((pos, outcome))
+        for pos, row in rows.items():
+            result.add(pos, str(row.entity_id), errors.get(pos))
+        if on_written is not None:
+            on_written([row for pos, row in rows.items() if pos not in errors])
+
+        offset += len(chunk)
+
+    result.results.sort(key=lambda r: r[0])
+    result.elapsed = time.perf_counter() - started
+    BULK_METRICS.record(result.succeeded, result.failed, result.elapsed)
+    logger.info(f"Bulk write finished: {result.summary()}")
+    return result
+
+
+def _plan(repository, rows, group_by_partition, batch_size):
+    """Turn BulkRows into ``(statement, params, positions, is_main)`` work units."""
+    units = []
+
+    if group_by_partition:
+        by_partition = defaultdict(list)
+        for pos, row in rows.items():
+            by_partition[row.partition_key].append(pos)
+        for positions in by_partition.values():
+            for i in range(0, len(positions), batch_size):
+                group = positions[i : i + batch_size]
+                batch = BatchStatement(batch_type=BatchType.UNLOGGED)
+                for pos in group:
+                    query, params = rows[pos].main
+                    batch.add(repository._prepare(query, BULK_WRITE), params)
+                units.append((batch, None, group, True))
+    else:
+        for pos, row in rows.items():
+            query, params = row.main
+            units.append((repository._prepare(query, BULK_WRITE), params, [pos], True))
+
+    for pos, row in rows.items():
+        for query, params in row.extras:
+            units.append(
+                (repository._prepare(query, BULK_WRITE), params, [pos], False)
+            )
+    return units
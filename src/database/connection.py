@@ -1,10 +1,31 @@
 """ScyllaDB connection module for hospital project"""
-import os
+import inspect
 import socket
+import threading
 import time
-from cassandra.cluster import Cluster, ExecutionProfile, EXEC_PROFILE_DEFAULT
-from cassandra.policies import DCAwareRoundRobinPolicy
+from collections import namedtuple
+from cassandra.cluster import Cluster, ExecutionProfile
+from cassandra.policies import DCAwareRoundRobinPolicy, RetryPolicy, TokenAwarePolicy
 from cassandra import ConsistencyLevel
+from src.config.settings import AppConfig, DatabaseConfig
+from src.database.frames import COLUMNAR_PROFILE, COLUMNAR_ROW_FACTORY
+from src.database.instrumentation import instrument_request
+from src.database.policies import (
+    BulkWriteRetryPolicy,
+    speculative_policy,
+    track_speculation,
+)
+from src.database.profiles import (
+    BULK_WRITE,
+    INTERACTIVE_PROFILES,
+    OLTP_READ,
+    PROFILE_SPECS,
+)
+from src.database.row_factory import model_row_factory
+from src.database.statement_cache import get_statement_cache
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
 
 # Force IPv4 only (helps with Docker networking)
 original_getaddrinfo = socket.getaddrinfo
@@ -17,14 +38,82 @@ def getaddrinfo_ipv4_only(host, port, family=0, type=0, proto=0, flags=0):
 socket.getaddrinfo = getaddrinfo_ipv4_only
 
 
+def routing_policy(token_aware: bool = True):
+    """
+    Build the load-balancing policy for one execution profile.
+
+    Prepared statements carry their routing key, so TokenAwarePolicy sends
+    them straight to a replica of the partition (shuffling among replicas),
+    restricted to the local DC. Each profile needs its own instance.
+    """
+    local = DCAwareRoundRobinPolicy(local_dc=DatabaseConfig.SCYLLA_LOCAL_DC)
+    if not token_aware:
+        return local
+    return TokenAwarePolicy(local, shuffle_replicas=True)
+
+
+def build_execution_profiles() -> dict:
+    """
+    Build one ExecutionProfile per entry of ``PROFILE_SPECS``.
+
+    Returns:
+        dict: profile name → ExecutionProfile, ready for ``Cluster``
+    """
+    profiles = {}
+    for name, spec in PROFILE_SPECS.items():
+        profiles[name] = ExecutionProfile(
+            load_balancing_policy=routing_policy(spec.token_aware),
+            retry_policy=(
+                BulkWriteRetryPolicy() if name == BULK_WRITE else RetryPolicy()
+            ),
+            request_timeout=spec.timeout,
+            consistency_level=spec.consistency,
+            # Columnar profile: plain tuple rows for DataFrame building
+            row_factory=(
+                COLUMNAR_ROW_FACTORY if name == COLUMNAR_PROFILE else model_row_factory
+            ),
+            speculative_execution_policy=(
+                speculative_policy() if name == OLTP_READ else None
+            ),
+        )
+    return profiles
+
+
+def apply_consistency(profiles: dict, levels: dict):
+    """Set consistency levels of the interactive profiles from ``{profile: level}``."""
+    for name, level in levels.items():
+        if name in INTERACTIVE_PROFILES:
+            profiles[name].consistency_level = level
+
+
+def shard_aware_options() -> dict:
+    """
+    Cluster keyword arguments for Scylla's shard-aware routing.
+
+    Only the scylla-driver build of ``cassandra`` knows about shards; with
+    the stock cassandra-driver this returns nothing and routing stays
+    token-aware per node.
+    """
+    parameters = inspect.signature(Cluster.__init__).parameters
+    if "shard_aware_options" not in parameters:
+        return {}
+    return {
+        "shard_aware_options": {
+            "disable": not DatabaseConfig.SCYLLA_SHARD_AWARE,
+            # Connections to the shard-aware port (19042) pick their shard
+            "disable_shardaware_port": not DatabaseConfig.SCYLLA_SHARD_AWARE,
+        }
+    }
+
+
 class ScyllaDBConnection:
     """Manages ScyllaDB connection for the hospital application"""
 
     def __init__(self):
         self.cluster = None
         self.session = None
-        self.host = os.getenv("SCYLLA_HOST", "new-scylla-node")
-        self.port = int(os.getenv("SCYLLA_PORT", "9042"))
+        self.hosts = DatabaseConfig.SCYLLA_HOSTS
+        self.port = DatabaseConfig.SCYLLA_PORT
 
     def connect(self, max_retries=5, retry_delay=5):
         """
@@ -37,36 +126,42 @@ class ScyllaDBConnection:
         Returns:
             session: Cassandra session object
         """
-        print(f"Connecting to ScyllaDB at {self.host}:{self.port}...")
+        logger.info(f"Connecting to ScyllaDB at {', '.join(self.hosts)}:{self.port}...")
 
-        profile = ExecutionProfile(
-            load_balancing_policy=DCAwareRoundRobinPolicy(local_dc="datacenter1"),
-            request_timeout=30,
-            consistency_level=ConsistencyLevel.ONE,
-        )
+        profiles = build_execution_profiles()
 
         for attempt in range(max_retries):
             try:
                 self.cluster = Cluster(
-                    contact_points=[self.host],
+                    contact_points=self.hosts,
                     port=self.port,
                     protocol_version=4,
-                    execution_profiles={EXEC_PROFILE_DEFAULT: profile},
+                    execution_profiles=profiles,
                     connect_timeout=15,
+                    **shard_aware_options(),
                 )
 
                 self.session = self.cluster.connect()
+                self.session.add_request_init_listener(track_speculation)
+                self.session.add_request_init_listener(instrument_request)
 
-                # Verify connection
-                row = self.session.execute(
-                    "SELECT release_version FROM system.local"
-                ).one()
-                print(f"✓ Connected to ScyllaDB version: {row.release_version}")
+                # The control connection already read system.local/peers
+                versions = {
+                    getattr(host, "release_version", None)
+                    for host in self.cluster.metadata.all_hosts()
+                }
+                versions.discard(None)
+                logger.info(
+                    "✓ Connected to ScyllaDB version: "
+                    f"{', '.join(sorted(versions)) or 'unknown'}"
+                )
 
                 return self.session
 
             except Exception as e:
-                print(f"Connection attempt {attempt + 1}/{max_retries} failed: {e}")
+                logger.warning(
+                    f"Connection attempt {attempt + 1}/{max_retries} failed: {e}"
+                )
 
                 if self.cluster:
                     try:
@@ -75,7 +170,7 @@ class ScyllaDBConnection:
                         pass
 
                 if attempt < max_retries - 1:
-                    print(f"Retrying in {retry_delay} seconds...")
+                    logger.info(f"Retrying in {retry_delay} seconds...")
                     time.sleep(retry_delay)
                 else:
                     raise Exception(
@@ -86,7 +181,7 @@ class ScyllaDBConnection:
         """Close the database connection"""
         if self.cluster:
             self.cluster.shutdown()
-            print("✓ Database connection closed")
+            logger.info("✓ Database connection closed")
 
     def __enter__(self):
         """Context manager entry"""
@@ -98,6 +193,227 @@ class ScyllaDBConnection:
         self.close()
 
 
+Repositories = namedtuple(
+    "Repositories", ["hospitals", "departments", "patients", "staff", "stats"]
+)
+
+
+class ConnectionRegistry:
+    """Process-wide holder of one shared session and one set of repositories.
+
+    Streamlit runs each browser session on its own thread, so the first
+    caller builds the cluster under a lock and everyone else reuses it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._db = None
+        self._session = None
+        self._repositories = None
+        # Consistency chosen on the Settings page; survives reconnects
+        self._consistency = {}
+        self._metrics_server = None
+
+    def get_session(self):
+        """Return the shared session, connecting and migrating on first use."""
+        if self._session is not None:
+            return self._session
+
+        with self._lock:
+            if self._session is None:
+                from src.database.migrations import migrate
+
+                db = ScyllaDBConnection()
+                session = db.connect()
+                try:
+                    if self._consistency:
+                        apply_consistency(
+                            db.cluster.profile_manager.profiles, self._consistency
+                        )
+                    migrate(session)
+                except Exception:
+                    # Nobody else holds this cluster; the next caller retries
+                    db.close()
+                    raise
+                self._db = db
+                self._session = session
+                if AppConfig.METRICS_PORT and self._metrics_server is None:
+                    self._start_metrics_server()
+        return self._session
+
+    def _start_metrics_server(self):
+        """Start the metrics endpoint; a failure must not cost the session."""
+        from src.database.metrics_server import start_metrics_server
+
+        try:
+            self._metrics_server = start_metrics_server(AppConfig.METRICS_PORT, self)
+        except Exception as e:
+            logger.error(f"Metrics endpoint failed to start: {e}")
+
+    def get_repositories(self) -> Repositories:
+        """Return the shared repositories, all bound to the shared session."""
+        if self._repositories is not None:
+            return self._repositories
+
+        session = self.get_session()
+        with self._lock:
+            if self._repositories is None:
+                from src.database.repositories.cached_repositories import (
+                    CachedDepartmentRepository,
+                    CachedHospitalRepository,
+                )
+                from src.database.repositories.patient_repository import (
+                    PatientRepository,
+                )
+                from src.database.repositories.staff_repository import (
+                    StaffRepository,
+                )
+                from src.database.repositories.stats_repository import (
+                    StatsRepository,
+                )
+
+                # One counters repository shared by every writer
+                stats = StatsRepository(session=session)
+                self._repositories = Repositories(
+                    hospitals=CachedHospitalRepository(session=session),
+                    departments=CachedDepartmentRepository(
+                        session=session, stats=stats
+                    ),
+                    patients=PatientRepository(session=session, stats=stats),
+                    staff=StaffRepository(session=session, stats=stats),
+                    stats=stats,
+                )
+        return self._repositories
+
+    def consistency(self, profile: str = OLTP_READ) -> str:
+        """Name of the consistency level an interactive profile currently uses."""
+        level = self._consistency.get(profile, PROFILE_SPECS[profile].consistency)
+        return ConsistencyLevel.value_to_name[level]
+
+    def set_consistency(self, level_name: str, profile: str = OLTP_READ):
+        """
+        Switch one interactive profile to another consistency level at runtime.
+
+        Args:
+            level_name: e.g. ``"ONE"`` or ``"LOCAL_QUORUM"``
+            profile:    OLTP_READ or OLTP_WRITE
+        """
+        if profile not in INTERACTIVE_PROFILES:
+            raise ValueError(f"Consistency of '{profile}' cannot be changed")
+        level = ConsistencyLevel.name_to_value[level_name]
+        with self._lock:
+            self._consistency[profile] = level
+            if self._db is not None and self._db.cluster is not None:
+                apply_consistency(
+                    self._db.cluster.profile_manager.profiles, {profile: level}
+                )
+
+    def cache_stats(self) -> dict:
+        """Hit/miss counters of the reference caches and the statement cache."""
+        stats = {}
+        repositories = self._repositories
+        if repositories is not None:
+            stats["hospitals"] = repositories.hospitals.cache.stats()
+            stats["departments"] = repositories.departments.cache.stats()
+        session = self._session
+        if session is not None:
+            stats["statements"] = get_statement_cache(session).stats()
+        return stats
+
+    def speculation_stats(self) -> dict:
+        """Speculative executions of the read profile, empty if not tracked."""
+        db = self._db
+        if db is None or db.cluster is None:
+            return {}
+        policy = db.cluster.profile_manager.profiles[
+            OLTP_READ
+        ].speculative_execution_policy
+        stats = getattr(policy, "stats", None)
+        if stats is None:
+            return {}
+        return dict(stats.snapshot(), delay_ms=round(policy.delay * 1000, 2))
+
+    def pool_stats(self) -> dict:
+        """
+        Summarize the connection pools of the shared session.
+
+        Returns:
+            dict: totals plus a per-host breakdown, empty if not connected
+        """
+        session = self._session
+        if session is None:
+            return {}
+
+        per_host = {}
+        open_total = 0
+        in_flight_total = 0
+        for host, state in session.get_pool_state().items():
+            in_flights = state.get("in_flights", [])
+            in_flight = sum(in_flights) if isinstance(in_flights, list) else in_flights
+            open_count = state.get("open_count", 0)
+            per_host[str(host.endpoint)] = {
+                "open_connections": open_count,
+                "in_flight": in_flight,
+                "shutdown": state.get("shutdown", False),
+            }
+            open_total += open_count
+            in_flight_total += in_flight
+
+        return {
+            "hosts": len(per_host),
+            "open_connections": open_total,
+            "in_flight": in_flight_total,
+            "per_host": per_host,
+        }
+
+    def close(self):
+        """Shut down the shared cluster; the next caller reconnects."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+            self._db = None
+            self._session = None
+            self._repositories = None
+
+
+_registry = ConnectionRegistry()
+
+
+def get_shared_session():
+    """Return the process-wide ScyllaDB session."""
+    return _registry.get_session()
+
+
+def get_repositories() -> Repositories:
+    """Return the process-wide repositories bound to the shared session."""
+    return _registry.get_repositories()
+
+
+def get_pool_stats() -> dict:
+    """Return connection pool statistics for the shared session."""
+    return _registry.pool_stats()
+
+
+def get_speculation_stats() -> dict:
+    """Return speculative execution counters for the shared session."""
+    return _registry.speculation_stats()
+
+
+def get_consistency(profile: str = OLTP_READ) -> str:
+    """Return the consistency level name of an interactive profile."""
+    return _registry.consistency(profile)
+
+
+def set_consistency(level_name: str, profile: str = OLTP_READ):
+    """Change the consistency level of an interactive profile."""
+    _registry.set_consistency(level_name, profile)
+
+
+def close_shared_connection():
+    """Close the process-wide ScyllaDB connection."""
+    _registry.close()
+
+
 # Convenience function for backward compatibility
 def get_scylla_connection(max_retries=5, retry_delay=5):
     """
@@ -113,9 +429,9 @@ def get_scylla_connection(max_retries=5, retry_delay=5):
 
 if __name__ == "__main__":
     # Test the connection
-    print("=" * 60)
-    print("Testing ScyllaDB Connection")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("Testing ScyllaDB Connection")
+    logger.info("=" * 60)
 
     try:
         with ScyllaDBConnection() as session:
@@ -126,12 +442,12 @@ if __name__ == "__main__":
                 WITH replication = {'class': 'SimpleStrategy', 'replication_factor': 1}
             """
             )
-            print("✓ Test keyspace created")
+            logger.info("✓ Test keyspace created")
 
-            print("✓ Connection test successful!")
+            logger.info("✓ Connection test successful!")
 
     except Exception as e:
-        print(f"✗ Connection test failed: {e}")
+        logger.error(f"✗ Connection test failed: {e}")
         import traceback
 
         traceback.print_exc()
@@ -0,0 +1,99 @@
+"""Columnar result frames for analytics and table building.
+
+Queries run on the ``columnar`` execution profile, whose row factory
+returns plain tuples. Each page of tuples is transposed into per-column
+lists, and pandas receives whole columns instead of being turned into
+models and then dicts row by row. pandas is imported lazily so the CLI
+and repositories work without it.
+"""
+from itertools import islice
+
+from cassandra.query import tuple_factory
+
+COLUMNAR_PROFILE = "columnar"
+COLUMNAR_ROW_FACTORY = tuple_factory
+
+# Low-cardinality id columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ("department_id", "hospital_id")
+
+AGE_BINS = (0, 18, 30, 45, 60, 75, 150)
+
+# Rows transposed at a time; matches the driver's default fetch size
+PAGE_ROWS = 5000
+
+
+def _pandas():
+    import pandas as pd
+
+    return pd
+
+
+def to_columns(rows, width: int) -> list:
+    """Transpose tuple rows into ``width`` column lists, a page at a time."""
+    arrays = [[] for _ in range(width)]
+    rows = iter(rows)
+    while True:
+        page = list(islice(rows, PAGE_ROWS))
+        if not page:
+            return arrays
+        for array, values in zip(arrays, zip(*page)):
+            array.extend(values)
+
+
+def to_frame(rows, columns, categorical=CATEGORICAL_COLUMNS):
+    """
+    Build a DataFrame from tuple rows.
+
+    Args:
+        rows:        Iterable of tuples (a result set or scan on the
+                     columnar profile)
+        columns:     Column names, in the order of the tuple values
+        categorical: Columns built with the ``category`` dtype
+
+    Returns:
+        pandas.DataFrame
+    """
+    pd = _pandas()
+    columns = list(columns)
+    data = {}
+    for column, values in zip(columns, to_columns(rows, len(columns))):
+        data[column] = pd.Categorical(values) if column in categorical else values
+    return pd.DataFrame(data, columns=columns)
+
+
+def group_counts(frame, column: str, labels: dict = None):
+    """
+    Count rows per value of ``column``.
+
+    Args:
+        frame:  DataFrame from ``to_frame``
+        column: Column to group by
+        labels: Optional mapping from value to display label (e.g. id → name)
+
+    Returns:
+        pandas.Series: counts indexed by value (or label), largest first
+    """
+    counts = frame[column].value_counts()
+    if labels:
+        counts.index = counts.index.map(lambda v: labels.get(v, str(v)[:8] + "…"))
+        counts = counts.groupby(level=0).sum().sort_values(ascending=False)
+    return counts
+
+
+def age_histogram(frame, bins=AGE_BINS, column: str = "age"):
+    """Count rows per age band, e.g. ``"18-29"``, in band order."""
+    pd = _pandas()
+    labels = [f"{lo}-{hi - 1}" for lo, hi in zip(bins[:-2], bins[1:-1])]
+    labels.append(f"{bins[-2]}+")
+    bands = pd.cut(frame[column], bins=list(bins), labels=labels, right=False)
+    return bands.value_counts(sort=False)
+
+
+def full_names(frame):
+    """Return ``"first last"`` for every row."""
+    return frame["first_name"].str.cat(frame["last_name"], sep=" ")
+
+
+def short_ids(series, length: int = 8):
+    """Shorten UUIDs for display, e.g. ``"1b4e28ba…"``."""
+    return series.astype(str).str[:length] + "…"
@@ -0,0 +1,243 @@
+"""Futures returned by the async repository methods."""
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+
+from cassandra import InvalidRequest
+
+
+class _AwaitableFuture(ABC):
+    """Adds ``await`` support on top of an ``add_callbacks`` implementation."""
+
+    @abstractmethod
+    def result(self):
+        """Block until the value is available and return it."""
+
+    @abstractmethod
+    def add_callbacks(self, callback, errback):
+        """Call ``callback(value)`` on success or ``errback(exc)`` on failure."""
+
+    def __await__(self):
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+
+        def on_result(value):
+            loop.call_soon_threadsafe(_resolve, waiter, value, None)
+
+        def on_error(exc):
+            loop.call_soon_threadsafe(_resolve, waiter, None, exc)
+
+        self.add_callbacks(on_result, on_error)
+        return waiter.__await__()
+
+
+class RepositoryFuture(_AwaitableFuture):
+    """Wraps a driver ``ResponseFuture`` and maps its rows to models.
+
+    The query is already in flight when the future is created, so firing
+    many of them before calling ``result()`` overlaps their round-trips.
+    The future can be used synchronously (``result()``) or awaited from
+    asyncio code.
+    """
+
+    def __init__(self, response_future, transform):
+        self._future = response_future
+        self._transform = transform
+
+    def result(self):
+        """Block until the query finishes and return the mapped result."""
+        return self._transform(self._future.result())
+
+    def add_callbacks(self, callback, errback):
+        """Call ``callback(mapped_result)`` or ``errback(exc)`` on completion."""
+        rows = []
+
+        def on_page(page):
+            rows.extend(page)
+            if self._future.has_more_pages:
+                self._future.start_fetching_next_page()
+                return
+            try:
+                mapped = self._transform(rows)
+            except Exception as exc:
+                errback(exc)
+                return
+            callback(mapped)
+
+        self._future.add_callbacks(on_page, errback)
+
+
+class CombinedFuture(_AwaitableFuture):
+    """Several in-flight futures whose results are merged by ``combine``."""
+
+    def __init__(self, futures, combine):
+        self._futures = list(futures)
+        self._combine = combine
+
+    def result(self):
+        """Block until every query finishes and return the combined result."""
+        return self._combine(*(future.result() for future in self._futures))
+
+    def add_callbacks(self, callback, errback):
+        """Call ``callback(combined)`` once all futures finished, else errback."""
+        results = [None] * len(self._futures)
+        remaining = [len(self._futures)]
+        failed = []
+        lock = threading.Lock()
+
+        def on_done(index, value=None, exc=None):
+            with lock:
+                if failed:
+                    return
+                if exc is not None:
+                    failed.append(exc)
+                else:
+                    results[index] = value
+                    remaining[0] -= 1
+                    if remaining[0]:
+                        return
+            if exc is not None:
+                errback(exc)
+                return
+            try:
+                combined = self._combine(*results)
+            except Exception as e:
+                errback(e)
+                return
+            callback(combined)
+
+        for index, future in enumerate(self._futures):
+            future.add_callbacks(
+                lambda value, i=index: on_done(i, value),
+                lambda exc, i=index: on_done(i, exc=exc),
+            )
+
+
+class FallbackFuture(_AwaitableFuture):
+    """A future that starts ``fallback()`` only if ``first`` yields None."""
+
+    def __init__(self, first, fallback):
+        self._first = first
+        self._fallback = fallback
+
+    def result(self):
+        value = self._first.result()
+        return value if value is not None else self._fallback().result()
+
+    def add_callbacks(self, callback, errback):
+        def on_first(value):
+            if value is not None:
+                callback(value)
+                return
+            try:
+                fallback = self._fallback()
+            except Exception as exc:
+                errback(exc)
+                return
+            fallback.add_callbacks(callback, errback)
+
+        self._first.add_callbacks(on_first, errback)
+
+
+class ReprepareFuture:
+    """A driver future that re-prepares and retries once on ``InvalidRequest``.
+
+    ``start(reprepare)`` sends the request and returns the driver future;
+    with ``reprepare=True`` it first replaces the cached prepared statement,
+    e.g. after a schema change invalidated it on the server. Everything
+    else (paging, ``query``) is delegated to the current driver future.
+    """
+
+    def __init__(self, start):
+        self._start = start
+        self._future = start(False)
+        self._retried = False
+        self._lock = threading.Lock()
+
+    def _retry(self, failed):
+        """Swap in a re-prepared request once; return the current future."""
+        with self._lock:
+            if self._future is failed and not self._retried:
+                self._retried = True
+                self._future = self._start(True)
+            return self._future
+
+    def result(self):
+        future = self._future
+        try:
+            return future.result()
+        except InvalidRequest:
+            retry = self._retry(future)
+            if retry is future:
+                raise
+            return retry.result()
+
+    def add_callbacks(self, callback, errback):
+        future = self._future
+        delivered = []
+
+        def on_page(page):
+            delivered.append(True)
+            callback(page)
+
+        def on_error(exc):
+            # A failure after the first page can't be retried without
+            # handing the same rows to ``callback`` twice
+            if isinstance(exc, InvalidRequest) and not delivered:
+                retry = self._retry(future)
+                if retry is not future:
+                    retry.add_callbacks(callback, errback)
+                    return
+            errback(exc)
+
+        future.add_callbacks(on_page, on_error)
+
+    def __getattr__(self, name):
+        return getattr(self._future, name)
+
+
+class CompletedFuture(_AwaitableFuture):
+    """A future whose result is already known, e.g. served from a cache."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def result(self):
+        return self._value
+
+    def add_callbacks(self, callback, errback):
+        callback(self._value)
+
+
+def _resolve(waiter, value, exc):
+    if waiter.done():
+        return
+    if exc is not None:
+        waiter.set_exception(exc)
+    else:
+        waiter.set_result(value)
+
+
+def gather(futures) -> list:
+    """Wait for several in-flight futures and return their results in order."""
+    return [future.result() for future in futures]
+
+
+def first_row(transform):
+    """Build a transform that maps the first row (or None) of a result."""
+
+    def _transform(rows):
+        for row in rows:
+            return transform(row)
+        return None
+
+    return _transform
+
+
+def all_rows(transform):
+    """Build a transform that maps every row of a result."""
+
+    def _transform(rows):
+        return [transform(row) for row in rows]
+
+    return _transform
@@ -0,0 +1,114 @@
+"""Bulk loader for the Hospital → Department → Patient/Staff tree."""
+from collections import defaultdict
+from typing import List
+
+from src.database.buckets import bucket_count
+from src.database.futures import gather
+from src.models.hospital import Hospital
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Partition reads in flight at once while loading members per department
+MAX_IN_FLIGHT = 64
+# Above this many departments the per-partition fan-out costs more
+# round-trips than two full-table scans, so load() scans by default
+SCAN_THRESHOLD = 100
+
+
+class HierarchyLoader:
+    """Builds the whole object tree in a fixed number of round-trip waves.
+
+    1. one read of all hospitals
+    2. every hospital's department partition, concurrently
+    3. every department's patient and staff partitions, in waves of at
+       most MAX_IN_FLIGHT requests (or two parallel token-range scans,
+       the default above SCAN_THRESHOLD departments)
+
+    The results fill the in-memory ``Hospital.departments``,
+    ``Department.patients`` and ``Department.staff_members`` lists.
+    """
+
+    def __init__(self, hosp_repo, dept_repo, patient_repo, staff_repo):
+        self.hosp_repo = hosp_repo
+        self.dept_repo = dept_repo
+        self.patient_repo = patient_repo
+        self.staff_repo = staff_repo
+
+    def load(
+        self, include_members: bool = True, use_scans: bool = None
+    ) -> List[Hospital]:
+        """
+        Load every hospital with its departments (and their members).
+
+        Args:
+            include_members: Also load patients and staff of every department
+            use_scans:       Read members with full-table token-range scans
+                             instead of one read per department partition;
+                             None decides by SCAN_THRESHOLD
+
+        Returns:
+            List[Hospital]: hospitals with their in-memory lists populated
+        """
+        hospitals = self.hosp_repo.get_all()
+        if not hospitals:
+            return []
+
+        dept_lists = gather(
+            [self.dept_repo.find_by_hospital_async(h.hospital_id) for h in hospitals]
+        )
+        departments = []
+        for hospital, depts in zip(hospitals, dept_lists):
+            for dept in depts:
+                hospital.add_department(dept)
+            departments.extend(depts)
+
+        if include_members and departments:
+            if use_scans is None:
+                use_scans = len(departments) > SCAN_THRESHOLD
+            if use_scans:
+                self._attach_members_by_scan(departments)
+            else:
+                self._attach_members_by_partition(departments)
+
+        logger.debug(
+            f"Loaded {len(hospitals)} hospitals and {len(departments)} departments"
+        )
+        return hospitals
+
+    def _attach_members_by_partition(self, departments):
+        # Each department reads every bucket of both member tables
+        per_department = 2 * bucket_count()
+        wave = max(1, MAX_IN_FLIGHT // per_department)
+        for start in range(0, len(departments), wave):
+            depts = departments[start : start + wave]
+            patient_futures = [
+                self.patient_repo.find_by_department_async(d.department_id)
+                for d in depts
+            ]
+            staff_futures = [
+                self.staff_repo.find_by_department_async(d.department_id)
+                for d in depts
+            ]
+            for dept, patients, staff in zip(
+                depts, gather(patient_futures), gather(staff_futures)
+            ):
+                for patient in patients:
+                    dept.add_patient(patient)
+                for member in staff:
+                    dept.add_staff(member)
+
+    def _attach_members_by_scan(self, departments):
+        by_id = {d.department_id: d for d in departments}
+        patients = defaultdict(list)
+        staff = defaultdict(list)
+        for patient in self.patient_repo.scan():
+            patients[patient.department_id].append(patient)
+        for member in self.staff_repo.scan():
+            staff[member.department_id].append(member)
+
+        for department_id, dept in by_id.items():
+            for patient in patients.get(department_id, []):
+                dept.add_patient(patient)
+            for member in staff.get(department_id, []):
+                dept.add_staff(member)
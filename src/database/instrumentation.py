@@ -0,0 +1,283 @@
+"""Per-statement query metrics, a slow-query log and app-level counters.
+
+``instrument_request`` is registered as a request-init listener on the
+session, so every request (repository calls, scans, bulk writes and
+migrations alike) is measured without touching the call sites. For each
+statement it records a latency histogram, returned rows, retries, errors
+and the encoded request size; requests slower than ``SLOW_QUERY_MS`` are
+logged with the statement, the shape of its parameters (types only, never
+values) and the coordinator that answered.
+
+The driver does not expose response sizes, so only request bytes are kept.
+Streamlit rerun durations and bulk-job throughput are recorded here too,
+for the metrics endpoint (see metrics_server.py).
+"""
+import re
+import threading
+import time
+from bisect import bisect_left
+
+from cassandra.query import BatchStatement, BoundStatement
+from src.config.settings import AppConfig
+from src.utils.logger import setup_logger
+
+slow_logger = setup_logger("src.database.slow_queries")
+
+# Histogram bucket upper bounds in seconds (Prometheus-style, +Inf implied)
+LATENCY_BUCKETS = (
+    0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class LatencyHistogram:
+    """Cumulative-bucket latency histogram with percentile estimates."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """Estimate the ``q``-th percentile (0-100), interpolating in its bucket."""
+        if not self.count:
+            return 0.0
+        rank = self.count * q / 100
+        seen = 0
+        for i, in_bucket in enumerate(self.counts):
+            if in_bucket and seen + in_bucket >= rank:
+                if i == len(self.buckets):
+                    return self.max
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = min(self.buckets[i], self.max)
+                return lower + (upper - lower) * (rank - seen) / in_bucket
+            seen += in_bucket
+        return self.max
+
+    def cumulative(self):
+        """Yield ``(upper_bound, cumulative_count)`` pairs, ending with +Inf."""
+        running = 0
+        for bound, in_bucket in zip(self.buckets + (float("inf"),), self.counts):
+            running += in_bucket
+            yield bound, running
+
+
+class StatementStats:
+    """Counters for one statement text."""
+
+    __slots__ = ("latency", "rows", "retries", "errors", "request_bytes")
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.rows = 0
+        self.retries = 0
+        self.errors = 0
+        self.request_bytes = 0
+
+
+class QueryMetrics:
+    """Thread-safe per-statement metrics, keyed by normalized CQL text."""
+
+    def __init__(self, slow_query_seconds: float):
+        self.slow_query_seconds = slow_query_seconds
+        self._stats = {}
+        self._lock = threading.Lock()
+        self.slow_queries = 0
+
+    def observe(
+        self, statement: str, seconds: float, rows: int = 0, retries: int = 0,
+        error: bool = False, request_bytes: int = 0,
+    ):
+        with self._lock:
+            stats = self._stats.get(statement)
+            if stats is None:
+                stats = self._stats[statement] = StatementStats()
+            stats.latency.observe(seconds)
+            stats.rows += rows
+            stats.retries += retries
+            stats.errors += int(error)
+            stats.request_bytes += request_bytes
+
+    def add_rows(self, statement: str, rows: int):
+        """Count rows of a later page (its latency is not measured)."""
+        with self._lock:
+            stats = self._stats.get(statement)
+            if stats is not None:
+                stats.rows += rows
+
+    def record_slow(self):
+        with self._lock:
+            self.slow_queries += 1
+
+    def items(self):
+        """Return ``(statement, StatementStats)`` pairs; callers must not mutate."""
+        with self._lock:
+            return list(self._stats.items())
+
+    def snapshot(self) -> list:
+        """
+        Summarize every statement, slowest p99 first.
+
+        Returns:
+            list[dict]: statement, calls, p50/p95/p99/max in ms, rows,
+                        retries, errors, request bytes
+        """
+        summary = []
+        for statement, stats in self.items():
+            latency = stats.latency
+            summary.append(
+                {
+                    "statement": statement,
+                    "calls": latency.count,
+                    "p50_ms": round(latency.percentile(50) * 1000, 2),
+                    "p95_ms": round(latency.percentile(95) * 1000, 2),
+                    "p99_ms": round(latency.percentile(99) * 1000, 2),
+                    "max_ms": round(latency.max * 1000, 2),
+                    "rows": stats.rows,
+                    "retries": stats.retries,
+                    "errors": stats.errors,
+                    "request_bytes": stats.request_bytes,
+                }
+            )
+        summary.sort(key=lambda s: s["p99_ms"], reverse=True)
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self.slow_queries = 0
+
+
+QUERY_METRICS = QueryMetrics(AppConfig.SLOW_QUERY_MS / 1000)
+
+
+def statement_text(query) -> str:
+    """Normalized CQL of a request, used as its metrics key."""
+    if isinstance(query, BatchStatement):
+        return f"BATCH ({len(query)} statements)"
+    if isinstance(query, BoundStatement):
+        text = query.prepared_statement.query_string
+    else:
+        text = getattr(query, "query_string", str(query))
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def parameter_shape(query) -> str:
+    """Describe bound parameters by count and CQL type, e.g. ``2: uuid, int``."""
+    if not isinstance(query, BoundStatement):
+        return "-"
+    types = [c.type.typename for c in query.prepared_statement.column_metadata or ()]
+    return f"{len(types)}: {', '.join(types)}" if types else "0"
+
+
+def instrument_request(future, metrics: QueryMetrics = QUERY_METRICS):
+    """
+    Request-init listener measuring one request.
+
+    Register with ``session.add_request_init_listener(instrument_request)``.
+    """
+    statement = statement_text(future.query)
+    started = time.perf_counter()
+    pages = []
+
+    def finish(rows=None, error=None):
+        count = len(rows) if isinstance(rows, list) else 0
+        # Callbacks run again for every later page: only count its rows
+        if pages:
+            metrics.add_rows(statement, count)
+            return
+        pages.append(True)
+        seconds = time.perf_counter() - started
+        metrics.observe(
+            statement,
+            seconds,
+            rows=count,
+            # Driver-internal counter; without it retries read as zero
+            retries=getattr(future, "_query_retries", 0),
+            error=error is not None,
+            request_bytes=getattr(future, "request_encoded_size", None) or 0,
+        )
+        if seconds >= metrics.slow_query_seconds:
+            metrics.record_slow()
+            slow_logger.warning(
+                f"Slow query ({seconds * 1000:.1f} ms, {count} rows, "
+                f"coordinator {getattr(future, 'coordinator_host', None)}, "
+                f"params {parameter_shape(future.query)}"
+                f"{', failed: ' + type(error).__name__ if error else ''}): "
+                f"{statement}"
+            )
+
+    future.add_callbacks(finish, lambda error: finish(error=error))
+
+
+def get_query_metrics() -> QueryMetrics:
+    """Return the process-wide query metrics."""
+    return QUERY_METRICS
+
+
+class RerunMetrics:
+    """Streamlit script rerun durations, one histogram per page."""
+
+    def __init__(self):
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def observe(self, page: str, seconds: float):
+        with self._lock:
+            histogram = self._pages.get(page)
+            if histogram is None:
+                histogram = self._pages[page] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    def items(self):
+        with self._lock:
+            return list(self._pages.items())
+
+
+class BulkMetrics:
+    """Totals of bulk jobs (bulk_write and the bucket copy job)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.jobs = 0
+        self.rows_written = 0
+        self.rows_failed = 0
+        self.seconds = 0.0
+        self.last_rows_per_second = 0.0
+
+    def record(self, written: int, failed: int, seconds: float):
+        with self._lock:
+            self.jobs += 1
+            self.rows_written += written
+            self.rows_failed += failed
+            self.seconds += seconds
+            self.last_rows_per_second = written / seconds if seconds else 0.0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "jobs": self.jobs,
+                "rows_written": self.rows_written,
+                "rows_failed": self.rows_failed,
+                "seconds": self.seconds,
+                "last_rows_per_second": self.last_rows_per_second,
+            }
+
+
+RERUN_METRICS = RerunMetrics()
+BULK_METRICS = BulkMetrics()
+
+
+def observe_rerun(page: str, seconds: float):
+    """Record how long one Streamlit rerun of ``page`` took."""
+    RERUN_METRICS.observe(page, seconds)
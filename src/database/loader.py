@@ -0,0 +1,59 @@
+"""Request-scoped batch loader for id lookups (DataLoader style)."""
+from typing import Dict, Iterable
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class BatchLoader:
+    """Deduplicates and memoizes id lookups for the lifetime of one render.
+
+    Create one per render (or request), call ``load_many`` with every id the
+    render will need so the unseen ones are fetched in a single concurrent
+    wave, then read them back with ``load`` as often as needed.
+
+    Example::
+
+        departments = BatchLoader(dept_repo.find_by_id_async)
+        departments.load_many(p.department_id for p in patients)
+        name = departments.load(patients[0].department_id).name
+    """
+
+    def __init__(self, fetch_async):
+        """
+        Args:
+            fetch_async: Callable ``id -> future`` whose ``result()`` gives the
+                         entity or None (e.g. a repository's find_by_id_async)
+        """
+        self._fetch_async = fetch_async
+        self._memo = {}
+        self.fetched = 0
+
+    def load_many(self, ids: Iterable) -> Dict:
+        """Fetch every id not seen yet in one wave; return ``{id: entity}``."""
+        ids = [i for i in ids if i is not None]
+        pending = {}
+        for entity_id in ids:
+            key = str(entity_id)
+            if key not in self._memo and key not in pending:
+                pending[key] = self._fetch_async(entity_id)
+
+        for key, future in pending.items():
+            try:
+                self._memo[key] = future.result()
+            except Exception as e:
+                logger.warning(f"Batch lookup of {key} failed: {e}")
+                self._memo[key] = None
+        self.fetched += len(pending)
+
+        return {entity_id: self._memo[str(entity_id)] for entity_id in ids}
+
+    def load(self, entity_id):
+        """Return one entity (or None), fetching it only if not loaded yet."""
+        if entity_id is None:
+            return None
+        key = str(entity_id)
+        if key not in self._memo:
+            self.load_many([entity_id])
+        return self._memo[key]
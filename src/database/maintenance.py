@@ -0,0 +1,77 @@
+"""Post-deploy data maintenance for databases that already hold rows.
+
+Schema migrations only create tables; rows written by older versions still
+have to be copied into the bucketed tables, the lookup, index and feed
+tables filled for them, and the dashboard counters recomputed. Run once
+after every upgrade:
+
+    python -m src.database.maintenance                # every step
+    python -m src.database.maintenance lookups        # just the backfills
+
+Every step is idempotent (plain upserts and counter deltas), and the
+bucket copy resumes from its checkpoints, so an interrupted run can simply
+be started again.
+"""
+import argparse
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+BUCKETS = "buckets"
+LOOKUPS = "lookups"
+COUNTERS = "counters"
+
+# In dependency order: lookups are rebuilt from the bucketed tables and the
+# counters are recounted from them
+STEPS = (BUCKETS, LOOKUPS, COUNTERS)
+
+
+def run(repositories, steps=STEPS) -> dict:
+    """
+    Run the selected maintenance steps in order.
+
+    Args:
+        repositories: Repositories from ``get_repositories()``
+        steps:        Subset of STEPS
+
+    Returns:
+        dict: summary per step
+    """
+    summary = {}
+    if BUCKETS in steps:
+        summary["patients_to_bucketed"] = repositories.patients.migrate_to_buckets()
+        summary["staff_to_bucketed"] = repositories.staff.migrate_to_buckets()
+    if LOOKUPS in steps:
+        summary["department_lookups"] = repositories.departments.rebuild_lookups()
+        summary["patient_lookups"] = repositories.patients.rebuild_lookups()
+        summary["staff_lookups"] = repositories.staff.rebuild_lookups()
+    if COUNTERS in steps:
+        summary["counters"] = repositories.stats.reconcile()
+    logger.info(f"Maintenance finished: {summary}")
+    return summary
+
+
+def main(argv=None):
+    from src.database.connection import close_shared_connection, get_repositories
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.database.maintenance",
+        description="Bring rows written by older versions up to date.",
+    )
+    parser.add_argument(
+        "steps", nargs="*", metavar="step",
+        help=f"steps to run, in order: {', '.join(STEPS)} (default: all)",
+    )
+    steps = parser.parse_args(argv).steps or STEPS
+    unknown = set(steps) - set(STEPS)
+    if unknown:
+        parser.error(f"unknown step(s): {', '.join(sorted(unknown))}")
+    try:
+        run(get_repositories(), steps)
+    finally:
+        close_shared_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Prometheus text-format metrics endpoint for the app process.
+
+Enabled by setting ``METRICS_PORT``; the shared connection registry starts
+it on a daemon thread the first time it connects. ``GET /metrics`` returns
+query latency histograms, connection pool state, cache hit ratios,
+speculative executions, Streamlit rerun durations and bulk-job throughput.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.database.instrumentation import (
+    BULK_METRICS,
+    QUERY_METRICS,
+    RERUN_METRICS,
+)
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _bound(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(value)
+
+
+class _Writer:
+    """Collects metric families in exposition order."""
+
+    def __init__(self):
+        self.lines = []
+
+    def family(self, name: str, kind: str, help_text: str):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value, **labels):
+        self.lines.append(f"{name}{_labels(**labels)} {value}")
+
+    def histogram(self, name: str, histogram, **labels):
+        for bound, count in histogram.cumulative():
+            self.sample(f"{name}_bucket", count, **labels, le=_bound(bound))
+        self.sample(f"{name}_sum", histogram.sum, **labels)
+        self.sample(f"{name}_count", histogram.count, **labels)
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_metrics(registry) -> str:
+    """
+    Render every metric in Prometheus text format.
+
+    Args:
+        registry: ConnectionRegistry supplying pool, cache and speculation state
+
+    Returns:
+        str: the exposition body
+    """
+    out = _Writer()
+
+    # Queries
+    statements = QUERY_METRICS.items()
+    out.family(
+        "hospital_query_duration_seconds", "histogram",
+        "Latency of CQL requests until their first page, per statement.",
+    )
+    for statement, stats in statements:
+        out.histogram(
+            "hospital_query_duration_seconds", stats.latency, statement=statement
+        )
+    for name, attr, help_text in (
+        ("hospital_query_rows_total", "rows", "Rows returned, per statement."),
+        ("hospital_query_retries_total", "retries", "Driver retries, per statement."),
+        ("hospital_query_errors_total", "errors", "Failed requests, per statement."),
+        (
+            "hospital_query_request_bytes_total", "request_bytes",
+            "Encoded request bytes, per statement.",
+        ),
+    ):
+        out.family(name, "counter", help_text)
+        for statement, stats in statements:
+            out.sample(name, getattr(stats, attr), statement=statement)
+    out.family(
+        "hospital_slow_queries_total", "counter",
+        "Requests slower than SLOW_QUERY_MS.",
+    )
+    out.sample("hospital_slow_queries_total", QUERY_METRICS.slow_queries)
+
+    # Connection pools
+    pool = registry.pool_stats()
+    out.family(
+        "hospital_pool_in_flight_requests", "gauge",
+        "Requests in flight per host.",
+    )
+    for host, state in pool.get("per_host", {}).items():
+        out.sample("hospital_pool_in_flight_requests", state["in_flight"], host=host)
+    out.family(
+        "hospital_pool_open_connections", "gauge", "Open connections per host."
+    )
+    for host, state in pool.get("per_host", {}).items():
+        out.sample(
+            "hospital_pool_open_connections", state["open_connections"], host=host
+        )
+
+    # Caches
+    caches = registry.cache_stats()
+    out.family("hospital_cache_hits_total", "counter", "Cache hits per cache.")
+    for cache, stats in caches.items():
+        out.sample("hospital_cache_hits_total", stats["hits"], cache=cache)
+    out.family("hospital_cache_misses_total", "counter", "Cache misses per cache.")
+    for cache, stats in caches.items():
+        out.sample("hospital_cache_misses_total", stats["misses"], cache=cache)
+    out.family("hospital_cache_hit_ratio", "gauge", "Hit ratio per cache.")
+    for cache, stats in caches.items():
+        out.sample("hospital_cache_hit_ratio", stats["hit_ratio"], cache=cache)
+
+    # Speculative executions
+    speculation = registry.speculation_stats()
+    if speculation:
+        out.family(
+            "hospital_speculative_executions_total", "counter",
+            "Speculative read attempts, by outcome.",
+        )
+        out.sample(
+            "hospital_speculative_executions_total",
+            speculation["fired"], outcome="fired",
+        )
+        out.sample(
+            "hospital_speculative_executions_total",
+            speculation["won"], outcome="won",
+        )
+
+    # Streamlit reruns
+    out.family(
+        "hospital_streamlit_rerun_duration_seconds", "histogram",
+        "Duration of Streamlit script reruns, per page.",
+    )
+    for page, histogram in RERUN_METRICS.items():
+        out.histogram(
+            "hospital_streamlit_rerun_duration_seconds", histogram, page=page
+        )
+
+    # Bulk jobs
+    bulk = BULK_METRICS.snapshot()
+    out.family("hospital_bulk_jobs_total", "counter", "Finished bulk jobs.")
+    out.sample("hospital_bulk_jobs_total", bulk["jobs"])
+    out.family("hospital_bulk_rows_total", "counter", "Rows handled by bulk jobs.")
+    out.sample("hospital_bulk_rows_total", bulk["rows_written"], status="written")
+    out.sample("hospital_bulk_rows_total", bulk["rows_failed"], status="failed")
+    out.family(
+        "hospital_bulk_duration_seconds_total", "counter",
+        "Time spent in bulk jobs.",
+    )
+    out.sample("hospital_bulk_duration_seconds_total", bulk["seconds"])
+    out.family(
+        "hospital_bulk_last_rows_per_second", "gauge",
+        "Throughput of the most recent bulk job.",
+    )
+    out.sample("hospital_bulk_last_rows_per_second", bulk["last_rows_per_second"])
+
+    return out.text()
+
+
+def start_metrics_server(port: int, registry):
+    """
+    Serve ``/metrics`` on ``port`` from a daemon thread.
+
+    Returns:
+        ThreadingHTTPServer, or None if the port could not be bound (e.g. a
+        second process on the same host)
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            try:
+                body = render_metrics(registry).encode("utf-8")
+            except Exception as e:
+                logger.error(f"Rendering metrics failed: {e}")
+                self.send_error(500)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes every few seconds would flood the app log
+            pass
+
+    try:
+        server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    except OSError as e:
+        logger.warning(f"Metrics endpoint not started on port {port}: {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="metrics-server", daemon=True
+    ).start()
+    logger.info(f"Serving Prometheus metrics on :{port}/metrics")
+    return server
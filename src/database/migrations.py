@@ -0,0 +1,385 @@
+"""Versioned schema migrations for the hospital keyspace.
+
+The schema is described as an ordered list of migrations. The version
+already applied is stored in ``hospital.schema_version``; on startup a
+single read of that table decides which migrations (if any) still have to
+run, so a warm start costs one query instead of a round of DDL.
+
+Every statement is idempotent (``IF NOT EXISTS``), so two processes
+migrating at the same time, or a keyspace created before versioning
+existed, end up in the same state.
+"""
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from cassandra import InvalidRequest
+from src.database.statement_cache import get_statement_cache
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+KEYSPACE = "hospital"
+SCOPE = "hospital"
+
+Migration = namedtuple("Migration", ["version", "description", "statements"])
+
+_BOOTSTRAP = (
+    f"""
+    CREATE KEYSPACE IF NOT EXISTS {KEYSPACE}
+    WITH replication = {{
+        'class': 'SimpleStrategy',
+        'replication_factor': 1
+    }}
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {KEYSPACE}.schema_version (
+        scope           text,
+        version         int,
+        description     text,
+        applied_at      timestamp,
+        PRIMARY KEY (scope, version)
+    ) WITH CLUSTERING ORDER BY (version DESC)
+    """,
+)
+
+MIGRATIONS = [
+    # ---------------------------------------------------------- #
+    # 1. Core tables matching the UML class diagram
+    #   departments  – partition key = hospital_id  ("contains")
+    #   patients     – partition key = department_id ("manages")
+    #   staff        – partition key = department_id ("employs")
+    #   patients.medical_record is legacy: notes live in patient_records
+    # ---------------------------------------------------------- #
+    Migration(
+        1,
+        "hospitals, departments, patients, staff",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS hospitals (
+                hospital_id UUID PRIMARY KEY,
+                name        text,
+                location    text,
+                phone       text,
+                created_at  timestamp
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS departments (
+                hospital_id     UUID,
+                department_id   UUID,
+                name            text,
+                description     text,
+                head_doctor_id  int,
+                created_at      timestamp,
+                PRIMARY KEY (hospital_id, department_id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS patients (
+                department_id   UUID,
+                patient_id      UUID,
+                first_name      text,
+                last_name       text,
+                date_of_birth   date,
+                age             int,
+                phone           text,
+                medical_record  text,
+                created_at      timestamp,
+                PRIMARY KEY (department_id, patient_id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS staff (
+                department_id   UUID,
+                staff_id        UUID,
+                first_name      text,
+                last_name       text,
+                name            text,
+                age             int,
+                position        text,
+                created_at      timestamp,
+                PRIMARY KEY (department_id, staff_id)
+            )
+            """,
+        ),
+    ),
+    # ---------------------------------------------------------- #
+    # 2. *_by_id – full copies of the main rows, one partition per
+    #    entity, so find_by_id without a partition key is a
+    #    single-partition read (no ALLOW FILTERING)
+    # ---------------------------------------------------------- #
+    Migration(
+        2,
+        "id lookup tables",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS departments_by_id (
+                department_id   UUID PRIMARY KEY,
+                hospital_id     UUID,
+                name            text,
+                description     text,
+                head_doctor_id  int,
+                created_at      timestamp
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS patients_by_id (
+                patient_id      UUID PRIMARY KEY,
+                department_id   UUID,
+                first_name      text,
+                last_name       text,
+                date_of_birth   date,
+                age             int,
+                phone           text,
+                medical_record  text,
+                created_at      timestamp
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS staff_by_id (
+                staff_id        UUID PRIMARY KEY,
+                department_id   UUID,
+                first_name      text,
+                last_name       text,
+                name            text,
+                age             int,
+                position        text,
+                created_at      timestamp
+            )
+            """,
+        ),
+    ),
+    # ---------------------------------------------------------- #
+    # 3. Search indexes
+    #   patients_by_phone – partition key = digits-only phone
+    #   *_by_name         – token = "f:<first prefix>" / "l:<last prefix>"
+    # ---------------------------------------------------------- #
+    Migration(
+        3,
+        "phone and name search indexes",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS patients_by_phone (
+                phone           text,
+                patient_id      UUID,
+                department_id   UUID,
+                PRIMARY KEY (phone, patient_id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS patients_by_name (
+                token           text,
+                patient_id      UUID,
+                department_id   UUID,
+                first_name      text,
+                last_name       text,
+                PRIMARY KEY (token, patient_id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS staff_by_name (
+                token           text,
+                staff_id        UUID,
+                department_id   UUID,
+                first_name      text,
+                last_name       text,
+                PRIMARY KEY (token, staff_id)
+            )
+            """,
+        ),
+    ),
+    # ---------------------------------------------------------- #
+    # 4. Dashboard counters
+    # ---------------------------------------------------------- #
+    Migration(
+        4,
+        "department and hospital counters",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS department_stats (
+                department_id   UUID PRIMARY KEY,
+                patient_count   counter,
+                staff_count     counter
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS hospital_stats (
+                hospital_id       UUID PRIMARY KEY,
+                department_count  counter
+            )
+            """,
+        ),
+    ),
+    # ---------------------------------------------------------- #
+    # 5. Recent feeds – day = UTC date of created_at, newest first
+    # ---------------------------------------------------------- #
+    Migration(
+        5,
+        "recent patient and staff feeds",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS patients_by_created_day (
+                day             date,
+                created_at      timestamp,
+                patient_id      UUID,
+                department_id   UUID,
+                first_name      text,
+                last_name       text,
+                date_of_birth   date,
+                age             int,
+                phone           text,
+                PRIMARY KEY (day, created_at, patient_id)
+            ) WITH CLUSTERING ORDER BY (created_at DESC, patient_id ASC)
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS staff_by_created_day (
+                day             date,
+                created_at      timestamp,
+                staff_id        UUID,
+                department_id   UUID,
+                first_name      text,
+                last_name       text,
+                name            text,
+                age             int,
+                position        text,
+                PRIMARY KEY (day, created_at, staff_id)
+            ) WITH CLUSTERING ORDER BY (created_at DESC, staff_id ASC)
+            """,
+        ),
+    ),
+    # ---------------------------------------------------------- #
+    # 6. patient_records – bulky medical notes, read on demand only
+    # ---------------------------------------------------------- #
+    Migration(
+        6,
+        "patient_records",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS patient_records (
+                patient_id      UUID PRIMARY KEY,
+                medical_record  text,
+                updated_at      timestamp
+            )
+            """,
+        ),
+    ),
+    # ---------------------------------------------------------- #
+    # 7. Bucketed patients/staff – partition key = (department_id,
+    #    bucket), bucket = id.int % PARTITION_BUCKETS, plus the
+    #    checkpoints of the resumable copy job
+    # ---------------------------------------------------------- #
+    Migration(
+        7,
+        "bucketed patients and staff, migration checkpoints",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS patients_bucketed (
+                department_id   UUID,
+                bucket          int,
+                patient_id      UUID,
+                first_name      text,
+                last_name       text,
+                date_of_birth   date,
+                age             int,
+                phone           text,
+                created_at      timestamp,
+                PRIMARY KEY ((department_id, bucket), patient_id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS staff_bucketed (
+                department_id   UUID,
+                bucket          int,
+                staff_id        UUID,
+                first_name      text,
+                last_name       text,
+                name            text,
+                age             int,
+                position        text,
+                created_at      timestamp,
+                PRIMARY KEY ((department_id, bucket), staff_id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS migration_checkpoints (
+                job             text,
+                range_start     bigint,
+                range_end       bigint,
+                rows            bigint,
+                finished_at     timestamp,
+                PRIMARY KEY (job, range_start)
+            )
+            """,
+        ),
+    ),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def current_version(session) -> int:
+    """
+    Read the applied schema version.
+
+    Returns:
+        int: the newest applied version, 0 if the keyspace or the
+             schema_version table does not exist yet
+    """
+    try:
+        row = session.execute(
+            f"SELECT version FROM {KEYSPACE}.schema_version "
+            "WHERE scope = %s LIMIT 1",
+            [SCOPE],
+        ).one()
+    except InvalidRequest:
+        return 0
+    return row.version if row else 0
+
+
+def migrate(session, target: int = LATEST_VERSION) -> int:
+    """
+    Bring the schema up to ``target`` and switch the session to the keyspace.
+
+    Args:
+        session: Active Cassandra session
+        target:  Version to migrate to (default: the latest)
+
+    Returns:
+        int: number of migrations applied (0 on a warm start)
+    """
+    version = current_version(session)
+    pending = [m for m in MIGRATIONS if version < m.version <= target]
+
+    if not pending:
+        session.set_keyspace(KEYSPACE)
+        logger.debug(f"Schema is current (version {version})")
+        return 0
+
+    if version == 0:
+        logger.debug("Creating keyspace and schema_version table...")
+        for statement in _BOOTSTRAP:
+            session.execute(statement)
+    session.set_keyspace(KEYSPACE)
+
+    for migration in pending:
+        logger.info(
+            f"Applying schema migration {migration.version}: "
+            f"{migration.description}"
+        )
+        for statement in migration.statements:
+            session.execute(statement)
+        session.execute(
+            "INSERT INTO schema_version (scope, version, description, applied_at) "
+            "VALUES (%s, %s, %s, %s)",
+            [
+                SCOPE,
+                migration.version,
+                migration.description,
+                datetime.now(timezone.utc),
+            ],
+        )
+
+    # Prepared statements may carry result metadata from the old schema
+    get_statement_cache(session).invalidate()
+    logger.info(f"Schema migrated from version {version} to {pending[-1].version}")
+    return len(pending)
@@ -0,0 +1,141 @@
+"""Prefix name index shared by the patient and staff repositories.
+
+Each indexed person gets one row per normalized name prefix in a
+``<table>`` keyed on ``"<field>:<prefix>"`` tokens, e.g. ``"f:ahm"`` for a
+first name starting with "Ahm". A prefix or case-insensitive search is then
+one partition read per name field instead of an ALLOW FILTERING scan.
+"""
+from src.utils.normalization import matches_name_prefix, name_prefixes, normalize_name
+
+# Longer search terms read the partition of their first MAX_PREFIX_LENGTH
+# characters and are narrowed down in Python.
+MAX_PREFIX_LENGTH = 12
+# One-letter prefixes would put a large share of all people in a handful of
+# partitions; shorter terms only narrow down the other name's results.
+MIN_PREFIX_LENGTH = 2
+# Matches handed back to callers
+MAX_MATCHES = 100
+
+FIRST_NAME = "f"
+LAST_NAME = "l"
+
+
+class NameIndex:
+    """Maintains and queries one ``*_by_name`` table for a repository."""
+
+    def __init__(self, repository, table: str, id_column: str):
+        self.repository = repository
+        self.table = table
+        self.id_column = id_column
+
+    def insert_statements(self, entity_id, department_id, first_name, last_name):
+        """Statements that index a person under every prefix of their names."""
+        query = f"""
+        INSERT INTO {self.table} (
+            token, {self.id_column}, department_id, first_name, last_name
+        ) VALUES (?, ?, ?, ?, ?)
+        """
+        return [
+            (query, [token, entity_id, department_id, first_name, last_name])
+            for token in self._tokens(first_name, last_name)
+        ]
+
+    def delete_statements(self, entity_id, first_name, last_name):
+        """Statements that remove a person from every prefix partition."""
+        query = f"DELETE FROM {self.table} WHERE token = ? AND {self.id_column} = ?"
+        return [
+            (query, [token, entity_id])
+            for token in self._tokens(first_name, last_name)
+        ]
+
+    def update_statements(
+        self, entity_id, department_id, old_names, new_names
+    ):
+        """
+        Statements that move a person from ``old_names`` to ``new_names``.
+
+        Statements of one batch share a timestamp and a delete wins a tie, so
+        deleting and re-inserting a token in the same batch would drop it.
+        Only tokens the new names no longer have are deleted; the rest are
+        upserted, which also refreshes the stored names.
+
+        Args:
+            old_names: (first_name, last_name) currently indexed
+            new_names: (first_name, last_name) after the update
+        """
+        removed, _ = token_diff(self._tokens(*old_names), self._tokens(*new_names))
+        delete = f"DELETE FROM {self.table} WHERE token = ? AND {self.id_column} = ?"
+        return [
+            (delete, [token, entity_id]) for token in sorted(removed)
+        ] + self.insert_statements(entity_id, department_id, *new_names)
+
+    def search(
+        self, first_name: str = None, last_name: str = None, limit: int = MAX_MATCHES
+    ) -> dict:
+        """
+        Find people whose names start with the given terms (case-insensitive).
+
+        Index rows carry both names, so the partition of the longest term is
+        paged through and every term is checked on each row until ``limit``
+        matches are found. Terms shorter than MIN_PREFIX_LENGTH are never
+        looked up on their own.
+
+        Args:
+            first_name: First-name prefix (optional)
+            last_name:  Last-name prefix (optional)
+            limit:      Maximum number of matches returned
+
+        Returns:
+            dict: {entity_id: department_id} matching every given term
+        """
+        terms = [
+            (FIRST_NAME, "first_name", normalize_name(first_name)),
+            (LAST_NAME, "last_name", normalize_name(last_name)),
+        ]
+        terms = [(field, column, term) for field, column, term in terms if term]
+        searchable = [t for t in terms if len(t[2]) >= MIN_PREFIX_LENGTH]
+        if not searchable:
+            return {}
+
+        field, _, term = max(searchable, key=lambda t: len(t[2]))
+        query = f"""
+        SELECT {self.id_column}, department_id, first_name, last_name
+        FROM {self.table} WHERE token = ?
+        """
+        # The driver fetches further pages only while we keep iterating
+        rows = self.repository._execute(
+            query, [f"{field}:{term[:MAX_PREFIX_LENGTH]}"]
+        )
+
+        matches = {}
+        for row in rows:
+            if all(matches_name_prefix(getattr(row, c), t) for _, c, t in terms):
+                matches[getattr(row, self.id_column)] = row.department_id
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    @staticmethod
+    def _tokens(first_name, last_name) -> set:
+        tokens = {
+            f"{FIRST_NAME}:{p}"
+            for p in name_prefixes(first_name, MAX_PREFIX_LENGTH, MIN_PREFIX_LENGTH)
+        }
+        tokens.update(
+            f"{LAST_NAME}:{p}"
+            for p in name_prefixes(last_name, MAX_PREFIX_LENGTH, MIN_PREFIX_LENGTH)
+        )
+        return tokens
+
+
+def token_diff(old: set, new: set) -> tuple:
+    """Return ``(removed, added)`` index tokens between two token sets."""
+    return old - new, new - old
+
+
+def is_searchable(first_name: str = None, last_name: str = None) -> bool:
+    """True if at least one term is long enough to be looked up."""
+    return any(
+        len(normalize_name(term)) >= MIN_PREFIX_LENGTH
+        for term in (first_name, last_name)
+    )
@@ -0,0 +1,47 @@
+"""Cursor-based pagination on top of the driver's paging state."""
+import base64
+import binascii
+
+from src.config.settings import AppConfig
+
+
+class Page:
+    """One page of models plus an opaque cursor for the next page."""
+
+    def __init__(self, items: list, cursor: str = None):
+        self.items = items
+        self.cursor = cursor  # None on the last page
+
+    @property
+    def has_more(self) -> bool:
+        return self.cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def clamp_page_size(page_size: int = None) -> int:
+    """Fall back to DEFAULT_PAGE_SIZE and never exceed MAX_PAGE_SIZE."""
+    if not page_size or page_size < 1:
+        return AppConfig.DEFAULT_PAGE_SIZE
+    return min(page_size, AppConfig.MAX_PAGE_SIZE)
+
+
+def encode_cursor(paging_state: bytes) -> str:
+    """Turn the driver's paging state into a URL-safe string (None at the end)."""
+    if not paging_state:
+        return None
+    return base64.urlsafe_b64encode(paging_state).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> bytes:
+    """Turn a cursor back into the driver's paging state."""
+    if not cursor:
+        return None
+    try:
+        return base64.urlsafe_b64decode(cursor.encode("ascii"))
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
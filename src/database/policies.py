@@ -0,0 +1,212 @@
+"""Driver policies tuned for this application's workloads."""
+import threading
+import time
+from collections import deque
+
+from cassandra.policies import (
+    RetryPolicy,
+    SpeculativeExecutionPlan,
+    SpeculativeExecutionPolicy,
+    WriteType,
+)
+from src.config.settings import DatabaseConfig
+
+
+class BulkWriteRetryPolicy(RetryPolicy):
+    """Retries timed-out writes of bulk jobs on the same consistency.
+
+    Bulk rows are plain upserts, so writing them twice is harmless; counter
+    updates are never retried since they are not idempotent.
+    """
+
+    RETRYABLE_WRITES = (
+        WriteType.SIMPLE,
+        WriteType.BATCH,
+        WriteType.UNLOGGED_BATCH,
+        WriteType.BATCH_LOG,
+    )
+
+    def __init__(self, max_retries: int = 2):
+        self.max_retries = max_retries
+
+    def on_write_timeout(
+        self, query, consistency, write_type, required_responses,
+        received_responses, retry_num,
+    ):
+        if retry_num < self.max_retries and write_type in self.RETRYABLE_WRITES:
+            return self.RETRY, consistency
+        return self.RETHROW, None
+
+
+class SpeculationStats:
+    """Thread-safe counters of speculative executions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.fired = 0
+        self.won = 0
+
+    def record(self, fired: int, won: bool):
+        with self._lock:
+            self.requests += 1
+            self.fired += fired
+            self.won += int(won)
+
+    def snapshot(self) -> dict:
+        """Return the counters plus fire and win ratios."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "fired": self.fired,
+                "won": self.won,
+                "fire_ratio": self.fired / self.requests if self.requests else 0.0,
+                "win_ratio": self.won / self.fired if self.fired else 0.0,
+            }
+
+
+class TrackedSpeculativePlan(SpeculativeExecutionPlan):
+    """Per-request plan that reports back to its policy once the request ends.
+
+    The plan records which policy and statement it belongs to and, once the
+    request finished, how many speculative attempts were sent and whether
+    one of them answered first.
+    """
+
+    def __init__(self, policy, statement, delay: float, max_attempts: int):
+        self.policy = policy
+        self.statement = statement
+        self.delay = delay
+        self.remaining = max_attempts
+        self.finished = False
+        self.fired = 0
+        self.won = False
+
+    def next_execution(self, host):
+        if self.delay < 0 or self.remaining <= 0:
+            return -1
+        self.remaining -= 1
+        return self.delay
+
+
+class ConstantSpeculativePolicy(SpeculativeExecutionPolicy):
+    """Sends up to ``max_attempts`` extra attempts, ``delay`` seconds apart.
+
+    Same behaviour as the driver's ConstantSpeculativeExecutionPolicy, plus
+    ``stats``: how often a speculative attempt was sent and how often it
+    answered first. The driver only speculates on idempotent statements.
+    """
+
+    def __init__(self, delay: float, max_attempts: int = 1):
+        self.delay = delay
+        self.max_attempts = max_attempts
+        self.stats = SpeculationStats()
+
+    def current_delay(self) -> float:
+        return self.delay
+
+    def new_plan(self, keyspace, statement):
+        return TrackedSpeculativePlan(
+            self, statement, self.current_delay(), self.max_attempts
+        )
+
+    def on_complete(self, plan, future, latency: float):
+        """Record the outcome of one request (called once, on its first page)."""
+        hosts = future.attempted_hosts
+        # Every attempt beyond the first that was not a retry was speculative;
+        # the retry count is driver-internal, so its absence means no retries
+        retries = getattr(future, "_query_retries", 0)
+        plan.fired = max(0, len(hosts) - 1 - retries)
+        plan.won = bool(plan.fired and future.coordinator_host not in (None, hosts[0]))
+        self.stats.record(plan.fired, plan.won)
+
+
+class PercentileSpeculativePolicy(ConstantSpeculativePolicy):
+    """Speculates once a request is slower than the recent ``percentile``.
+
+    Latencies of the last ``window`` requests are kept; the delay is their
+    ``percentile`` (recomputed every ``refresh`` samples), never below
+    ``min_delay``. Until ``min_samples`` are known ``initial_delay`` is used.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 99.0,
+        initial_delay: float = 0.05,
+        min_delay: float = 0.005,
+        max_attempts: int = 1,
+        window: int = 1000,
+        min_samples: int = 100,
+        refresh: int = 50,
+    ):
+        super().__init__(initial_delay, max_attempts)
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.refresh = refresh
+        self._latencies = deque(maxlen=window)
+        self._since_refresh = 0
+        self._lock = threading.Lock()
+
+    def on_complete(self, plan, future, latency: float):
+        super().on_complete(plan, future, latency)
+        with self._lock:
+            self._latencies.append(latency)
+            self._since_refresh += 1
+            if (
+                len(self._latencies) >= self.min_samples
+                and self._since_refresh >= self.refresh
+            ):
+                self._since_refresh = 0
+                self.delay = max(self.min_delay, self._percentile())
+
+    def _percentile(self) -> float:
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return ordered[index]
+
+
+def speculative_policy():
+    """
+    Build the read-profile speculative policy configured in DatabaseConfig.
+
+    Returns:
+        ConstantSpeculativePolicy or None when speculation is off
+    """
+    mode = DatabaseConfig.SPECULATIVE_EXECUTION
+    delay = DatabaseConfig.SPECULATIVE_DELAY_MS / 1000
+    attempts = DatabaseConfig.SPECULATIVE_MAX_ATTEMPTS
+    if mode == "constant":
+        return ConstantSpeculativePolicy(delay, attempts)
+    if mode == "percentile":
+        return PercentileSpeculativePolicy(
+            percentile=DatabaseConfig.SPECULATIVE_PERCENTILE,
+            initial_delay=delay,
+            max_attempts=attempts,
+        )
+    return None
+
+
+def track_speculation(future):
+    """
+    Request-init listener feeding request outcomes back to their policy.
+
+    Register with ``session.add_request_init_listener(track_speculation)``.
+    """
+    # The driver keeps the plan on a private attribute of the future; only
+    # plans our policies made for this very statement are tracked
+    plan = getattr(future, "_spec_execution_plan", None)
+    if not isinstance(plan, TrackedSpeculativePlan):
+        return
+    if plan.statement is not getattr(future, "query", None):
+        return
+    started = time.perf_counter()
+
+    def finish(_):
+        # Callbacks fire again for later pages; only the first one counts
+        if plan.finished:
+            return
+        plan.finished = True
+        plan.policy.on_complete(plan, future, time.perf_counter() - started)
+
+    future.add_callbacks(finish, finish)
@@ -0,0 +1,55 @@
+"""Named execution profiles, one per workload shape.
+
+Interactive reads should fail fast, bulk jobs want long timeouts and
+retries, and scans want big pages. Repositories pick a profile per
+statement (see ``profile_for``); connection.py builds the driver
+ExecutionProfiles from ``PROFILE_SPECS``.
+"""
+from collections import namedtuple
+
+from cassandra import ConsistencyLevel
+from cassandra.cluster import EXEC_PROFILE_DEFAULT
+from src.database.frames import COLUMNAR_PROFILE
+
+OLTP_READ = "oltp_read"
+OLTP_WRITE = "oltp_write"
+BULK_WRITE = "bulk_write"
+SCAN = "scan"
+
+ProfileSpec = namedtuple(
+    "ProfileSpec", ["timeout", "consistency", "fetch_size", "token_aware"]
+)
+
+PROFILE_SPECS = {
+    # DDL, migrations and anything not routed to a workload profile
+    EXEC_PROFILE_DEFAULT: ProfileSpec(30.0, ConsistencyLevel.ONE, 5000, True),
+    # Point lookups and single-partition lists behind a page render;
+    # the only profile with speculative execution
+    OLTP_READ: ProfileSpec(2.0, ConsistencyLevel.LOCAL_ONE, 500, True),
+    # Single-entity inserts, updates, deletes and counter adjustments
+    OLTP_WRITE: ProfileSpec(5.0, ConsistencyLevel.LOCAL_QUORUM, None, True),
+    # bulk_write() and copy jobs: idempotent upserts, retried on timeout
+    BULK_WRITE: ProfileSpec(60.0, ConsistencyLevel.LOCAL_QUORUM, None, True),
+    # Token-range scans have no routing key, so token awareness is moot
+    SCAN: ProfileSpec(120.0, ConsistencyLevel.LOCAL_ONE, 5000, False),
+    COLUMNAR_PROFILE: ProfileSpec(120.0, ConsistencyLevel.LOCAL_ONE, 5000, False),
+}
+
+# Profiles whose consistency the Settings page may change at runtime
+INTERACTIVE_PROFILES = (OLTP_READ, OLTP_WRITE)
+
+
+def is_read(query: str) -> bool:
+    """True for SELECT statements, which are safe to send more than once."""
+    return query.lstrip()[:6].upper() == "SELECT"
+
+
+def profile_for(query: str) -> str:
+    """Default profile of a statement: SELECTs read, everything else writes."""
+    return OLTP_READ if is_read(query) else OLTP_WRITE
+
+
+def fetch_size_for(profile):
+    """Page size prepared statements of ``profile`` start with (None: driver default)."""
+    spec = PROFILE_SPECS.get(profile)
+    return spec.fetch_size if spec else None
@@ -0,0 +1,111 @@
+"""Time-bucketed "recently created" feeds.
+
+Each feed table is partitioned by UTC day and clustered by
+``created_at DESC``, so the newest rows are the head of today's
+partition and ``recent(limit)`` reads a few small day partitions, a
+week at a time, instead of the whole entity table.
+"""
+from datetime import date, datetime, timedelta, timezone
+
+from src.config.settings import AppConfig
+from src.database.frames import COLUMNAR_PROFILE, to_frame
+from src.database.futures import RepositoryFuture, all_rows, gather
+
+# Day partitions read concurrently per round-trip by recent()
+WAVE_DAYS = 7
+
+
+def day_bucket(created_at: datetime) -> date:
+    """Return the UTC day partition for a creation timestamp."""
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc)
+    return created_at.date()
+
+
+class RecentFeed:
+    """Writes to and reads from one ``<entity>_by_created_day`` table."""
+
+    def __init__(self, repository, table: str, id_column: str, columns):
+        """
+        Args:
+            repository: Repository whose session and statement cache are used
+            table:      Feed table (PK ((day), created_at, <id_column>))
+            id_column:  Entity id column, the last clustering column
+            columns:    Copied columns, in the order values are passed
+        """
+        self.repository = repository
+        self.table = table
+        self.id_column = id_column
+        self.columns = list(columns)
+
+    def insert_statement(self, values, created_at: datetime):
+        """Statement adding one row (``values`` ordered like ``columns``)."""
+        markers = ", ".join("?" for _ in range(len(self.columns) + 1))
+        query = (
+            f"INSERT INTO {self.table} (day, {', '.join(self.columns)}) "
+            f"VALUES ({markers})"
+        )
+        return query, [day_bucket(created_at)] + list(values)
+
+    def update_statement(
+        self, entity_id, created_at: datetime, set_clause, set_values
+    ):
+        """Statement applying an UPDATE's SET clause to the copied row."""
+        query = (
+            f"UPDATE {self.table} SET {set_clause} "
+            f"WHERE day = ? AND created_at = ? AND {self.id_column} = ?"
+        )
+        key = [day_bucket(created_at), created_at, entity_id]
+        return query, list(set_values) + key
+
+    def delete_statement(self, entity_id, created_at: datetime):
+        """Statement removing the copied row."""
+        query = (
+            f"DELETE FROM {self.table} "
+            f"WHERE day = ? AND created_at = ? AND {self.id_column} = ?"
+        )
+        return query, [day_bucket(created_at), created_at, entity_id]
+
+    def recent(self, limit: int, transform, lookback_days: int = None) -> list:
+        """
+        Return up to ``limit`` rows, newest first.
+
+        Reads WAVE_DAYS day partitions concurrently per wave, walking back
+        from today, and stops after the first wave that fills ``limit`` or
+        after ``lookback_days`` (AppConfig default).
+        """
+        query = f"SELECT * FROM {self.table} WHERE day = ? LIMIT ?"
+        return self._newest(query, limit, transform, lookback_days)
+
+    def frame(self, limit: int, columns, lookback_days: int = None):
+        """Return the newest ``limit`` rows of ``columns`` as a DataFrame."""
+        columns = list(columns)
+        query = f"SELECT {', '.join(columns)} FROM {self.table} WHERE day = ? LIMIT ?"
+        rows = self._newest(
+            query, limit, lambda row: row, lookback_days, COLUMNAR_PROFILE
+        )
+        return to_frame(rows, columns)
+
+    def _newest(self, query, limit, transform, lookback_days, profile=None) -> list:
+        lookback_days = lookback_days or AppConfig.RECENT_LOOKBACK_DAYS
+        today = datetime.now(timezone.utc).date()
+        mapped = all_rows(transform)
+
+        rows = []
+        for start in range(0, lookback_days, WAVE_DAYS):
+            if len(rows) >= limit:
+                break
+            wanted = limit - len(rows)
+            days = range(start, min(start + WAVE_DAYS, lookback_days))
+            futures = [
+                RepositoryFuture(
+                    self.repository._execute_async(
+                        query, [today - timedelta(days=offset), wanted], profile
+                    ),
+                    mapped,
+                )
+                for offset in days
+            ]
+            for day_rows in gather(futures):
+                rows.extend(day_rows)
+        return rows[:limit]
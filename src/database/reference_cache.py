@@ -0,0 +1,73 @@
+"""In-process TTL cache for rarely changing reference data."""
+import threading
+import time
+
+
+class TTLCache:
+    """Thread-safe read-through cache whose entries expire after ``ttl`` seconds.
+
+    ``invalidate`` bumps a generation counter, so a load that started
+    before the invalidation never stores its (possibly stale) result.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries = {}  # key -> (expires_at, value)
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key, loader):
+        """Return the cached value for ``key``, calling ``loader()`` on a miss.
+
+        Empty or None results are returned but not cached, so a failed or
+        empty read is retried on the next call.
+        """
+        found, value, generation = self.lookup(key)
+        if found:
+            return value
+        value = loader()
+        self.store(key, value, generation)
+        return value
+
+    def lookup(self, key) -> tuple:
+        """
+        Look ``key`` up without loading it.
+
+        Returns:
+            tuple: ``(found, value, generation)``; pass the generation on to
+                   ``store`` once the value has been loaded
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return True, entry[1], self._generation
+            self.misses += 1
+            return False, None, self._generation
+
+    def store(self, key, value, generation):
+        """Cache a value loaded after ``lookup``, unless invalidated meanwhile."""
+        if value and self.ttl > 0:
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
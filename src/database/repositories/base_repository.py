@@ -0,0 +1,227 @@
+from collections import Counter
+from uuid import UUID
+
+from cassandra import InvalidRequest
+from cassandra.query import BatchStatement, BatchType
+from src.database.buckets import all_buckets
+from src.database.bulk import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    BulkWriteResult,
+    bulk_write,
+)
+from src.database.connection import ScyllaDBConnection
+from src.database.frames import COLUMNAR_PROFILE, to_frame
+from src.database.futures import ReprepareFuture
+from src.database.profiles import OLTP_READ, OLTP_WRITE, SCAN, profile_for
+from src.database.scanner import TokenRangeScanner
+from src.database.pagination import Page, clamp_page_size, decode_cursor, encode_cursor
+from src.database.statement_cache import get_statement_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BaseRepository:
+    """Session handling and statement execution shared by all repositories."""
+
+    # adjust_department() keyword bumped per created row (e.g. "patients");
+    # repositories with create_many set it and provide _build_row and stats
+    STATS_COUNTER = None
+    # Columns frame() loads by default; set by repositories of bucketed
+    # department-partitioned tables (TABLE, PARTITION_KEY)
+    FRAME_COLUMNS = ()
+
+    def __init__(self, session=None):
+        self.db = ScyllaDBConnection() if session is None else None
+        self.session = session or self.db.connect()
+        # A shared session is already on the keyspace; USE is a round-trip
+        if self.session.keyspace != "hospital":
+            self.session.set_keyspace("hospital")
+        self.statements = get_statement_cache(self.session)
+
+    def create_many(
+        self,
+        records,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        group_by_partition: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> BulkWriteResult:
+        """
+        Insert many rows with bounded concurrency.
+
+        Args:
+            records:            Iterable of dicts with create()'s keyword arguments
+            concurrency:        Maximum requests in flight at once
+            group_by_partition: Batch rows of the same department together
+            batch_size:         Maximum rows per department batch
+
+        Returns:
+            BulkWriteResult: per-row entity id or error, failed index writes
+                             (index_errors) and throughput
+        """
+        return bulk_write(
+            self,
+            records,
+            lambda record: self._build_row(**record),
+            concurrency=concurrency,
+            group_by_partition=group_by_partition,
+            batch_size=batch_size,
+            on_written=self._count_written,
+        )
+
+    def _count_written(self, rows):
+        """Bump the department counters for a chunk of bulk-written rows."""
+        if self.STATS_COUNTER is None:
+            return
+        # partition_key is (department_id, bucket)
+        departments = Counter(r.partition_key[0] for r in rows)
+        for department_id, count in departments.items():
+            self.stats.adjust_department(
+                department_id, **{self.STATS_COUNTER: count}
+            )
+
+    def _prepare(self, query: str, profile=None):
+        """Return the cached prepared statement for ``query``."""
+        return self.statements.get(query, profile or profile_for(query))
+
+    def _execute(self, query: str, params=(), profile=None):
+        """
+        Execute a cached prepared statement, re-preparing it once if stale.
+
+        Without an explicit ``profile`` SELECTs run on ``oltp_read`` and
+        everything else on ``oltp_write``.
+        """
+        profile = profile or profile_for(query)
+        return self._with_reprepare(
+            lambda prepare: self.session.execute(
+                prepare(query, profile), params, execution_profile=profile
+            )
+        )
+
+    def _execute_async(self, query: str, params=(), profile=None):
+        """
+        Start a cached prepared statement and return its future.
+
+        The future re-prepares the statement and retries once if the server
+        rejects it, like ``_execute``.
+        """
+        profile = profile or profile_for(query)
+
+        def start(reprepare):
+            if reprepare:
+                logger.warning("Prepared statement rejected, re-preparing once")
+                prepared = self.statements.reprepare(query, profile)
+            else:
+                prepared = self._prepare(query, profile)
+            return self.session.execute_async(
+                prepared, params, execution_profile=profile
+            )
+
+        return ReprepareFuture(start)
+
+    def _with_reprepare(self, run):
+        """
+        Call ``run(prepare)``; if the server rejects a prepared statement,
+        re-prepare the statements it uses and call it once more.
+        """
+        try:
+            return run(self._prepare)
+        except InvalidRequest:
+            logger.warning("Prepared statement rejected, re-preparing once")
+            fresh = {}
+
+            def reprepare(query, profile):
+                if (query, profile) not in fresh:
+                    fresh[query, profile] = self.statements.reprepare(query, profile)
+                return fresh[query, profile]
+
+            return run(reprepare)
+
+    def _execute_page(
+        self,
+        query: str,
+        params,
+        transform,
+        page_size: int = None,
+        cursor: str = None,
+        profile=OLTP_READ,
+    ) -> Page:
+        """Fetch one page of ``query`` starting at ``cursor``."""
+
+        def run(prepare):
+            statement = prepare(query, profile).bind(params)
+            statement.fetch_size = clamp_page_size(page_size)
+            return self.session.execute(
+                statement,
+                execution_profile=profile,
+                paging_state=decode_cursor(cursor),
+            )
+
+        result = self._with_reprepare(run)
+        items = [transform(row) for row in result.current_rows]
+        return Page(items, encode_cursor(result.paging_state))
+
+    def _scan(self, table: str, partition_key, transform, **options):
+        """Stream a whole table through a parallel token-range scan."""
+        options.setdefault("profile", SCAN)
+        scanner = TokenRangeScanner(
+            self.session, table, partition_key, transform=transform, **options
+        )
+        return scanner.scan()
+
+    def _frame(self, query: str, params, columns):
+        """Run ``query`` on the columnar profile and return a DataFrame."""
+        return to_frame(self._execute(query, params, COLUMNAR_PROFILE), columns)
+
+    def _scan_frame(self, table: str, partition_key, columns, **options):
+        """Parallel token-range scan of ``columns`` into a DataFrame."""
+        rows = self._scan(
+            table, partition_key, None,
+            columns=", ".join(columns), profile=COLUMNAR_PROFILE, **options,
+        )
+        return to_frame(rows, columns)
+
+    def frame(self, department_id=None, columns=None, **scan_options):
+        """
+        Load the table as a pandas DataFrame (department_id is categorical).
+
+        Args:
+            department_id:  Read one department partition instead of the
+                            whole table (which uses a parallel scan)
+            columns:        Columns to select (default FRAME_COLUMNS)
+            **scan_options: TokenRangeScanner options for the full-table read
+        """
+        columns = columns or self.FRAME_COLUMNS
+        if department_id:
+            if isinstance(department_id, str):
+                department_id = UUID(department_id)
+            buckets = ", ".join(str(b) for b in all_buckets())
+            query = f"""
+            SELECT {', '.join(columns)} FROM {self.TABLE}
+            WHERE department_id = ? AND bucket IN ({buckets})
+            """
+            return self._frame(query, [department_id], columns)
+        return self._scan_frame(
+            self.TABLE, self.PARTITION_KEY, columns, **scan_options
+        )
+
+    def _execute_batch(
+        self, statements, batch_type=BatchType.LOGGED, profile=OLTP_WRITE
+    ):
+        """Execute several ``(query, params)`` pairs as a single batch."""
+        statements = list(statements)
+
+        def run(prepare):
+            batch = BatchStatement(batch_type=batch_type)
+            for query, params in statements:
+                batch.add(prepare(query, profile), params)
+            return self.session.execute(batch, execution_profile=profile)
+
+        return self._with_reprepare(run)
+
+    @staticmethod
+    def _set_clause(kwargs: dict):
+        """Build a stable SET clause so each column set maps to one statement."""
+        columns = sorted(kwargs)
+        return ", ".join(f"{c} = ?" for c in columns), [kwargs[c] for c in columns]
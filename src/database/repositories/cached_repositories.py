@@ -0,0 +1,141 @@
+from typing import List, Optional
+from src.config.settings import AppConfig
+from src.database.futures import CombinedFuture, CompletedFuture
+from src.database.reference_cache import TTLCache
+from src.database.repositories.department_repository import DepartmentRepository
+from src.database.repositories.hospital_repository import HospitalRepository
+from src.models.department import Department
+from src.models.hospital import Hospital
+
+
+def _fresh(model):
+    """Copy a cached model so callers can fill its in-memory lists safely."""
+    return type(model).from_row(model)
+
+
+def _cached_async(cache, key, start):
+    """
+    Serve ``key`` from ``cache`` as a completed future; on a miss call
+    ``start()`` for the in-flight read and cache its result when it lands.
+    """
+    found, value, generation = cache.lookup(key)
+    if found:
+        return CompletedFuture(_fresh(value))
+
+    def fill(value):
+        cache.store(key, value, generation)
+        return _fresh(value) if value else None
+
+    return CombinedFuture([start()], fill)
+
+
+class CachedHospitalRepository(HospitalRepository):
+    """HospitalRepository with a TTL read-through cache.
+
+    Every write through this repository clears the cache, so the process
+    that made the change sees it immediately; other processes see it once
+    their entries expire.
+    """
+
+    def __init__(self, session=None, ttl: float = None):
+        super().__init__(session)
+        self.cache = TTLCache(AppConfig.CACHE_TTL if ttl is None else ttl)
+
+    # ---------------------------------------------------------- #
+    # READ (cached)
+    # ---------------------------------------------------------- #
+    def get_all(self) -> List[Hospital]:
+        hospitals = self.cache.get_or_load("all", super().get_all)
+        return [_fresh(h) for h in hospitals or []]
+
+    def find_by_id_async(self, hospital_id):
+        # find_by_id and BatchLoader both come through here
+        load = super().find_by_id_async
+        return _cached_async(
+            self.cache, ("id", str(hospital_id)), lambda: load(hospital_id)
+        )
+
+    # ---------------------------------------------------------- #
+    # WRITE (invalidating)
+    # ---------------------------------------------------------- #
+    def create(self, *args, **kwargs):
+        try:
+            return super().create(*args, **kwargs)
+        finally:
+            self.cache.invalidate()
+
+    def update(self, *args, **kwargs):
+        try:
+            return super().update(*args, **kwargs)
+        finally:
+            self.cache.invalidate()
+
+    def delete(self, *args, **kwargs):
+        try:
+            return super().delete(*args, **kwargs)
+        finally:
+            self.cache.invalidate()
+
+
+class CachedDepartmentRepository(DepartmentRepository):
+    """DepartmentRepository with a TTL read-through cache.
+
+    Selectbox population (get_all / find_by_hospital) and name resolution
+    (find_by_id) are served from memory; writes clear the cache.
+    """
+
+    def __init__(self, session=None, ttl: float = None, stats=None):
+        super().__init__(session, stats)
+        self.cache = TTLCache(AppConfig.CACHE_TTL if ttl is None else ttl)
+
+    # ---------------------------------------------------------- #
+    # READ (cached)
+    # ---------------------------------------------------------- #
+    def get_all(self) -> List[Department]:
+        departments = self.cache.get_or_load("all", super().get_all)
+        return [_fresh(d) for d in departments or []]
+
+    def find_by_hospital(self, hospital_id) -> List[Department]:
+        load = super().find_by_hospital
+        departments = self.cache.get_or_load(
+            ("hospital", str(hospital_id)), lambda: load(hospital_id)
+        )
+        return [_fresh(d) for d in departments or []]
+
+    def find_by_id_async(self, department_id, hospital_id=None):
+        # A department id is unique, so the hospital scope is checked after
+        # the lookup instead of being part of the key
+        load = super().find_by_id_async
+        future = _cached_async(
+            self.cache, ("id", str(department_id)), lambda: load(department_id)
+        )
+        if not hospital_id:
+            return future
+
+        def in_hospital(department: Optional[Department]):
+            if department and str(department.hospital_id) != str(hospital_id):
+                return None
+            return department
+
+        return CombinedFuture([future], in_hospital)
+
+    # ---------------------------------------------------------- #
+    # WRITE (invalidating)
+    # ---------------------------------------------------------- #
+    def create(self, *args, **kwargs):
+        try:
+            return super().create(*args, **kwargs)
+        finally:
+            self.cache.invalidate()
+
+    def update(self, *args, **kwargs):
+        try:
+            return super().update(*args, **kwargs)
+        finally:
+            self.cache.invalidate()
+
+    def delete(self, *args, **kwargs):
+        try:
+            return super().delete(*args, **kwargs)
+        finally:
+            self.cache.invalidate()
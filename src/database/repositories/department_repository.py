@@ -1,22 +1,27 @@
 from uuid import UUID, uuid4
 from typing import List, Optional
-from src.database.connection import ScyllaDBConnection
+from datetime import datetime, timezone
+from src.database.bulk import DEFAULT_CONCURRENCY, BulkRow, bulk_write
+from src.database.futures import RepositoryFuture, all_rows, first_row
+from src.database.pagination import Page
+from src.database.profiles import SCAN
+from src.database.repositories.base_repository import BaseRepository
+from src.database.repositories.stats_repository import StatsRepository
 from src.models.department import Department
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class DepartmentRepository:
+class DepartmentRepository(BaseRepository):
     """Data access layer for Department operations.
 
     Departments are partitioned by hospital_id (FK → hospitals).
     """
 
-    def __init__(self, session=None):
-        self.db = ScyllaDBConnection() if session is None else None
-        self.session = session or self.db.connect()
-        self.session.set_keyspace("hospital")
+    def __init__(self, session=None, stats: StatsRepository = None):
+        super().__init__(session)
+        self.stats = stats or StatsRepository(session=self.session)
 
     # ---------------------------------------------------------- #
     # CREATE
@@ -33,17 +38,25 @@ class DepartmentRepository:
         if isinstance(hospital_id, str):
             hospital_id = UUID(hospital_id)
 
+        created_at = datetime.now(timezone.utc)
+
+        # Same row goes to the hospital partition and the id lookup table
         query = """
-        INSERT INTO departments (
+        INSERT INTO {table} (
             hospital_id, department_id, name, description, head_doctor_id, created_at
-        ) VALUES (?, ?, ?, ?, ?, toTimestamp(now()))
+        ) VALUES (?, ?, ?, ?, ?, ?)
         """
+        values = [
+            hospital_id, department_id, name, description, head_doctor_id, created_at
+        ]
         try:
-            prepared = self.session.prepare(query)
-            self.session.execute(
-                prepared,
-                [hospital_id, department_id, name, description, head_doctor_id],
+            self._execute_batch(
+                [
+                    (query.format(table="departments"), values),
+                    (query.format(table="departments_by_id"), values),
+                ]
             )
+            self.stats.adjust_hospital(hospital_id, departments=1)
             logger.info(
                 f"Department '{name}' created in hospital {hospital_id} "
                 f"with ID {department_id}"
@@ -60,50 +73,40 @@ class DepartmentRepository:
         self, department_id, hospital_id=None
     ) -> Optional[Department]:
         """Find a department by its ID, optionally scoped to a hospital."""
+        try:
+            return self.find_by_id_async(department_id, hospital_id).result()
+        except Exception as e:
+            logger.error(f"Error finding department: {e}")
+            return None
+
+    def find_by_id_async(self, department_id, hospital_id=None) -> RepositoryFuture:
+        """Start a single-partition read; ``result()`` gives a Department or None.
+
+        Without hospital_id the departments_by_id lookup table is read.
+        """
         if isinstance(department_id, str):
             department_id = UUID(department_id)
         if hospital_id and isinstance(hospital_id, str):
             hospital_id = UUID(hospital_id)
 
         if not hospital_id:
-            return self._find_by_id_scan(department_id)
-
-        query = """
-        SELECT * FROM departments
-        WHERE hospital_id = ? AND department_id = ?
-        """
-        try:
-            prepared = self.session.prepare(query)
-            row = self.session.execute(prepared, [hospital_id, department_id]).one()
-            return self._row_to_department(row) if row else None
-        except Exception as e:
-            logger.error(f"Error finding department: {e}")
-            return None
-
-    def _find_by_id_scan(self, department_id: UUID) -> Optional[Department]:
-        """Scan all partitions for a department (use with caution)."""
-        query = "SELECT * FROM departments WHERE department_id = ? ALLOW FILTERING"
-        try:
-            prepared = self.session.prepare(query)
-            row = self.session.execute(prepared, [department_id]).one()
-            return self._row_to_department(row) if row else None
-        except Exception as e:
-            logger.error(f"Error scanning for department: {e}")
-            return None
+            query = "SELECT * FROM departments_by_id WHERE department_id = ?"
+            future = self._execute_async(query, [department_id])
+        else:
+            query = """
+            SELECT * FROM departments
+            WHERE hospital_id = ? AND department_id = ?
+            """
+            future = self._execute_async(query, [hospital_id, department_id])
+        return RepositoryFuture(future, first_row(self._row_to_department))
 
     # ---------------------------------------------------------- #
     # READ – by hospital
     # ---------------------------------------------------------- #
     def find_by_hospital(self, hospital_id: UUID) -> List[Department]:
         """Find all departments belonging to a hospital."""
-        if isinstance(hospital_id, str):
-            hospital_id = UUID(hospital_id)
-
-        query = "SELECT * FROM departments WHERE hospital_id = ?"
         try:
-            prepared = self.session.prepare(query)
-            results = self.session.execute(prepared, [hospital_id])
-            departments = [self._row_to_department(row) for row in results]
+            departments = self.find_by_hospital_async(hospital_id).result()
             logger.info(
                 f"Found {len(departments)} departments in hospital {hospital_id}"
             )
@@ -112,6 +115,15 @@ class DepartmentRepository:
             logger.error(f"Error finding departments by hospital: {e}")
             return []
 
+    def find_by_hospital_async(self, hospital_id: UUID) -> RepositoryFuture:
+        """Start reading a hospital partition; ``result()`` gives Departments."""
+        if isinstance(hospital_id, str):
+            hospital_id = UUID(hospital_id)
+
+        query = "SELECT * FROM departments WHERE hospital_id = ?"
+        future = self._execute_async(query, [hospital_id])
+        return RepositoryFuture(future, all_rows(self._row_to_department))
+
     # ---------------------------------------------------------- #
     # READ – all
     # ---------------------------------------------------------- #
@@ -119,12 +131,21 @@ class DepartmentRepository:
         """Get all departments across all hospitals."""
         query = "SELECT * FROM departments"
         try:
-            results = self.session.execute(query)
+            results = self._execute(query, profile=SCAN)
             return [self._row_to_department(row) for row in results]
         except Exception as e:
             logger.error(f"Error getting all departments: {e}")
             return []
 
+    def get_page(self, page_size: int = None, cursor: str = None) -> Page:
+        """Get one page of departments; pass the returned cursor to continue."""
+        query = "SELECT * FROM departments"
+        try:
+            return self._execute_page(query, [], self._row_to_department, page_size, cursor)
+        except Exception as e:
+            logger.error(f"Error paging departments: {e}")
+            return Page([])
+
     # ---------------------------------------------------------- #
     # UPDATE
     # ---------------------------------------------------------- #
@@ -134,15 +155,21 @@ class DepartmentRepository:
         """Update department fields dynamically."""
         if not kwargs:
             return False
-        set_clause = ", ".join(f"{k} = ?" for k in kwargs)
+        set_clause, set_values = self._set_clause(kwargs)
         query = f"""
         UPDATE departments SET {set_clause}
         WHERE hospital_id = ? AND department_id = ?
         """
-        values = list(kwargs.values()) + [hospital_id, department_id]
+        lookup_query = (
+            f"UPDATE departments_by_id SET {set_clause} WHERE department_id = ?"
+        )
         try:
-            prepared = self.session.prepare(query)
-            self.session.execute(prepared, values)
+            self._execute_batch(
+                [
+                    (query, set_values + [hospital_id, department_id]),
+                    (lookup_query, set_values + [department_id]),
+                ]
+            )
             logger.info(f"Department {department_id} updated")
             return True
         except Exception as e:
@@ -158,25 +185,60 @@ class DepartmentRepository:
         DELETE FROM departments
         WHERE hospital_id = ? AND department_id = ?
         """
+        lookup_query = "DELETE FROM departments_by_id WHERE department_id = ?"
         try:
-            prepared = self.session.prepare(query)
-            self.session.execute(prepared, [hospital_id, department_id])
+            existing = self.find_by_id_async(department_id, hospital_id).result()
+            self._execute_batch(
+                [
+                    (query, [hospital_id, department_id]),
+                    (lookup_query, [department_id]),
+                ]
+            )
+            if existing:
+                self.stats.adjust_hospital(hospital_id, departments=-1)
             logger.info(f"Department {department_id} deleted")
             return True
         except Exception as e:
             logger.error(f"Error deleting department: {e}")
             return False
 
+    # ---------------------------------------------------------- #
+    # Maintenance
+    # ---------------------------------------------------------- #
+    def rebuild_lookups(self, concurrency: int = DEFAULT_CONCURRENCY) -> int:
+        """Backfill departments_by_id for rows written before it existed."""
+        query = """
+        INSERT INTO departments_by_id (
+            hospital_id, department_id, name, description, head_doctor_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?)
+        """
+        result = bulk_write(
+            self,
+            self.get_all(),
+            lambda d: BulkRow(
+                entity_id=d.department_id,
+                partition_key=(d.department_id,),
+                main=(
+                    query,
+                    [
+                        d.hospital_id, d.department_id, d.name,
+                        d.description, d.head_doctor_id, d.created_at,
+                    ],
+                ),
+                extras=[],
+            ),
+            concurrency=concurrency,
+            group_by_partition=False,
+        )
+        logger.info(f"Rebuilt departments_by_id: {result.summary()}")
+        return result.succeeded
+
     # ---------------------------------------------------------- #
     # Helper
     # ---------------------------------------------------------- #
     @staticmethod
     def _row_to_department(row) -> Department:
-        return Department(
-            name=row.name,
-            hospital_id=row.hospital_id,
-            description=row.description,
-            head_doctor_id=row.head_doctor_id,
-            department_id=row.department_id,
-            created_at=row.created_at,
-        )
+        # The session's row factory usually hands over models already
+        if isinstance(row, Department):
+            return row
+        return Department.from_row(row)
@@ -1,20 +1,18 @@
 from uuid import UUID, uuid4
 from typing import List, Optional
-from src.database.connection import ScyllaDBConnection
+from src.database.futures import RepositoryFuture, first_row
+from src.database.pagination import Page
+from src.database.profiles import SCAN
+from src.database.repositories.base_repository import BaseRepository
 from src.models.hospital import Hospital
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class HospitalRepository:
+class HospitalRepository(BaseRepository):
     """Data access layer for Hospital operations."""
 
-    def __init__(self, session=None):
-        self.db = ScyllaDBConnection() if session is None else None
-        self.session = session or self.db.connect()
-        self.session.set_keyspace("hospital")
-
     # ---------------------------------------------------------- #
     # CREATE
     # ---------------------------------------------------------- #
@@ -26,8 +24,7 @@ class HospitalRepository:
         VALUES (?, ?, ?, ?, toTimestamp(now()))
         """
         try:
-            prepared = self.session.prepare(query)
-            self.session.execute(prepared, [hospital_id, name, location, phone])
+            self._execute(query, [hospital_id, name, location, phone])
             logger.info(f"Hospital '{name}' created with ID {hospital_id}")
             return str(hospital_id)
         except Exception as e:
@@ -46,15 +43,21 @@ class HospitalRepository:
                 logger.error(f"Invalid hospital_id: {hospital_id}")
                 return None
 
-        query = "SELECT * FROM hospitals WHERE hospital_id = ?"
         try:
-            prepared = self.session.prepare(query)
-            row = self.session.execute(prepared, [hospital_id]).one()
-            return self._row_to_hospital(row) if row else None
+            return self.find_by_id_async(hospital_id).result()
         except Exception as e:
             logger.error(f"Error finding hospital: {e}")
             return None
 
+    def find_by_id_async(self, hospital_id) -> RepositoryFuture:
+        """Start a single-partition read; ``result()`` gives a Hospital or None."""
+        if isinstance(hospital_id, str):
+            hospital_id = UUID(hospital_id)
+
+        query = "SELECT * FROM hospitals WHERE hospital_id = ?"
+        future = self._execute_async(query, [hospital_id])
+        return RepositoryFuture(future, first_row(self._row_to_hospital))
+
     # ---------------------------------------------------------- #
     # READ – all
     # ---------------------------------------------------------- #
@@ -62,12 +65,21 @@ class HospitalRepository:
         """Get all hospitals."""
         query = "SELECT * FROM hospitals"
         try:
-            results = self.session.execute(query)
+            results = self._execute(query, profile=SCAN)
             return [self._row_to_hospital(row) for row in results]
         except Exception as e:
             logger.error(f"Error getting all hospitals: {e}")
             return []
 
+    def get_page(self, page_size: int = None, cursor: str = None) -> Page:
+        """Get one page of hospitals; pass the returned cursor to continue."""
+        query = "SELECT * FROM hospitals"
+        try:
+            return self._execute_page(query, [], self._row_to_hospital, page_size, cursor)
+        except Exception as e:
+            logger.error(f"Error paging hospitals: {e}")
+            return Page([])
+
     # ---------------------------------------------------------- #
     # UPDATE
     # ---------------------------------------------------------- #
@@ -75,12 +87,11 @@ class HospitalRepository:
         """Update hospital fields dynamically."""
         if not kwargs:
             return False
-        set_clause = ", ".join(f"{k} = ?" for k in kwargs)
+        set_clause, set_values = self._set_clause(kwargs)
         query = f"UPDATE hospitals SET {set_clause} WHERE hospital_id = ?"
-        values = list(kwargs.values()) + [hospital_id]
+        values = set_values + [hospital_id]
         try:
-            prepared = self.session.prepare(query)
-            self.session.execute(prepared, values)
+            self._execute(query, values)
             logger.info(f"Hospital {hospital_id} updated")
             return True
         except Exception as e:
@@ -94,8 +105,7 @@ class HospitalRepository:
         """Delete a hospital."""
         query = "DELETE FROM hospitals WHERE hospital_id = ?"
         try:
-            prepared = self.session.prepare(query)
-            self.session.execute(prepared, [hospital_id])
+            self._execute(query, [hospital_id])
             logger.info(f"Hospital {hospital_id} deleted")
             return True
         except Exception as e:
@@ -107,10 +117,7 @@ class HospitalRepository:
     # ---------------------------------------------------------- #
     @staticmethod
     def _row_to_hospital(row) -> Hospital:
-        return Hospital(
-            name=row.name,
-            location=row.location,
-            phone=row.phone,
-            hospital_id=row.hospital_id,
-            created_at=row.created_at,
-        )
+        # The session's row factory usually hands over models already
+        if isinstance(row, Hospital):
+            return row
+        return Hospital.from_row(row)
@@ -1,23 +1,65 @@
+from itertools import islice
 from uuid import UUID, uuid4
 from typing import List, Optional
-from datetime import date
-from src.database.connection import ScyllaDBConnection
+from datetime import date, datetime, timezone
+from src.database.bucket_migration import BucketMigration
+from src.database.buckets import all_buckets, bucket_for, concat
+from src.database.bulk import DEFAULT_CONCURRENCY, BulkRow, bulk_write
+from src.database.futures import (
+    CombinedFuture,
+    FallbackFuture,
+    RepositoryFuture,
+    all_rows,
+    first_row,
+    gather,
+)
+from src.database.name_index import MAX_MATCHES, NameIndex
+from src.database.pagination import Page
+from src.database.profiles import SCAN
+from src.database.recent import RecentFeed
+from src.database.repositories.base_repository import BaseRepository
+from src.database.repositories.stats_repository import StatsRepository
 from src.models.patient import Patient
+from src.utils.normalization import normalize_phone
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class PatientRepository:
+class PatientRepository(BaseRepository):
     """Data access layer for Patient operations.
 
-    Patients are partitioned by department_id (FK → departments).
+    Patients are partitioned by (department_id, bucket) in patients_bucketed,
+    with the bucket derived from patient_id (see src.database.buckets).
+    Medical records live in patient_records and are read only on demand.
     """
 
-    def __init__(self, session=None):
-        self.db = ScyllaDBConnection() if session is None else None
-        self.session = session or self.db.connect()
-        self.session.set_keyspace("hospital")
+    TABLE = "patients_bucketed"
+    PARTITION_KEY = ("department_id", "bucket")
+    STATS_COUNTER = "patients"
+
+    # Hot-row columns: written on insert, copied into the recent feed and
+    # selected by every list query (medical_record is deliberately absent)
+    COLUMNS = (
+        "department_id", "patient_id", "first_name", "last_name",
+        "date_of_birth", "age", "phone", "created_at",
+    )
+    SELECT_COLUMNS = ", ".join(COLUMNS)
+    # Default columns of frame()
+    FRAME_COLUMNS = (
+        "department_id", "patient_id", "first_name", "last_name",
+        "age", "phone", "created_at",
+    )
+
+    def __init__(self, session=None, stats: StatsRepository = None):
+        super().__init__(session)
+        self.stats = stats or StatsRepository(session=self.session)
+        self.name_index = NameIndex(self, "patients_by_name", "patient_id")
+        self.recent_feed = RecentFeed(
+            self, "patients_by_created_day", "patient_id", self.COLUMNS
+        )
+        # Attached to every loaded patient; bound once, not per row
+        self._record_loader = self.find_record
 
     # ---------------------------------------------------------- #
     # CREATE
@@ -33,48 +75,93 @@ class PatientRepository:
         medical_record: str = None,
     ) -> str:
         """Insert a new patient and return patient_id."""
-
-        if not department_id:
-            raise ValueError("department_id is required")
-
-        patient_id = uuid4()
-
-        insert_query = """
-        INSERT INTO patients (
-            department_id, patient_id, first_name, last_name,
-            date_of_birth, age, phone, medical_record, created_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, toTimestamp(now()))
-        """
+        row = self._build_row(
+            first_name, last_name, date_of_birth, age, phone, department_id,
+            medical_record,
+        )
 
         try:
-            prepared = self.session.prepare(insert_query)
-            self.session.execute(
-                prepared,
-                [
-                    department_id,
-                    patient_id,
-                    first_name,
-                    last_name,
-                    date_of_birth,
-                    age,
-                    phone,
-                    medical_record,
-                ],
-            )
+            self._execute_batch([row.main] + row.extras)
+            department_id, _ = row.partition_key
+            self.stats.adjust_department(department_id, patients=1)
 
             logger.info(
-                f"Patient {first_name} {last_name} created with ID {patient_id}"
+                f"Patient {first_name} {last_name} created with ID {row.entity_id}"
             )
-            return str(patient_id)
+            return str(row.entity_id)
 
         except Exception:
             logger.exception("Error creating patient")
             raise
 
+    def _build_row(
+        self,
+        first_name: str,
+        last_name: str,
+        date_of_birth: date,
+        age: int,
+        phone: str,
+        department_id: UUID,
+        medical_record: str = None,
+    ) -> BulkRow:
+        """Build the main insert and index writes for one new patient."""
+        if not department_id:
+            raise ValueError("department_id is required")
+        if isinstance(department_id, str):
+            department_id = UUID(department_id)
+
+        patient_id = uuid4()
+        created_at = datetime.now(timezone.utc)
+
+        # Same row goes to the department partition and the id lookup table
+        insert_query = """
+        INSERT INTO {table} (
+            department_id, patient_id, first_name, last_name,
+            date_of_birth, age, phone, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        values = [
+            department_id,
+            patient_id,
+            first_name,
+            last_name,
+            date_of_birth,
+            age,
+            phone,
+            created_at,
+        ]
+        bucket = bucket_for(patient_id)
+        main_query = f"""
+        INSERT INTO {self.TABLE} (bucket, {self.SELECT_COLUMNS})
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        extras = [
+            (insert_query.format(table="patients_by_id"), values),
+            self.recent_feed.insert_statement(values, created_at),
+        ]
+        if medical_record:
+            extras.append(self._record_upsert(patient_id, medical_record))
+        return BulkRow(
+            entity_id=patient_id,
+            partition_key=(department_id, bucket),
+            main=(main_query, [bucket] + values),
+            extras=extras
+            + self._index_inserts(
+                department_id, patient_id, first_name, last_name, phone
+            ),
+        )
+
     # ---------------------------------------------------------- #
     # READ – by ID
     # ---------------------------------------------------------- #
     def find_by_id(self, patient_id, department_id=None) -> Optional[Patient]:
+        return self.find_by_id_async(patient_id, department_id).result()
+
+    def find_by_id_async(self, patient_id, department_id=None) -> RepositoryFuture:
+        """Start a single-partition read; ``result()`` gives a Patient or None.
+
+        Without department_id the patients_by_id lookup table is read.
+        """
         if isinstance(patient_id, str):
             patient_id = UUID(patient_id)
 
@@ -82,57 +169,115 @@ class PatientRepository:
             department_id = UUID(department_id)
 
         if not department_id:
-            return self._find_by_id_scan(patient_id)
-
-        query = "SELECT * FROM patients WHERE department_id = ? AND patient_id = ?"
-        prepared = self.session.prepare(query)
-        row = self.session.execute(prepared, [department_id, patient_id]).one()
-        return self._row_to_patient(row) if row else None
-
-    def _find_by_id_scan(self, patient_id: UUID) -> Optional[Patient]:
-        query = "SELECT * FROM patients WHERE patient_id = ? ALLOW FILTERING"
-        prepared = self.session.prepare(query)
-        row = self.session.execute(prepared, [patient_id]).one()
-        return self._row_to_patient(row) if row else None
+            query = f"""
+            SELECT {self.SELECT_COLUMNS} FROM patients_by_id WHERE patient_id = ?
+            """
+            future = self._execute_async(query, [patient_id])
+        else:
+            query = f"""
+            SELECT {self.SELECT_COLUMNS} FROM {self.TABLE}
+            WHERE department_id = ? AND bucket = ? AND patient_id = ?
+            """
+            future = self._execute_async(
+                query, [department_id, bucket_for(patient_id), patient_id]
+            )
+        return RepositoryFuture(future, first_row(self._row_to_patient))
 
     # ---------------------------------------------------------- #
     # READ – by department
     # ---------------------------------------------------------- #
     def find_by_department(self, department_id: UUID) -> List[Patient]:
+        return self.find_by_department_async(department_id).result()
+
+    def find_by_department_async(self, department_id: UUID) -> CombinedFuture:
+        """Start reading every bucket of a department; ``result()`` gives Patients."""
         if isinstance(department_id, str):
             department_id = UUID(department_id)
 
-        query = "SELECT * FROM patients WHERE department_id = ?"
-        prepared = self.session.prepare(query)
-        results = self.session.execute(prepared, [department_id])
-        return [self._row_to_patient(row) for row in results]
+        query = f"""
+        SELECT {self.SELECT_COLUMNS} FROM {self.TABLE}
+        WHERE department_id = ? AND bucket = ?
+        """
+        futures = [
+            RepositoryFuture(
+                self._execute_async(query, [department_id, bucket]),
+                all_rows(self._row_to_patient),
+            )
+            for bucket in all_buckets()
+        ]
+        return CombinedFuture(futures, concat)
 
     # ---------------------------------------------------------- #
     # READ – by name
     # ---------------------------------------------------------- #
-    def find_by_name(self, first_name: str = None, last_name: str = None) -> List[Patient]:
+    def find_by_name(
+        self, first_name: str = None, last_name: str = None, limit: int = MAX_MATCHES
+    ) -> List[Patient]:
+        """Find up to ``limit`` patients by first and/or last name prefix, ignoring case."""
         if not first_name and not last_name:
             return []
 
-        conditions = []
-        params = []
+        matches = self.name_index.search(first_name, last_name, limit)
+        return self._find_many(matches.items(), limit)
+
+    # ---------------------------------------------------------- #
+    # READ – by phone
+    # ---------------------------------------------------------- #
+    def find_by_phone(self, phone: str) -> List[Patient]:
+        """Find patients by phone number, ignoring spaces, dashes and '+'."""
+        normalized = normalize_phone(phone)
+        if not normalized:
+            return []
+
+        query = """
+        SELECT patient_id, department_id FROM patients_by_phone WHERE phone = ?
+        """
+        results = self._execute(query, [normalized])
+        return self._find_many((row.patient_id, row.department_id) for row in results)
+
+    def _find_many(self, keys, limit: int = MAX_MATCHES) -> List[Patient]:
+        """Fetch up to ``limit`` (patient_id, department_id) pairs in one concurrent wave."""
+        futures = [self.find_by_id_async(pid, did) for pid, did in islice(keys, limit)]
+        return [p for p in gather(futures) if p]
+
+    # ---------------------------------------------------------- #
+    # READ – medical record
+    # ---------------------------------------------------------- #
+    def find_record(self, patient_id) -> Optional[str]:
+        """Return a patient's medical record, or None."""
+        return self.find_record_async(patient_id).result()
+
+    def find_record_async(self, patient_id) -> FallbackFuture:
+        """Start reading a medical record; ``result()`` gives the text or None.
 
-        if first_name:
-            conditions.append("first_name = ?")
-            params.append(first_name)
-        if last_name:
-            conditions.append("last_name = ?")
-            params.append(last_name)
+        Only when patient_records has no entry is the legacy inline column
+        read, so notes of rows written before the split are still found.
+        """
+        if isinstance(patient_id, str):
+            patient_id = UUID(patient_id)
 
-        query = (
-            "SELECT * FROM patients WHERE "
-            + " AND ".join(conditions)
-            + " ALLOW FILTERING"
+        column = first_row(lambda row: row.medical_record)
+
+        def read(query):
+            return RepositoryFuture(self._execute_async(query, [patient_id]), column)
+
+        return FallbackFuture(
+            read("SELECT medical_record FROM patient_records WHERE patient_id = ?"),
+            lambda: read(
+                "SELECT medical_record FROM patients_by_id WHERE patient_id = ?"
+            ),
         )
 
-        prepared = self.session.prepare(query)
-        results = self.session.execute(prepared, params)
-        return [self._row_to_patient(row) for row in results]
+    # ---------------------------------------------------------- #
+    # READ – recent
+    # ---------------------------------------------------------- #
+    def recent(self, limit: int = 15) -> List[Patient]:
+        """Return the newest patients from the newest day partitions."""
+        return self.recent_feed.recent(limit, self._row_to_patient)
+
+    def recent_frame(self, limit: int = 15, columns=None):
+        """Return the newest patients as a DataFrame (default FRAME_COLUMNS)."""
+        return self.recent_feed.frame(limit, columns or self.FRAME_COLUMNS)
 
     # ---------------------------------------------------------- #
     # UPDATE
@@ -141,48 +286,255 @@ class PatientRepository:
         if not kwargs:
             return False
 
-        set_clause = ", ".join(f"{key} = ?" for key in kwargs)
+        # The medical record is stored on its own, never in the hot row
+        if "medical_record" in kwargs:
+            record = kwargs.pop("medical_record")
+            self._execute(*self._record_upsert(patient_id, record))
+            if not kwargs:
+                return True
+
+        set_clause, set_values = self._set_clause(kwargs)
+
+        # Index and feed rows are keyed on stored values, so read them first
+        index_statements = []
+        existing = self.find_by_id(patient_id, department_id)
+        if existing and kwargs.keys() & {"first_name", "last_name"}:
+            index_statements = self.name_index.update_statements(
+                patient_id,
+                department_id,
+                (existing.first_name, existing.last_name),
+                (
+                    kwargs.get("first_name", existing.first_name),
+                    kwargs.get("last_name", existing.last_name),
+                ),
+            )
+        if existing and "phone" in kwargs:
+            index_statements += self._phone_index_update(
+                existing, department_id, kwargs["phone"]
+            )
+        if existing and existing.created_at:
+            index_statements.append(
+                self.recent_feed.update_statement(
+                    patient_id, existing.created_at, set_clause, set_values
+                )
+            )
         update_query = f"""
-        UPDATE patients
+        UPDATE {self.TABLE}
         SET {set_clause}
-        WHERE department_id = ? AND patient_id = ?
+        WHERE department_id = ? AND bucket = ? AND patient_id = ?
         """
+        lookup_query = f"UPDATE patients_by_id SET {set_clause} WHERE patient_id = ?"
 
-        values = list(kwargs.values()) + [department_id, patient_id]
-
-        prepared = self.session.prepare(update_query)
-        self.session.execute(prepared, values)
+        self._execute_batch(
+            [
+                (
+                    update_query,
+                    set_values + [department_id, bucket_for(patient_id), patient_id],
+                ),
+                (lookup_query, set_values + [patient_id]),
+            ]
+            + index_statements
+        )
         return True
 
     # ---------------------------------------------------------- #
     # DELETE
     # ---------------------------------------------------------- #
     def delete(self, department_id: UUID, patient_id: UUID) -> bool:
-        query = "DELETE FROM patients WHERE department_id = ? AND patient_id = ?"
-        prepared = self.session.prepare(query)
-        self.session.execute(prepared, [department_id, patient_id])
+        existing = self.find_by_id(patient_id, department_id)
+        index_statements = self._index_deletes(existing) if existing else []
+        if existing and existing.created_at:
+            index_statements.append(
+                self.recent_feed.delete_statement(patient_id, existing.created_at)
+            )
+        self._execute_batch(
+            [
+                (
+                    f"DELETE FROM {self.TABLE} "
+                    "WHERE department_id = ? AND bucket = ? AND patient_id = ?",
+                    [department_id, bucket_for(patient_id), patient_id],
+                ),
+                ("DELETE FROM patients_by_id WHERE patient_id = ?", [patient_id]),
+                ("DELETE FROM patient_records WHERE patient_id = ?", [patient_id]),
+            ]
+            + index_statements
+        )
+        if existing:
+            self.stats.adjust_department(existing.department_id, patients=-1)
         return True
 
     # ---------------------------------------------------------- #
     # READ – all
     # ---------------------------------------------------------- #
     def get_all(self) -> List[Patient]:
-        results = self.session.execute("SELECT * FROM patients")
+        # Whole-table read: big pages and a long timeout
+        results = self._execute(
+            f"SELECT {self.SELECT_COLUMNS} FROM {self.TABLE}", profile=SCAN
+        )
         return [self._row_to_patient(row) for row in results]
 
+    def get_page(self, page_size: int = None, cursor: str = None) -> Page:
+        """Get one page of patients; pass the returned cursor to continue."""
+        return self._execute_page(
+            f"SELECT {self.SELECT_COLUMNS} FROM {self.TABLE}",
+            [],
+            self._row_to_patient,
+            page_size,
+            cursor,
+        )
+
+    def scan(self, **options):
+        """
+        Stream every patient using a parallel token-range scan.
+
+        Args:
+            **options: TokenRangeScanner options (splits, parallelism, ...)
+        """
+        options.setdefault("columns", self.SELECT_COLUMNS)
+        return self._scan(
+            self.TABLE, self.PARTITION_KEY, self._row_to_patient, **options
+        )
+
+    # ---------------------------------------------------------- #
+    # Maintenance
+    # ---------------------------------------------------------- #
+    def rebuild_lookups(self, concurrency: int = DEFAULT_CONCURRENCY) -> int:
+        """
+        Backfill patients_by_id, the search indexes and the recent feed.
+
+        Patients come from a parallel scan and their writes go through
+        bulk_write with bounded concurrency; all of them are upserts, so
+        the backfill can be re-run safely.
+
+        Returns:
+            int: patients whose lookup row was written
+        """
+        result = bulk_write(
+            self, self.scan(), self._lookup_row,
+            concurrency=concurrency, group_by_partition=False,
+        )
+        logger.info(f"Rebuilt patient lookup tables: {result.summary()}")
+        return result.succeeded
+
+    def _lookup_row(self, p: Patient) -> BulkRow:
+        """Lookup, index and feed writes that make an existing patient findable."""
+        query = """
+        INSERT INTO patients_by_id (
+            department_id, patient_id, first_name, last_name,
+            date_of_birth, age, phone, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        values = [
+            p.department_id,
+            p.patient_id,
+            p.first_name,
+            p.last_name,
+            p.date_of_birth,
+            p.age,
+            p.phone,
+            p.created_at,
+        ]
+        extras = self._index_inserts(
+            p.department_id, p.patient_id, p.first_name, p.last_name, p.phone
+        )
+        if p.created_at:
+            extras.append(self.recent_feed.insert_statement(values, p.created_at))
+        return BulkRow(
+            entity_id=p.patient_id,
+            partition_key=(p.patient_id,),
+            main=(query, values),
+            extras=extras,
+        )
+
+    def migrate_to_buckets(self, **options) -> dict:
+        """
+        Copy the legacy ``patients`` table into patients_bucketed (resumable).
+
+        Inline medical_record notes still on the legacy rows are upserted
+        into patient_records on the way.
+        """
+        def records(row):
+            if row["medical_record"] is None:
+                return []
+            return [self._record_upsert(row["patient_id"], row["medical_record"])]
+
+        return BucketMigration(
+            self.session, "patients_to_bucketed", "patients", self.TABLE,
+            "patient_id", self.COLUMNS, extra_columns=("medical_record",),
+            extras=records, **options,
+        ).run()
+
     # ---------------------------------------------------------- #
     # Helper
     # ---------------------------------------------------------- #
-    @staticmethod
-    def _row_to_patient(row) -> Patient:
-        return Patient(
-            first_name=row.first_name,
-            last_name=row.last_name,
-            age=row.age,
-            date_of_birth=row.date_of_birth,
-            phone=row.phone,
-            patient_id=row.patient_id,
-            department_id=row.department_id,
-            medical_record=getattr(row, "medical_record", None),
-            created_at=row.created_at,
+    def _index_inserts(
+        self, department_id, patient_id, first_name, last_name, phone
+    ) -> list:
+        """Statements that add a patient to the search index tables."""
+        statements = self.name_index.insert_statements(
+            patient_id, department_id, first_name, last_name
         )
+        normalized = normalize_phone(phone)
+        if normalized:
+            statements.append(
+                (
+                    "INSERT INTO patients_by_phone (phone, patient_id, department_id) "
+                    "VALUES (?, ?, ?)",
+                    [normalized, patient_id, department_id],
+                )
+            )
+        return statements
+
+    def _index_deletes(self, patient: Patient) -> list:
+        """Statements that remove a patient from the search index tables."""
+        statements = self.name_index.delete_statements(
+            patient.patient_id, patient.first_name, patient.last_name
+        )
+        normalized = normalize_phone(patient.phone)
+        if normalized:
+            statements.append(
+                (
+                    "DELETE FROM patients_by_phone WHERE phone = ? AND patient_id = ?",
+                    [normalized, patient.patient_id],
+                )
+            )
+        return statements
+
+    def _phone_index_update(self, patient: Patient, department_id, phone) -> list:
+        """Statements that move a patient's phone index row to ``phone``."""
+        statements = []
+        old, new = normalize_phone(patient.phone), normalize_phone(phone)
+        # A delete and an insert of the same row in one batch share a
+        # timestamp and the delete wins, so an unchanged number is left alone
+        if old == new:
+            return statements
+        if old:
+            statements.append(
+                (
+                    "DELETE FROM patients_by_phone WHERE phone = ? AND patient_id = ?",
+                    [old, patient.patient_id],
+                )
+            )
+        if new:
+            statements.append(
+                (
+                    "INSERT INTO patients_by_phone (phone, patient_id, department_id) "
+                    "VALUES (?, ?, ?)",
+                    [new, patient.patient_id, department_id],
+                )
+            )
+        return statements
+
+    def _record_upsert(self, patient_id, medical_record) -> tuple:
+        """Statement storing a patient's medical record."""
+        return (
+            "INSERT INTO patient_records (patient_id, medical_record, updated_at) "
+            "VALUES (?, ?, ?)",
+            [patient_id, medical_record, datetime.now(timezone.utc)],
+        )
+
+    def _row_to_patient(self, row) -> Patient:
+        # The session's row factory usually hands over models already
+        patient = row if isinstance(row, Patient) else Patient.from_row(row)
+        patient.set_record_loader(self._record_loader)
+        return patient
@@ -1,22 +1,59 @@
+from itertools import islice
 from uuid import UUID, uuid4
 from typing import List, Optional
-from src.database.connection import ScyllaDBConnection
+from datetime import datetime, timezone
+from src.database.bucket_migration import BucketMigration
+from src.database.buckets import all_buckets, bucket_for, concat
+from src.database.bulk import DEFAULT_CONCURRENCY, BulkRow, bulk_write
+from src.database.futures import (
+    CombinedFuture,
+    RepositoryFuture,
+    all_rows,
+    first_row,
+    gather,
+)
+from src.database.name_index import MAX_MATCHES, NameIndex
+from src.database.pagination import Page
+from src.database.profiles import SCAN
+from src.database.recent import RecentFeed
+from src.database.repositories.base_repository import BaseRepository
+from src.database.repositories.stats_repository import StatsRepository
 from src.models.staff import Staff
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class StaffRepository:
+class StaffRepository(BaseRepository):
     """Data access layer for Staff operations.
 
-    Staff members are partitioned by department_id (FK → departments).
+    Staff members are partitioned by (department_id, bucket) in
+    staff_bucketed, with the bucket derived from staff_id
+    (see src.database.buckets).
     """
 
-    def __init__(self, session=None):
-        self.db = ScyllaDBConnection() if session is None else None
-        self.session = session or self.db.connect()
-        self.session.set_keyspace("hospital")
+    TABLE = "staff_bucketed"
+    PARTITION_KEY = ("department_id", "bucket")
+    STATS_COUNTER = "staff"
+
+    # Columns copied into the recent feed, in insert order
+    COLUMNS = (
+        "department_id", "staff_id", "first_name", "last_name",
+        "name", "age", "position", "created_at",
+    )
+    # Default columns of frame()
+    FRAME_COLUMNS = (
+        "department_id", "staff_id", "first_name", "last_name",
+        "age", "position", "created_at",
+    )
+
+    def __init__(self, session=None, stats: StatsRepository = None):
+        super().__init__(session)
+        self.stats = stats or StatsRepository(session=self.session)
+        self.name_index = NameIndex(self, "staff_by_name", "staff_id")
+        self.recent_feed = RecentFeed(
+            self, "staff_by_created_day", "staff_id", self.COLUMNS
+        )
 
     # ---------------------------------------------------------- #
     # CREATE
@@ -42,32 +79,64 @@ class StaffRepository:
         Returns:
             str: staff_id or None on failure
         """
+        try:
+            row = self._build_row(first_name, last_name, age, position, department_id)
+            self._execute_batch([row.main] + row.extras)
+            department_id, _ = row.partition_key
+            self.stats.adjust_department(department_id, staff=1)
+            logger.info(
+                f"Staff '{first_name} {last_name}' created in department "
+                f"{department_id} with ID {row.entity_id}"
+            )
+            return str(row.entity_id)
+        except Exception as e:
+            logger.error(f"Error creating staff: {e}")
+            return None
+
+    def _build_row(
+        self,
+        first_name: str,
+        last_name: str,
+        age: int,
+        position: str,
+        department_id: UUID = None,
+    ) -> BulkRow:
+        """Build the main insert and index writes for one new staff member."""
         staff_id = uuid4()
         department_id = department_id or uuid4()
         if isinstance(department_id, str):
             department_id = UUID(department_id)
 
         full_name = f"{first_name} {last_name}"
+        created_at = datetime.now(timezone.utc)
 
+        # Same row goes to the department partition and the id lookup table
         query = """
-        INSERT INTO staff (
+        INSERT INTO {table} (
             department_id, staff_id, first_name, last_name, name, age, position, created_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, toTimestamp(now()))
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
-        try:
-            prepared = self.session.prepare(query)
-            self.session.execute(
-                prepared,
-                [department_id, staff_id, first_name, last_name, full_name, age, position],
-            )
-            logger.info(
-                f"Staff '{full_name}' created in department {department_id} "
-                f"with ID {staff_id}"
-            )
-            return str(staff_id)
-        except Exception as e:
-            logger.error(f"Error creating staff: {e}")
-            return None
+        values = [
+            department_id, staff_id, first_name, last_name,
+            full_name, age, position, created_at,
+        ]
+        bucket = bucket_for(staff_id)
+        main_query = f"""
+        INSERT INTO {self.TABLE} (bucket, {", ".join(self.COLUMNS)})
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        return BulkRow(
+            entity_id=staff_id,
+            partition_key=(department_id, bucket),
+            main=(main_query, [bucket] + values),
+            extras=[
+                (query.format(table="staff_by_id"), values),
+                self.recent_feed.insert_statement(values, created_at),
+            ]
+            + self.name_index.insert_statements(
+                staff_id, department_id, first_name, last_name
+            ),
+        )
 
     # ---------------------------------------------------------- #
     # READ – by ID
@@ -80,45 +149,42 @@ class StaffRepository:
             except ValueError:
                 logger.error(f"Invalid staff_id: {staff_id}")
                 return None
-        if department_id and isinstance(department_id, str):
-            department_id = UUID(department_id)
-
-        if not department_id:
-            return self._find_by_id_scan(staff_id)
-
-        query = "SELECT * FROM staff WHERE department_id = ? AND staff_id = ?"
         try:
-            prepared = self.session.prepare(query)
-            row = self.session.execute(prepared, [department_id, staff_id]).one()
-            return self._row_to_staff(row) if row else None
+            return self.find_by_id_async(staff_id, department_id).result()
         except Exception as e:
             logger.error(f"Error finding staff: {e}")
             return None
 
-    def _find_by_id_scan(self, staff_id: UUID) -> Optional[Staff]:
-        """Scan all partitions for a staff member."""
-        query = "SELECT * FROM staff WHERE staff_id = ? ALLOW FILTERING"
-        try:
-            prepared = self.session.prepare(query)
-            row = self.session.execute(prepared, [staff_id]).one()
-            return self._row_to_staff(row) if row else None
-        except Exception as e:
-            logger.error(f"Error scanning for staff: {e}")
-            return None
+    def find_by_id_async(self, staff_id, department_id=None) -> RepositoryFuture:
+        """Start a single-partition read; ``result()`` gives a Staff or None.
+
+        Without department_id the staff_by_id lookup table is read.
+        """
+        if isinstance(staff_id, str):
+            staff_id = UUID(staff_id)
+        if department_id and isinstance(department_id, str):
+            department_id = UUID(department_id)
+
+        if not department_id:
+            query = "SELECT * FROM staff_by_id WHERE staff_id = ?"
+            future = self._execute_async(query, [staff_id])
+        else:
+            query = f"""
+            SELECT * FROM {self.TABLE}
+            WHERE department_id = ? AND bucket = ? AND staff_id = ?
+            """
+            future = self._execute_async(
+                query, [department_id, bucket_for(staff_id), staff_id]
+            )
+        return RepositoryFuture(future, first_row(self._row_to_staff))
 
     # ---------------------------------------------------------- #
     # READ – by department
     # ---------------------------------------------------------- #
     def find_by_department(self, department_id: UUID) -> List[Staff]:
         """Find all staff members in a department."""
-        if isinstance(department_id, str):
-            department_id = UUID(department_id)
-
-        query = "SELECT * FROM staff WHERE department_id = ?"
         try:
-            prepared = self.session.prepare(query)
-            results = self.session.execute(prepared, [department_id])
-            staff_list = [self._row_to_staff(row) for row in results]
+            staff_list = self.find_by_department_async(department_id).result()
             logger.info(
                 f"Found {len(staff_list)} staff in department {department_id}"
             )
@@ -127,34 +193,38 @@ class StaffRepository:
             logger.error(f"Error finding staff by department: {e}")
             return []
 
+    def find_by_department_async(self, department_id: UUID) -> CombinedFuture:
+        """Start reading every bucket of a department; ``result()`` gives Staff."""
+        if isinstance(department_id, str):
+            department_id = UUID(department_id)
+
+        query = f"SELECT * FROM {self.TABLE} WHERE department_id = ? AND bucket = ?"
+        futures = [
+            RepositoryFuture(
+                self._execute_async(query, [department_id, bucket]),
+                all_rows(self._row_to_staff),
+            )
+            for bucket in all_buckets()
+        ]
+        return CombinedFuture(futures, concat)
+
     # ---------------------------------------------------------- #
     # READ – by name
     # ---------------------------------------------------------- #
     def find_by_name(
-        self, first_name: str = None, last_name: str = None
+        self, first_name: str = None, last_name: str = None, limit: int = MAX_MATCHES
     ) -> List[Staff]:
-        """Find staff by name (uses ALLOW FILTERING)."""
+        """Find up to ``limit`` staff by first and/or last name prefix, ignoring case."""
         if not first_name and not last_name:
             return []
 
-        conditions = []
-        params = []
-        if first_name:
-            conditions.append("first_name = ?")
-            params.append(first_name)
-        if last_name:
-            conditions.append("last_name = ?")
-            params.append(last_name)
-
-        query = (
-            "SELECT * FROM staff WHERE "
-            + " AND ".join(conditions)
-            + " ALLOW FILTERING"
-        )
         try:
-            prepared = self.session.prepare(query)
-            results = self.session.execute(prepared, params)
-            return [self._row_to_staff(row) for row in results]
+            matches = self.name_index.search(first_name, last_name, limit)
+            futures = [
+                self.find_by_id_async(staff_id, department_id)
+                for staff_id, department_id in islice(matches.items(), limit)
+            ]
+            return [s for s in gather(futures) if s]
         except Exception as e:
             logger.error(f"Error finding staff by name: {e}")
             return []
@@ -164,14 +234,38 @@ class StaffRepository:
     # ---------------------------------------------------------- #
     def get_all(self) -> List[Staff]:
         """Get all staff members."""
-        query = "SELECT * FROM staff"
+        query = f"SELECT * FROM {self.TABLE}"
         try:
-            results = self.session.execute(query)
+            results = self._execute(query, profile=SCAN)
             return [self._row_to_staff(row) for row in results]
         except Exception as e:
             logger.error(f"Error getting all staff: {e}")
             return []
 
+    def get_page(self, page_size: int = None, cursor: str = None) -> Page:
+        """Get one page of staff; pass the returned cursor to continue."""
+        query = f"SELECT * FROM {self.TABLE}"
+        try:
+            return self._execute_page(query, [], self._row_to_staff, page_size, cursor)
+        except Exception as e:
+            logger.error(f"Error paging staff: {e}")
+            return Page([])
+
+    # ---------------------------------------------------------- #
+    # READ – recent
+    # ---------------------------------------------------------- #
+    def recent(self, limit: int = 15) -> List[Staff]:
+        """Return the newest staff members from the newest day partitions."""
+        try:
+            return self.recent_feed.recent(limit, self._row_to_staff)
+        except Exception as e:
+            logger.error(f"Error fetching recent staff: {e}")
+            return []
+
+    def recent_frame(self, limit: int = 15, columns=None):
+        """Return the newest staff members as a DataFrame (default FRAME_COLUMNS)."""
+        return self.recent_feed.frame(limit, columns or self.FRAME_COLUMNS)
+
     # ---------------------------------------------------------- #
     # UPDATE
     # ---------------------------------------------------------- #
@@ -179,15 +273,42 @@ class StaffRepository:
         """Update staff fields dynamically."""
         if not kwargs:
             return False
-        set_clause = ", ".join(f"{k} = ?" for k in kwargs)
+        set_clause, set_values = self._set_clause(kwargs)
         query = f"""
-        UPDATE staff SET {set_clause}
-        WHERE department_id = ? AND staff_id = ?
+        UPDATE {self.TABLE} SET {set_clause}
+        WHERE department_id = ? AND bucket = ? AND staff_id = ?
         """
-        values = list(kwargs.values()) + [department_id, staff_id]
+        lookup_query = f"UPDATE staff_by_id SET {set_clause} WHERE staff_id = ?"
         try:
-            prepared = self.session.prepare(query)
-            self.session.execute(prepared, values)
+            # Index and feed rows are keyed on stored values, so read them first
+            index_statements = []
+            existing = self.find_by_id(staff_id, department_id)
+            if existing and kwargs.keys() & {"first_name", "last_name"}:
+                index_statements = self.name_index.update_statements(
+                    staff_id,
+                    department_id,
+                    (existing.first_name, existing.last_name),
+                    (
+                        kwargs.get("first_name", existing.first_name),
+                        kwargs.get("last_name", existing.last_name),
+                    ),
+                )
+            if existing and existing.created_at:
+                index_statements.append(
+                    self.recent_feed.update_statement(
+                        staff_id, existing.created_at, set_clause, set_values
+                    )
+                )
+            self._execute_batch(
+                [
+                    (
+                        query,
+                        set_values + [department_id, bucket_for(staff_id), staff_id],
+                    ),
+                    (lookup_query, set_values + [staff_id]),
+                ]
+                + index_statements
+            )
             logger.info(f"Staff {staff_id} updated")
             return True
         except Exception as e:
@@ -199,27 +320,106 @@ class StaffRepository:
     # ---------------------------------------------------------- #
     def delete(self, department_id: UUID, staff_id: UUID) -> bool:
         """Delete a staff member."""
-        query = "DELETE FROM staff WHERE department_id = ? AND staff_id = ?"
+        query = f"""
+        DELETE FROM {self.TABLE}
+        WHERE department_id = ? AND bucket = ? AND staff_id = ?
+        """
+        lookup_query = "DELETE FROM staff_by_id WHERE staff_id = ?"
         try:
-            prepared = self.session.prepare(query)
-            self.session.execute(prepared, [department_id, staff_id])
+            existing = self.find_by_id(staff_id, department_id)
+            index_statements = (
+                self.name_index.delete_statements(
+                    staff_id, existing.first_name, existing.last_name
+                )
+                if existing
+                else []
+            )
+            if existing and existing.created_at:
+                index_statements.append(
+                    self.recent_feed.delete_statement(staff_id, existing.created_at)
+                )
+            self._execute_batch(
+                [
+                    (query, [department_id, bucket_for(staff_id), staff_id]),
+                    (lookup_query, [staff_id]),
+                ]
+                + index_statements
+            )
+            if existing:
+                self.stats.adjust_department(existing.department_id, staff=-1)
             logger.info(f"Staff {staff_id} deleted")
             return True
         except Exception as e:
             logger.error(f"Error deleting staff: {e}")
             return False
 
+    def scan(self, **options):
+        """
+        Stream every staff member using a parallel token-range scan.
+
+        Args:
+            **options: TokenRangeScanner options (splits, parallelism, ...)
+        """
+        return self._scan(
+            self.TABLE, self.PARTITION_KEY, self._row_to_staff, **options
+        )
+
+    # ---------------------------------------------------------- #
+    # Maintenance
+    # ---------------------------------------------------------- #
+    def rebuild_lookups(self, concurrency: int = DEFAULT_CONCURRENCY) -> int:
+        """
+        Backfill staff_by_id, the name index and the recent feed.
+
+        Staff come from a parallel scan and their writes go through
+        bulk_write with bounded concurrency; all of them are upserts.
+
+        Returns:
+            int: staff members whose lookup row was written
+        """
+        result = bulk_write(
+            self, self.scan(), self._lookup_row,
+            concurrency=concurrency, group_by_partition=False,
+        )
+        logger.info(f"Rebuilt staff lookup tables: {result.summary()}")
+        return result.succeeded
+
+    def _lookup_row(self, s: Staff) -> BulkRow:
+        """Lookup, index and feed writes that make an existing staff member findable."""
+        query = """
+        INSERT INTO staff_by_id (
+            department_id, staff_id, first_name, last_name, name, age, position, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        values = [
+            s.department_id, s.staff_id, s.first_name, s.last_name,
+            s.name, s.age, s.position, s.created_at,
+        ]
+        extras = self.name_index.insert_statements(
+            s.staff_id, s.department_id, s.first_name, s.last_name
+        )
+        if s.created_at:
+            extras.append(self.recent_feed.insert_statement(values, s.created_at))
+        return BulkRow(
+            entity_id=s.staff_id,
+            partition_key=(s.staff_id,),
+            main=(query, values),
+            extras=extras,
+        )
+
+    def migrate_to_buckets(self, **options) -> dict:
+        """Copy the legacy ``staff`` table into staff_bucketed (resumable)."""
+        return BucketMigration(
+            self.session, "staff_to_bucketed", "staff", self.TABLE,
+            "staff_id", self.COLUMNS, **options,
+        ).run()
+
     # ---------------------------------------------------------- #
     # Helper
     # ---------------------------------------------------------- #
     @staticmethod
     def _row_to_staff(row) -> Staff:
-        return Staff(
-            first_name=row.first_name,
-            last_name=row.last_name,
-            age=row.age,
-            position=row.position,
-            staff_id=row.staff_id,
-            department_id=row.department_id,
-            created_at=row.created_at,
-        )
+        # The session's row factory usually hands over models already
+        if isinstance(row, Staff):
+            return row
+        return Staff.from_row(row)
@@ -0,0 +1,158 @@
+from collections import Counter
+from uuid import UUID
+from src.database.profiles import SCAN
+from src.database.repositories.base_repository import BaseRepository
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StatsRepository(BaseRepository):
+    """Data access layer for the dashboard counter tables.
+
+    department_stats and hospital_stats hold server-side counters that the
+    other repositories bump on create and delete, so the dashboard can read
+    one tiny row per department instead of counting whole partitions.
+    Counters can drift if a write fails half-way; ``reconcile`` repairs them.
+    """
+
+    # ---------------------------------------------------------- #
+    # UPDATE – counter deltas
+    # ---------------------------------------------------------- #
+    def adjust_department(
+        self, department_id: UUID, patients: int = 0, staff: int = 0
+    ):
+        """Add (or subtract) from a department's patient and staff counters."""
+        query = """
+        UPDATE department_stats
+        SET patient_count = patient_count + ?, staff_count = staff_count + ?
+        WHERE department_id = ?
+        """
+        try:
+            self._execute(query, [patients, staff, department_id])
+        except Exception as e:
+            logger.warning(
+                f"Could not update stats for department {department_id}: {e}"
+            )
+
+    def adjust_hospital(self, hospital_id: UUID, departments: int = 0):
+        """Add (or subtract) from a hospital's department counter."""
+        query = """
+        UPDATE hospital_stats
+        SET department_count = department_count + ?
+        WHERE hospital_id = ?
+        """
+        try:
+            self._execute(query, [departments, hospital_id])
+        except Exception as e:
+            logger.warning(f"Could not update stats for hospital {hospital_id}: {e}")
+
+    # ---------------------------------------------------------- #
+    # READ
+    # ---------------------------------------------------------- #
+    def department_counts(self) -> dict:
+        """Return {department_id: (patient_count, staff_count)}."""
+        query = "SELECT department_id, patient_count, staff_count FROM department_stats"
+        try:
+            return {
+                row.department_id: (row.patient_count or 0, row.staff_count or 0)
+                for row in self._execute(query, profile=SCAN)
+            }
+        except Exception as e:
+            logger.error(f"Error reading department stats: {e}")
+            return {}
+
+    def hospital_counts(self) -> dict:
+        """Return {hospital_id: department_count}."""
+        query = "SELECT hospital_id, department_count FROM hospital_stats"
+        try:
+            return {
+                row.hospital_id: row.department_count or 0
+                for row in self._execute(query, profile=SCAN)
+            }
+        except Exception as e:
+            logger.error(f"Error reading hospital stats: {e}")
+            return {}
+
+    # ---------------------------------------------------------- #
+    # Maintenance
+    # ---------------------------------------------------------- #
+    def reconcile(self, **scan_options) -> dict:
+        """
+        Rebuild every counter from parallel scans of the source tables.
+
+        Counter columns cannot be overwritten, so the difference between the
+        scanned count and the stored counter is applied as a delta.
+
+        Args:
+            **scan_options: TokenRangeScanner options (splits, parallelism, ...)
+
+        Returns:
+            dict: number of counters corrected per table
+        """
+        patients = Counter(
+            row.department_id
+            for row in self._scan("patients_bucketed", ("department_id", "bucket"),
+                                  None, columns="department_id", **scan_options)
+        )
+        staff = Counter(
+            row.department_id
+            for row in self._scan("staff_bucketed", ("department_id", "bucket"),
+                                  None, columns="department_id", **scan_options)
+        )
+        departments = Counter(
+            row.hospital_id
+            for row in self._scan("departments", "hospital_id", None,
+                                  columns="hospital_id", **scan_options)
+        )
+
+        query_dept = """
+        UPDATE department_stats
+        SET patient_count = patient_count + ?, staff_count = staff_count + ?
+        WHERE department_id = ?
+        """
+        query_hosp = """
+        UPDATE hospital_stats
+        SET department_count = department_count + ?
+        WHERE hospital_id = ?
+        """
+
+        futures = []
+        stored = self.department_counts()
+        for department_id in set(patients) | set(staff) | set(stored):
+            old_patients, old_staff = stored.get(department_id, (0, 0))
+            delta_patients = patients[department_id] - old_patients
+            delta_staff = staff[department_id] - old_staff
+            if delta_patients or delta_staff:
+                futures.append(
+                    self._execute_async(
+                        query_dept, [delta_patients, delta_staff, department_id]
+                    )
+                )
+        fixed_departments = len(futures)
+
+        stored = self.hospital_counts()
+        for hospital_id in set(departments) | set(stored):
+            delta = departments[hospital_id] - stored.get(hospital_id, 0)
+            if delta:
+                futures.append(self._execute_async(query_hosp, [delta, hospital_id]))
+
+        for future in futures:
+            future.result()
+
+        summary = {
+            "department_stats": fixed_departments,
+            "hospital_stats": len(futures) - fixed_departments,
+        }
+        logger.info(f"Reconciled counters: {summary}")
+        return summary
+
+
+if __name__ == "__main__":
+    """Run counter reconciliation standalone."""
+    from src.database.connection import close_shared_connection, get_repositories
+
+    try:
+        get_repositories().stats.reconcile()
+    finally:
+        close_shared_connection()
@@ -0,0 +1,44 @@
+"""Driver row factory that decodes result rows straight into model objects.
+
+The driver's default ``named_tuple_factory`` builds a new namedtuple class
+per page and one tuple per row, which the repositories then copy into a
+model. ``model_row_factory`` recognizes full entity rows by their column
+names and builds the models directly from the decoded value tuples;
+anything else (projections, index and counter tables, system queries)
+falls back to namedtuples.
+"""
+from cassandra.query import named_tuple_factory
+
+from src.models.department import Department
+from src.models.hospital import Hospital
+from src.models.patient import Patient
+from src.models.staff import Staff
+
+# Tried in order; the first model that accepts the column set wins
+MODELS = (Patient, Staff, Department, Hospital)
+
+_builders = {}  # column names tuple -> builder or None
+
+
+def _builder_for(colnames):
+    key = tuple(colnames)
+    try:
+        return _builders[key]
+    except KeyError:
+        pass
+
+    builder = None
+    for model in MODELS:
+        builder = model.row_builder(key)
+        if builder is not None:
+            break
+    _builders[key] = builder
+    return builder
+
+
+def model_row_factory(colnames, rows):
+    """Row factory for ``ExecutionProfile(row_factory=...)``."""
+    builder = _builder_for(colnames)
+    if builder is None:
+        return named_tuple_factory(colnames, rows)
+    return [builder(values) for values in rows]
@@ -0,0 +1,172 @@
+"""Parallel full-table scans split over the Murmur3 token ring.
+
+Instead of one coordinator paging through ``SELECT * FROM table``, the ring
+is cut into subranges that are read concurrently with
+``token(pk) > ? AND token(pk) <= ?``, so each request is served by the
+replicas owning that slice of the ring.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.database.profiles import SCAN
+from src.database.statement_cache import get_statement_cache
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MIN_TOKEN = -(2**63)
+MAX_TOKEN = 2**63 - 1
+
+_DONE = object()
+
+
+class ScanError(Exception):
+    """A token subrange still failed after all retries."""
+
+
+def split_token_ring(splits: int) -> list:
+    """
+    Cut the whole Murmur3 ring into ``splits`` contiguous ``(start, end]`` ranges.
+
+    MIN_TOKEN itself is never assigned to a key, so the ranges cover every row.
+    """
+    step = (MAX_TOKEN - MIN_TOKEN) // splits
+    bounds = [MIN_TOKEN + i * step for i in range(splits)] + [MAX_TOKEN]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class TokenRangeScanner:
+    """Streams every row of a table using concurrent token-range queries."""
+
+    def __init__(
+        self,
+        session,
+        table: str,
+        partition_key,
+        columns: str = "*",
+        transform=None,
+        splits: int = None,
+        parallelism: int = None,
+        fetch_size: int = 1000,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        profile=SCAN,
+    ):
+        """
+        Args:
+            session:       Active Cassandra session (keyspace already set)
+            table:         Table to scan
+            partition_key: Partition key column, or a tuple for composite keys
+            columns:       Column list for the SELECT
+            transform:     Optional callable applied to every row
+            splits:        Number of token subranges (default: 16 per node)
+            parallelism:   Subranges read at once (default: 4 per node)
+            fetch_size:    Rows per page within a subrange
+            max_retries:   Attempts per page before the scan fails
+            retry_delay:   Base back-off in seconds between attempts
+            profile:       Execution profile for the range queries
+        """
+        if isinstance(partition_key, str):
+            partition_key = (partition_key,)
+        nodes = max(1, len(session.cluster.metadata.all_hosts()))
+
+        self.session = session
+        self.transform = transform
+        self.splits = splits or nodes * 16
+        self.parallelism = parallelism or nodes * 4
+        self.fetch_size = fetch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.profile = profile
+
+        pk = ", ".join(partition_key)
+        self.query = (
+            f"SELECT {columns} FROM {table} "
+            f"WHERE token({pk}) > ? AND token({pk}) <= ?"
+        )
+
+    def scan(self):
+        """Yield every row (transformed, if a transform was given)."""
+        pages = queue.Queue(maxsize=self.parallelism * 2)
+        stop = threading.Event()
+        ranges = split_token_ring(self.splits)
+        executor = ThreadPoolExecutor(
+            max_workers=self.parallelism, thread_name_prefix="token-scan"
+        )
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def worker(start, end):
+            try:
+                self._scan_range(start, end, put, stop)
+                put(_DONE)
+            except Exception as e:
+                put(ScanError(f"Token range ({start}, {end}] failed: {e}"))
+
+        try:
+            for start, end in ranges:
+                executor.submit(worker, start, end)
+
+            remaining = len(ranges)
+            while remaining:
+                item = pages.get()
+                if item is _DONE:
+                    remaining -= 1
+                elif isinstance(item, ScanError):
+                    raise item
+                elif self.transform is None:
+                    yield from item
+                else:
+                    for row in item:
+                        yield self.transform(row)
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def scan_with(self, callback) -> int:
+        """Call ``callback(row)`` for every row; return the number of rows."""
+        count = 0
+        for row in self.scan():
+            callback(row)
+            count += 1
+        return count
+
+    def _scan_range(self, start: int, end: int, emit, stop):
+        """Page through one subrange, resuming from the last page on failure."""
+        prepared = get_statement_cache(self.session).get(self.query, self.profile)
+        statement = prepared.bind([start, end])
+        statement.fetch_size = self.fetch_size
+
+        paging_state = None
+        attempts = 0
+        while not stop.is_set():
+            try:
+                result = self.session.execute(
+                    statement,
+                    execution_profile=self.profile,
+                    paging_state=paging_state,
+                )
+            except Exception as e:
+                attempts += 1
+                if attempts > self.max_retries:
+                    raise
+                logger.warning(
+                    f"Retrying token range ({start}, {end}] "
+                    f"(attempt {attempts}/{self.max_retries}): {e}"
+                )
+                time.sleep(self.retry_delay * attempts)
+                continue
+
+            attempts = 0
+            emit(list(result.current_rows))
+            paging_state = result.paging_state
+            if not paging_state:
+                return
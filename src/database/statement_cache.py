@@ -0,0 +1,93 @@
+"""Prepared-statement cache shared by all repositories of a session."""
+import threading
+import weakref
+
+from cassandra.cluster import EXEC_PROFILE_DEFAULT
+from src.database.profiles import fetch_size_for, is_read
+
+
+class StatementCache:
+    """Prepares each CQL statement once per (query text, execution profile).
+
+    Statements start with the page size of their profile, so a bound
+    statement only sets ``fetch_size`` when it needs something else. Reads
+    are marked idempotent, which lets the driver speculate on them.
+
+    The driver already re-prepares transparently when a node answers
+    UNPREPARED after a restart; ``reprepare`` covers the remaining case where
+    a cached statement is rejected after a schema change.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self._statements = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reprepares = 0
+
+    def get(self, query: str, profile=EXEC_PROFILE_DEFAULT):
+        """Return the prepared statement for ``query``, preparing it on a miss."""
+        key = (query, profile)
+        with self._lock:
+            prepared = self._statements.get(key)
+            if prepared is not None:
+                self.hits += 1
+                return prepared
+            self.misses += 1
+
+        prepared = self._prepare(query, profile)
+        with self._lock:
+            # Another thread may have prepared it meanwhile; keep the first one
+            return self._statements.setdefault(key, prepared)
+
+    def reprepare(self, query: str, profile=EXEC_PROFILE_DEFAULT):
+        """Drop a stale statement and prepare it again."""
+        prepared = self._prepare(query, profile)
+        with self._lock:
+            self._statements[(query, profile)] = prepared
+            self.reprepares += 1
+        return prepared
+
+    def _prepare(self, query: str, profile):
+        prepared = self._session.prepare(query)
+        fetch_size = fetch_size_for(profile)
+        if fetch_size:
+            prepared.fetch_size = fetch_size
+        prepared.is_idempotent = is_read(query)
+        return prepared
+
+    def invalidate(self, query: str = None):
+        """Forget one statement (all profiles) or the whole cache."""
+        with self._lock:
+            if query is None:
+                self._statements.clear()
+                return
+            for key in [k for k in self._statements if k[0] == query]:
+                del self._statements[key]
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._statements),
+                "hits": self.hits,
+                "misses": self.misses,
+                "reprepares": self.reprepares,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_caches = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_statement_cache(session) -> StatementCache:
+    """Return the statement cache bound to ``session``, creating it once."""
+    with _caches_lock:
+        cache = _caches.get(session)
+        if cache is None:
+            cache = StatementCache(session)
+            _caches[session] = cache
+        return cache
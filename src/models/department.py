@@ -1,3 +1,4 @@
+from functools import lru_cache
 from uuid import uuid4
 from datetime import datetime
 
@@ -5,6 +6,16 @@ from datetime import datetime
 class Department:
     """Department class – belongs to a Hospital (1:*) and manages Patients & Staff."""
 
+    __slots__ = (
+        "department_id", "hospital_id", "name", "description", "head_doctor_id",
+        "created_at", "patients", "staff_members",
+    )
+    # Columns read by from_row, in row_builder order
+    ROW_COLUMNS = (
+        "department_id", "hospital_id", "name", "description",
+        "head_doctor_id", "created_at",
+    )
+
     def __init__(
         self,
         name: str,
@@ -25,6 +36,51 @@ class Department:
         self.patients = []       # Department "manages" many Patients
         self.staff_members = []  # Department "employs" many Staff
 
+    @classmethod
+    def from_row(cls, row) -> "Department":
+        """
+        Hydrate from a database row (or another Department) through
+        ``row_builder``, without generating ids or timestamps. Columns the
+        row lacks read as None.
+        """
+        values = tuple(getattr(row, column, None) for column in cls.ROW_COLUMNS)
+        return cls.row_builder(cls.ROW_COLUMNS)(values)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def row_builder(cls, columns):
+        """
+        Return a ``values -> Department`` builder for rows with these columns.
+
+        Used by the driver row factory to skip the namedtuple step; returns
+        None when the columns do not describe a department row.
+        """
+        index = {name: i for i, name in enumerate(columns)}
+        try:
+            did, hid, name, description, head, created = (
+                index[c] for c in (
+                    "department_id", "hospital_id", "name", "description",
+                    "head_doctor_id", "created_at",
+                )
+            )
+        except KeyError:
+            return None
+        new = cls.__new__
+
+        def build(values):
+            department = new(cls)
+            department.department_id = values[did]
+            department.hospital_id = values[hid]
+            department.name = values[name]
+            department.description = values[description]
+            department.head_doctor_id = values[head]
+            department.created_at = values[created]
+            department.patients = []
+            department.staff_members = []
+            return department
+
+        return build
+
     # ------------------------------------------------------------------ #
     # UML: add_patient(patient: Patient): void
     # ------------------------------------------------------------------ #
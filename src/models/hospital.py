@@ -1,3 +1,4 @@
+from functools import lru_cache
 from uuid import uuid4
 from datetime import datetime
 
@@ -5,6 +6,14 @@ from datetime import datetime
 class Hospital:
     """Hospital class – top-level container that owns departments."""
 
+    __slots__ = (
+        "hospital_id", "name", "location", "phone", "created_at", "departments"
+    )
+    # Columns read by from_row, in row_builder order
+    ROW_COLUMNS = (
+        "hospital_id", "name", "location", "phone", "created_at",
+    )
+
     def __init__(
         self,
         name: str,
@@ -20,6 +29,47 @@ class Hospital:
         self.created_at = created_at or datetime.now()
         self.departments = []  # in-memory cache of Department objects
 
+    @classmethod
+    def from_row(cls, row) -> "Hospital":
+        """
+        Hydrate from a database row (or another Hospital) through
+        ``row_builder``, without generating ids or timestamps. Columns the
+        row lacks read as None.
+        """
+        values = tuple(getattr(row, column, None) for column in cls.ROW_COLUMNS)
+        return cls.row_builder(cls.ROW_COLUMNS)(values)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def row_builder(cls, columns):
+        """
+        Return a ``values -> Hospital`` builder for rows with these columns.
+
+        Used by the driver row factory to skip the namedtuple step; returns
+        None when the columns do not describe a hospital row.
+        """
+        index = {name: i for i, name in enumerate(columns)}
+        try:
+            hid, name, location, phone, created = (
+                index[c]
+                for c in ("hospital_id", "name", "location", "phone", "created_at")
+            )
+        except KeyError:
+            return None
+        new = cls.__new__
+
+        def build(values):
+            hospital = new(cls)
+            hospital.hospital_id = values[hid]
+            hospital.name = values[name]
+            hospital.location = values[location]
+            hospital.phone = values[phone]
+            hospital.created_at = values[created]
+            hospital.departments = []
+            return hospital
+
+        return build
+
     # ------------------------------------------------------------------ #
     # UML: add_department(department: Department): void
     # ------------------------------------------------------------------ #
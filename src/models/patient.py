@@ -1,10 +1,27 @@
+from functools import lru_cache
 from uuid import uuid4
-from datetime import datetime
 from src.models.person import Person
 
+# Marks a medical record that lives in patient_records and was not read yet
+NOT_LOADED = object()
+
 
 class Patient(Person):
-    """Patient class extending Person – managed by a Department (UML "manages")."""
+    """Patient class extending Person – managed by a Department (UML "manages").
+
+    ``medical_record`` is stored apart from the patient row and loaded on
+    first access through the record loader the repository attaches.
+    """
+
+    __slots__ = (
+        "patient_id", "first_name", "last_name", "date_of_birth",
+        "phone", "department_id", "_medical_record", "_record_loader",
+    )
+    # Columns read by from_row, in row_builder order
+    ROW_COLUMNS = (
+        "patient_id", "age", "created_at", "first_name", "last_name",
+        "date_of_birth", "phone", "department_id", "medical_record",
+    )
 
     def __init__(
         self,
@@ -18,17 +35,99 @@ class Patient(Person):
         medical_record: str = None,
         created_at=None,
     ):
-        full_name = f"{first_name} {last_name}"
-        super().__init__(name=full_name, age=age)
-
         self.patient_id = patient_id or uuid4()
+        # Full name is derived on access (see ``name``), not stored
+        super().__init__(
+            name=None, age=age, person_id=self.patient_id, created_at=created_at
+        )
+
         self.first_name = first_name
         self.last_name = last_name
         self.date_of_birth = date_of_birth
         self.phone = phone
         self.department_id = department_id   # FK → Department
-        self.medical_record = medical_record  # UML attribute
-        self.created_at = created_at or datetime.now()
+        self._medical_record = medical_record  # UML attribute
+        self._record_loader = None
+
+    @classmethod
+    def from_row(cls, row) -> "Patient":
+        """
+        Hydrate from a database row (or another Patient) through
+        ``row_builder``, without generating ids or timestamps. Columns the
+        row lacks read as None.
+        """
+        values = tuple(getattr(row, column, None) for column in cls.ROW_COLUMNS)
+        return cls.row_builder(cls.ROW_COLUMNS)(values)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def row_builder(cls, columns):
+        """
+        Return a ``values -> Patient`` builder for rows with these columns.
+
+        Used by the driver row factory to skip the namedtuple step; returns
+        None when the columns do not describe a patient row.
+        """
+        index = {name: i for i, name in enumerate(columns)}
+        try:
+            pid, age, created, first, last, dob, phone, dept = (
+                index[c] for c in (
+                    "patient_id", "age", "created_at", "first_name",
+                    "last_name", "date_of_birth", "phone", "department_id",
+                )
+            )
+        except KeyError:
+            return None
+        record = index.get("medical_record")
+        new = cls.__new__
+
+        def build(values):
+            patient = new(cls)
+            patient.patient_id = patient.person_id = values[pid]
+            patient._name = None
+            patient.age = values[age]
+            patient.created_at = values[created]
+            patient.first_name = values[first]
+            patient.last_name = values[last]
+            patient.date_of_birth = values[dob]
+            patient.phone = values[phone]
+            patient.department_id = values[dept]
+            value = None if record is None else values[record]
+            patient._medical_record = NOT_LOADED if value is None else value
+            patient._record_loader = None
+            return patient
+
+        return build
+
+    @property
+    def medical_record(self) -> str:
+        if self._medical_record is NOT_LOADED:
+            loader = self._record_loader
+            self._medical_record = loader(self.patient_id) if loader else None
+        return self._medical_record
+
+    @medical_record.setter
+    def medical_record(self, value: str):
+        self._medical_record = value
+
+    @property
+    def record_loaded(self) -> bool:
+        """True once the medical record is in memory."""
+        return self._medical_record is not NOT_LOADED
+
+    def set_record_loader(self, loader) -> None:
+        """Set the ``patient_id -> medical_record`` callable used on access."""
+        self._record_loader = loader
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            return f"{self.first_name} {self.last_name}"
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
 
     # ------------------------------------------------------------------ #
     # UML: view_record(): String
@@ -5,11 +5,21 @@ from datetime import datetime
 class Person:
     """Base Person class – parent of Patient and Staff (UML inheritance)."""
 
-    def __init__(self, name: str, age: int, person_id=None):
+    __slots__ = ("person_id", "_name", "age", "created_at")
+
+    def __init__(self, name: str, age: int, person_id=None, created_at=None):
         self.person_id = person_id or uuid4()
-        self.name = name
+        self._name = name
         self.age = age
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
 
     def view_info(self) -> str:
         """Display person information."""
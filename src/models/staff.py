@@ -1,11 +1,18 @@
+from functools import lru_cache
 from uuid import uuid4
-from datetime import datetime
 from src.models.person import Person
 
 
 class Staff(Person):
     """Staff class extending Person – employed by a Department (UML "employs")."""
 
+    __slots__ = ("staff_id", "first_name", "last_name", "position", "department_id")
+    # Columns read by from_row, in row_builder order
+    ROW_COLUMNS = (
+        "staff_id", "age", "created_at", "first_name", "last_name",
+        "position", "department_id",
+    )
+
     def __init__(
         self,
         first_name: str,
@@ -16,15 +23,71 @@ class Staff(Person):
         department_id=None,
         created_at=None,
     ):
-        full_name = f"{first_name} {last_name}"
-        super().__init__(name=full_name, age=age)
-
         self.staff_id = staff_id or uuid4()
+        # Full name is derived on access (see ``name``), not stored
+        super().__init__(
+            name=None, age=age, person_id=self.staff_id, created_at=created_at
+        )
+
         self.first_name = first_name
         self.last_name = last_name
         self.position = position              # UML attribute
         self.department_id = department_id    # FK → Department
-        self.created_at = created_at or datetime.now()
+
+    @classmethod
+    def from_row(cls, row) -> "Staff":
+        """
+        Hydrate from a database row (or another Staff) through
+        ``row_builder``, without generating ids or timestamps. Columns the
+        row lacks read as None.
+        """
+        values = tuple(getattr(row, column, None) for column in cls.ROW_COLUMNS)
+        return cls.row_builder(cls.ROW_COLUMNS)(values)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def row_builder(cls, columns):
+        """
+        Return a ``values -> Staff`` builder for rows with these columns.
+
+        Used by the driver row factory to skip the namedtuple step; returns
+        None when the columns do not describe a staff row.
+        """
+        index = {name: i for i, name in enumerate(columns)}
+        try:
+            sid, age, created, first, last, position, dept = (
+                index[c] for c in (
+                    "staff_id", "age", "created_at", "first_name",
+                    "last_name", "position", "department_id",
+                )
+            )
+        except KeyError:
+            return None
+        new = cls.__new__
+
+        def build(values):
+            staff = new(cls)
+            staff.staff_id = staff.person_id = values[sid]
+            staff._name = None
+            staff.age = values[age]
+            staff.created_at = values[created]
+            staff.first_name = values[first]
+            staff.last_name = values[last]
+            staff.position = values[position]
+            staff.department_id = values[dept]
+            return staff
+
+        return build
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            return f"{self.first_name} {self.last_name}"
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
 
     # ------------------------------------------------------------------ #
     # UML: view_info(): String
@@ -0,0 +1,55 @@
+"""Normalization helpers for denormalized lookup keys"""
+import re
+import unicodedata
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def normalize_phone(phone: str) -> str:
+    """
+    Reduce a phone number to its digits so formatting never affects lookups.
+
+    Args:
+        phone: Phone number as typed, e.g. "+20 123-4567890"
+
+    Returns:
+        str: Digits only, e.g. "201234567890" (empty string for None)
+    """
+    return _NON_DIGITS.sub("", phone or "")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Case-fold a name, strip accents and collapse whitespace.
+
+    Args:
+        name: Name as typed, e.g. "  Ahmed  Él-Sayed"
+
+    Returns:
+        str: Normalized name, e.g. "ahmed el-sayed" (empty string for None)
+    """
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+def name_prefixes(name: str, max_length: int, min_length: int = 1) -> set:
+    """
+    Return every prefix (``min_length`` to ``max_length`` characters) of a
+    name and of each of its words, so "Abdel Rahman" is found by "abd" and
+    by "rah".
+    """
+    normalized = normalize_name(name)
+    prefixes = set()
+    for word in {normalized, *normalized.split()}:
+        for end in range(min_length, min(len(word), max_length) + 1):
+            prefixes.add(word[:end])
+    return prefixes
+
+
+def matches_name_prefix(name: str, term: str) -> bool:
+    """Check whether a normalized ``term`` prefixes the name or one of its words."""
+    normalized = normalize_name(name)
+    return normalized.startswith(term) or any(
+        word.startswith(term) for word in normalized.split()
+    )
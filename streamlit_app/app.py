@@ -6,11 +6,16 @@ Single-page app with manual (view-based) navigation.
 import streamlit as st
 from pathlib import Path
 import sys
+import time
+
+# Timed from the top so the metrics endpoint sees whole reruns
+_rerun_started = time.perf_counter()
 
 # Make src/ importable
 BASE_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(BASE_DIR))
 
+from src.database.instrumentation import observe_rerun
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -143,33 +148,37 @@ st.sidebar.markdown(
 # ──────────────────────────────────────────────
 page = st.session_state["current_page"]
 
-if page == "dashboard":
-    from pages import dashboard
-    dashboard.render()
+try:
+    if page == "dashboard":
+        from pages import dashboard
+        dashboard.render()
 
-elif page == "manage_hospitals":
-    from pages import manage_hospitals
-    manage_hospitals.render()
+    elif page == "manage_hospitals":
+        from pages import manage_hospitals
+        manage_hospitals.render()
 
-elif page == "manage_departments":
-    from pages import manage_departments
-    manage_departments.render()
+    elif page == "manage_departments":
+        from pages import manage_departments
+        manage_departments.render()
 
-elif page == "add_patient":
-    from pages import add_patient
-    add_patient.render()
+    elif page == "add_patient":
+        from pages import add_patient
+        add_patient.render()
 
-elif page == "search_patients":
-    from pages import search_patient
-    search_patient.render()
+    elif page == "search_patients":
+        from pages import search_patient
+        search_patient.render()
 
-elif page == "manage_staff":
-    from pages import manage_staff
-    manage_staff.render()
+    elif page == "manage_staff":
+        from pages import manage_staff
+        manage_staff.render()
 
-elif page == "settings":
-    from pages import settings
-    settings.render()
+    elif page == "settings":
+        from pages import settings
+        settings.render()
 
-else:
-    st.info("👈 Select a page from the sidebar.")
+    else:
+        st.info("👈 Select a page from the sidebar.")
+finally:
+    # Also runs when a page calls st.rerun() / st.stop()
+    observe_rerun(page, time.perf_counter() - _rerun_started)
@@ -28,13 +28,6 @@ FEATURES = {
     'prescriptions': False,  # Coming soon
 }
 
-# Cache configuration
-CACHE_TTL = 300  # 5 minutes
-
-# Pagination
-DEFAULT_PAGE_SIZE = 10
-MAX_PAGE_SIZE = 100
-
 # Date formats
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
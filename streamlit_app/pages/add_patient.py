@@ -11,28 +11,15 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.database.repositories.hospital_repository import HospitalRepository
-from src.database.repositories.department_repository import DepartmentRepository
-from src.database.repositories.patient_repository import PatientRepository
+from src.database.connection import get_repositories
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-@st.cache_resource
 def get_repos():
-    from src.database.connection import ScyllaDBConnection
-    from src.database.init_db import initialize_database
-
-    db = ScyllaDBConnection()
-    session = db.connect()
-    initialize_database(session)
-
-    return (
-        HospitalRepository(session=session),
-        DepartmentRepository(session=session),
-        PatientRepository(session=session),
-    )
+    repos = get_repositories()
+    return repos.hospitals, repos.departments, repos.patients
 
 
 def calculate_age(dob):
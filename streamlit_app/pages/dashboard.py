@@ -12,36 +12,26 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.database.repositories.hospital_repository import HospitalRepository
-from src.database.repositories.department_repository import DepartmentRepository
-from src.database.repositories.patient_repository import PatientRepository
-from src.database.repositories.staff_repository import StaffRepository
+from src.database.connection import get_repositories
+from src.database.frames import age_histogram, full_names, short_ids
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
 # ─────────────────────────────────────────────────────────── #
-# Cached repo accessors
+# Shared repo accessors
 # ─────────────────────────────────────────────────────────── #
-@st.cache_resource
 def get_repos():
     try:
-        from src.database.connection import ScyllaDBConnection
-        from src.database.init_db import initialize_database
-
-        db = ScyllaDBConnection()
-        session = db.connect()
-        initialize_database(session)
+        repos = get_repositories()
         return (
-            HospitalRepository(session=session),
-            DepartmentRepository(session=session),
-            PatientRepository(session=session),
-            StaffRepository(session=session),
+            repos.hospitals, repos.departments, repos.patients, repos.staff,
+            repos.stats,
         )
     except Exception as e:
         logger.error(f"Failed to connect: {e}")
-        return None, None, None, None
+        return None, None, None, None, None
 
 
 def render():
@@ -49,16 +39,26 @@ def render():
     st.markdown("Live overview of the entire hospital system")
     st.markdown("---")
 
-    hosp_repo, dept_repo, patient_repo, staff_repo = get_repos()
+    hosp_repo, dept_repo, patient_repo, staff_repo, stats_repo = get_repos()
     if hosp_repo is None:
         st.error("⚠️ Unable to connect to database.")
         return
 
-    # ───── Fetch all data ───── #
+    # ───── Fetch data ───── #
     hospitals = hosp_repo.get_all() or []
     departments = dept_repo.get_all() or []
-    patients = patient_repo.get_all() or []
-    staff = staff_repo.get_all() or []
+
+    # Counter rows: one tiny row per department / hospital
+    dept_counts = stats_repo.department_counts()
+    hosp_counts = stats_repo.hospital_counts()
+    patients_per_dept = [dept_counts.get(d.department_id, (0, 0))[0] for d in departments]
+    staff_per_dept = [dept_counts.get(d.department_id, (0, 0))[1] for d in departments]
+    depts_per_hosp = [hosp_counts.get(h.hospital_id, 0) for h in hospitals]
+    dept_names = [d.name for d in departments]
+
+    # Newest rows come from the day-bucketed feed tables, as columns
+    patients = patient_repo.recent_frame(15)
+    staff = staff_repo.recent_frame(15)
 
     # ───── Top-level metrics ───── #
     col1, col2, col3, col4 = st.columns(4)
@@ -67,9 +67,9 @@ def render():
     with col2:
         st.metric("🏢 Departments", len(departments))
     with col3:
-        st.metric("👥 Patients", len(patients))
+        st.metric("👥 Patients", sum(patients_per_dept))
     with col4:
-        st.metric("👔 Staff", len(staff))
+        st.metric("👔 Staff", sum(staff_per_dept))
 
     st.markdown("---")
 
@@ -79,18 +79,12 @@ def render():
     # Patients per department (pie)
     with col_left:
         st.markdown("### 👥 Patients by Department")
-        dept_patient_counts = {}
-        for d in departments:
-            dept_patient_counts[d.name] = len(
-                patient_repo.find_by_department(d.department_id)
-            )
-
-        if dept_patient_counts:
+        if departments:
             fig = go.Figure(
                 data=[
                     go.Pie(
-                        labels=list(dept_patient_counts.keys()),
-                        values=list(dept_patient_counts.values()),
+                        labels=dept_names,
+                        values=patients_per_dept,
                         marker=dict(
                             colors=[
                                 "#FF6B6B", "#4ECDC4", "#45B7D1",
@@ -108,16 +102,10 @@ def render():
     # Staff per department (bar)
     with col_right:
         st.markdown("### 👔 Staff by Department")
-        dept_staff_counts = {}
-        for d in departments:
-            dept_staff_counts[d.name] = len(
-                staff_repo.find_by_department(d.department_id)
-            )
-
-        if dept_staff_counts:
+        if departments:
             fig_bar = px.bar(
-                x=list(dept_staff_counts.keys()),
-                y=list(dept_staff_counts.values()),
+                x=dept_names,
+                y=staff_per_dept,
                 labels={"x": "Department", "y": "Staff Count"},
                 color_discrete_sequence=["#667eea"],
             )
@@ -130,14 +118,10 @@ def render():
 
     # ───── Departments per hospital (bar) ───── #
     st.markdown("### 🏥 Departments per Hospital")
-    hosp_dept_counts = {}
-    for h in hospitals:
-        hosp_dept_counts[h.name] = len(dept_repo.find_by_hospital(h.hospital_id))
-
-    if hosp_dept_counts:
+    if hospitals:
         fig_h = px.bar(
-            x=list(hosp_dept_counts.keys()),
-            y=list(hosp_dept_counts.values()),
+            x=[h.name for h in hospitals],
+            y=depts_per_hosp,
             labels={"x": "Hospital", "y": "Departments"},
             color_discrete_sequence=["#4ECDC4"],
         )
@@ -148,42 +132,58 @@ def render():
 
     st.markdown("---")
 
+    # ───── Age distribution (full scan, on demand) ───── #
+    st.markdown("### 🎂 Patient Age Distribution")
+    if st.checkbox("Load age distribution (reads every patient)"):
+        with st.spinner("Scanning patients…"):
+            ages = patient_repo.frame(columns=("department_id", "age"))
+        if len(ages):
+            histogram = age_histogram(ages)
+            fig_age = px.bar(
+                x=histogram.index.astype(str),
+                y=histogram.values,
+                labels={"x": "Age", "y": "Patients"},
+                color_discrete_sequence=["#FF6B6B"],
+            )
+            fig_age.update_layout(height=300, template="plotly_white")
+            st.plotly_chart(fig_age, use_container_width=True)
+        else:
+            st.info("No patients registered yet.")
+
+    st.markdown("---")
+
     # ───── Recent patients table ───── #
     st.markdown("### 📋 Recent Patients")
-    if patients:
-        rows = []
-        for p in patients[:15]:
-            rows.append(
-                {
-                    "Patient ID": str(p.patient_id)[:8] + "...",
-                    "Name": f"{p.first_name} {p.last_name}",
-                    "Age": p.age,
-                    "Phone": p.phone,
-                    "Department": str(p.department_id)[:8] + "...",
-                    "Medical Record": p.medical_record or "—",
-                    "Registered": p.created_at,
-                }
-            )
-        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    if len(patients):
+        table = pd.DataFrame(
+            {
+                "Patient ID": short_ids(patients["patient_id"]),
+                "Name": full_names(patients),
+                "Age": patients["age"],
+                "Phone": patients["phone"],
+                "Department": short_ids(patients["department_id"]),
+                "Registered": patients["created_at"],
+            }
+        )
+        st.dataframe(table, use_container_width=True, hide_index=True)
     else:
         st.info("No patients registered yet.")
 
     st.markdown("---")
 
     # ───── Recent staff table ───── #
-    st.markdown("### 📋 Staff Members")
-    if staff:
-        rows = []
-        for s in staff[:15]:
-            rows.append(
-                {
-                    "Staff ID": str(s.staff_id)[:8] + "...",
-                    "Name": f"{s.first_name} {s.last_name}",
-                    "Position": s.position,
-                    "Age": s.age,
-                    "Department": str(s.department_id)[:8] + "...",
-                }
-            )
-        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    st.markdown("### 📋 Recent Staff")
+    if len(staff):
+        table = pd.DataFrame(
+            {
+                "Staff ID": short_ids(staff["staff_id"]),
+                "Name": full_names(staff),
+                "Position": staff["position"],
+                "Age": staff["age"],
+                "Department": short_ids(staff["department_id"]),
+                "Joined": staff["created_at"],
+            }
+        )
+        st.dataframe(table, use_container_width=True, hide_index=True)
     else:
         st.info("No staff registered yet.")
@@ -10,26 +10,16 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.database.repositories.hospital_repository import HospitalRepository
-from src.database.repositories.department_repository import DepartmentRepository
+from src.database.connection import get_repositories
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-@st.cache_resource
 def get_repos():
     try:
-        from src.database.connection import ScyllaDBConnection
-        from src.database.init_db import initialize_database
-
-        db = ScyllaDBConnection()
-        session = db.connect()
-        initialize_database(session)
-        return (
-            HospitalRepository(session=session),
-            DepartmentRepository(session=session),
-        )
+        repos = get_repositories()
+        return repos.hospitals, repos.departments
     except Exception as e:
         logger.error(f"Failed to connect: {e}")
         return None, None
@@ -9,22 +9,15 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.database.repositories.hospital_repository import HospitalRepository
+from src.database.connection import get_repositories
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-@st.cache_resource
 def get_repo():
     try:
-        from src.database.connection import ScyllaDBConnection
-        from src.database.init_db import initialize_database
-
-        db = ScyllaDBConnection()
-        session = db.connect()
-        initialize_database(session)
-        return HospitalRepository(session=session)
+        return get_repositories().hospitals
     except Exception as e:
         logger.error(f"Failed to connect: {e}")
         return None
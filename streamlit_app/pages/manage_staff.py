@@ -12,28 +12,18 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.database.repositories.hospital_repository import HospitalRepository
-from src.database.repositories.department_repository import DepartmentRepository
-from src.database.repositories.staff_repository import StaffRepository
+from src.database.connection import get_repositories
+from src.database.loader import BatchLoader
+from src.database.name_index import MIN_PREFIX_LENGTH, is_searchable
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-@st.cache_resource
 def get_repos():
     try:
-        from src.database.connection import ScyllaDBConnection
-        from src.database.init_db import initialize_database
-
-        db = ScyllaDBConnection()
-        session = db.connect()
-        initialize_database(session)
-        return (
-            HospitalRepository(session=session),
-            DepartmentRepository(session=session),
-            StaffRepository(session=session),
-        )
+        repos = get_repositories()
+        return repos.hospitals, repos.departments, repos.staff
     except Exception as e:
         logger.error(f"Failed to connect: {e}")
         return None, None, None
@@ -166,16 +156,26 @@ def render():
     with st.expander("🔍 Search Staff by Name (across all departments)"):
         col1, col2 = st.columns(2)
         with col1:
-            s_first = st.text_input("First Name", key="staff_search_fn")
+            s_first = st.text_input(
+                "First Name", key="staff_search_fn",
+                help=f"At least {MIN_PREFIX_LENGTH} letters of one of the names",
+            )
         with col2:
-            s_last = st.text_input("Last Name", key="staff_search_ln")
+            s_last = st.text_input(
+                "Last Name", key="staff_search_ln",
+                help=f"At least {MIN_PREFIX_LENGTH} letters of one of the names",
+            )
 
-        if s_first or s_last:
+        if (s_first or s_last) and not is_searchable(s_first, s_last):
+            st.info(f"Type at least {MIN_PREFIX_LENGTH} letters of a name to search.")
+        elif s_first or s_last:
             results = staff_repo.find_by_name(s_first or None, s_last or None)
             if results:
+                departments = BatchLoader(dept_repo.find_by_id_async)
+                departments.load_many(s.department_id for s in results)
                 rows = []
                 for s in results:
-                    dept = dept_repo.find_by_id(s.department_id)
+                    dept = departments.load(s.department_id)
                     rows.append(
                         {
                             "Name": f"{s.first_name} {s.last_name}",
@@ -10,42 +10,37 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.database.repositories.department_repository import DepartmentRepository
-from src.database.repositories.patient_repository import PatientRepository
-from src.database.repositories.hospital_repository import HospitalRepository
+from src.config.settings import AppConfig
+from src.database.connection import get_repositories
+from src.database.loader import BatchLoader
+from src.database.name_index import MIN_PREFIX_LENGTH, is_searchable
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-@st.cache_resource
 def get_repos():
     try:
-        from src.database.connection import ScyllaDBConnection
-        from src.database.init_db import initialize_database
-
-        db = ScyllaDBConnection()
-        session = db.connect()
-        initialize_database(session)
-        return (
-            DepartmentRepository(session=session),
-            PatientRepository(session=session),
-            HospitalRepository(session=session),
-        )
+        repos = get_repositories()
+        return repos.departments, repos.patients, repos.hospitals
     except Exception as e:
         logger.error(f"Failed to connect: {e}")
-        return None, None
+        return None, None, None
 
 
-def _resolve_dept_name(dept_repo, department_id) -> str:
+def _resolve_dept_name(departments, department_id) -> str:
     """Look up department name; return short ID on miss."""
-    dept = dept_repo.find_by_id(department_id)
+    dept = departments.load(department_id)
     return dept.name if dept else str(department_id)[:8] + "…"
 
-def _resolve_hosp_name(hosp_repo, hospital_id) -> str:
-    """Look up hospital name; return short ID on miss."""
-    hosp = hosp_repo.find_by_id(hospital_id)
-    return hosp.name if hosp else str(hospital_id)[:8] + "…"
+
+def _resolve_hosp_name(departments, hospitals, department_id) -> str:
+    """Look up the department's hospital name; return short ID on miss."""
+    dept = departments.load(department_id)
+    if not dept:
+        return "—"
+    hosp = hospitals.load(dept.hospital_id)
+    return hosp.name if hosp else str(dept.hospital_id)[:8] + "…"
 
 
 def render():
@@ -108,11 +103,19 @@ def render():
     elif search_type == "Name":
         col1, col2 = st.columns(2)
         with col1:
-            first_name = st.text_input("First Name", placeholder="Ahmed")
+            first_name = st.text_input(
+                "First Name", placeholder="Ahmed",
+                help=f"At least {MIN_PREFIX_LENGTH} letters of one of the names",
+            )
         with col2:
-            last_name = st.text_input("Last Name", placeholder="Hassan")
+            last_name = st.text_input(
+                "Last Name", placeholder="Hassan",
+                help=f"At least {MIN_PREFIX_LENGTH} letters of one of the names",
+            )
 
-        if first_name or last_name:
+        if (first_name or last_name) and not is_searchable(first_name, last_name):
+            st.info(f"Type at least {MIN_PREFIX_LENGTH} letters of a name to search.")
+        elif first_name or last_name:
             with st.spinner("Searching…"):
                 search_results = patient_repo.find_by_name(
                     first_name or None, last_name or None
@@ -124,23 +127,55 @@ def render():
         phone = st.text_input("Phone Number", placeholder="+20 123-4567890")
         if phone:
             with st.spinner("Searching…"):
-                all_p = patient_repo.get_all() or []
-                search_results = [p for p in all_p if p.phone == phone]
+                search_results = patient_repo.find_by_phone(phone)
             if not search_results:
                 st.warning(f"❌ No patient with phone: {phone}")
 
     elif search_type == "View All":
+        page_size = int(
+            st.number_input(
+                "Rows per page",
+                min_value=1,
+                max_value=AppConfig.MAX_PAGE_SIZE,
+                value=AppConfig.DEFAULT_PAGE_SIZE,
+            )
+        )
+        # One cursor per visited page; reset when the page size changes
+        if st.session_state.get("view_all_page_size") != page_size:
+            st.session_state["view_all_page_size"] = page_size
+            st.session_state["view_all_cursors"] = [None]
+        cursors = st.session_state["view_all_cursors"]
+
         with st.spinner("Loading…"):
-            search_results = patient_repo.get_all() or []
+            page = patient_repo.get_page(page_size, cursors[-1])
+        search_results = page.items
         if not search_results:
             st.info("No patients in the system yet.")
 
+        prev_col, info_col, next_col = st.columns(3)
+        with prev_col:
+            if st.button("⬅️ Previous", disabled=len(cursors) == 1, use_container_width=True):
+                cursors.pop()
+                st.rerun()
+        with info_col:
+            st.caption(f"Page {len(cursors)}")
+        with next_col:
+            if st.button("Next ➡️", disabled=not page.has_more, use_container_width=True):
+                cursors.append(page.cursor)
+                st.rerun()
+
     # ─────────────────────────── Display results ─── #
     if search_results:
         st.markdown(
             f"### 📋 Results ({len(search_results)} patient{'s' if len(search_results) != 1 else ''})"
         )
 
+        # Resolve every department and hospital once, in one wave each
+        departments = BatchLoader(dept_repo.find_by_id_async)
+        hospitals = BatchLoader(hosp_repo.find_by_id_async)
+        depts = departments.load_many(p.department_id for p in search_results)
+        hospitals.load_many(d.hospital_id for d in depts.values() if d)
+
         tab1, tab2 = st.tabs(["Table View", "Detailed View"])
 
         with tab1:
@@ -154,9 +189,8 @@ def render():
                         "Age": p.age,
                         "Phone": p.phone,
                         "DOB": p.date_of_birth,
-                        "Department": _resolve_dept_name(dept_repo, p.department_id),
-                        "Hospital": _resolve_hosp_name(hosp_repo, dept_repo.find_by_id(p.department_id).hospital_id) if dept_repo.find_by_id(p.department_id) else "—",
-                        "Medical Record": p.medical_record or "—",
+                        "Department": _resolve_dept_name(departments, p.department_id),
+                        "Hospital": _resolve_hosp_name(departments, hospitals, p.department_id),
                         "Registered": p.created_at,
                     }
                 )
@@ -166,8 +200,8 @@ def render():
 
         with tab2:
             for i, p in enumerate(search_results):
-                dept_name = _resolve_dept_name(dept_repo, p.department_id)
-                hosp_name = _resolve_hosp_name(hosp_repo, dept_repo.find_by_id(p.department_id).hospital_id) if dept_repo.find_by_id(p.department_id) else "—"
+                dept_name = _resolve_dept_name(departments, p.department_id)
+                hosp_name = _resolve_hosp_name(departments, hospitals, p.department_id)
                 with st.expander(
                     f"👤 {p.first_name} {p.last_name} (ID: {str(p.patient_id)[:8]}…)",
                     expanded=(i == 0),
@@ -186,8 +220,7 @@ def render():
                         st.write(f"**Hospital:** {hosp_name}")
                         st.write(f"**Dept ID:** {str(p.department_id)[:8]}…")
                     with col3:
-                        st.markdown("**Medical & System Info**")
-                        st.write(f"**Medical Record:** {p.medical_record or '—'}")
+                        st.markdown("**System Info**")
                         st.write(f"**Patient ID:** {p.patient_id}")
                         st.write(f"**Registered:** {p.created_at}")
 
@@ -197,20 +230,24 @@ def render():
                         if st.button("📝 Edit", key=f"edit_{i}", use_container_width=True):
                             st.info("Edit functionality coming soon…")
                     with a2:
-                        if st.button("📄 Full Record", key=f"view_{i}", use_container_width=True):
-                            st.info("Full record view coming soon…")
+                        # Medical records are stored apart and read only on request
+                        show_record = st.button(
+                            "📄 Full Record", key=f"view_{i}", use_container_width=True
+                        )
                     with a3:
                         if st.button("🗑️ Delete", key=f"del_{i}", use_container_width=True):
                             if patient_repo.delete(p.department_id, p.patient_id):
                                 st.success("✅ Patient deleted.")
                             else:
                                 st.error("❌ Deletion failed.")
+                    if show_record or p.record_loaded:
+                        st.markdown(f"**Medical Record:** {p.medical_record or '—'}")
 
     # Tips
     with st.expander("💡 Search Tips"):
         st.markdown(
             "- **Patient ID:** use the full UUID\n"
-            "- **Name:** search by first, last, or both\n"
-            "- **Phone:** enter the exact phone number\n"
-            "- **View All:** lists every patient (may be slow on large datasets)"
+            "- **Name:** type the start of a first name, last name, or both (case-insensitive)\n"
+            "- **Phone:** spaces, dashes and '+' are ignored\n"
+            "- **View All:** pages through every patient"
         )
@@ -9,6 +9,14 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from src.database.connection import (
+    get_consistency,
+    get_pool_stats,
+    get_speculation_stats,
+    set_consistency,
+)
+from src.database.instrumentation import get_query_metrics
+from src.database.profiles import OLTP_READ, OLTP_WRITE
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -108,13 +116,36 @@ def render():
             help="ScyllaDB keyspace"
         )
     
+    consistency_options = ["ONE", "LOCAL_ONE", "LOCAL_QUORUM", "QUORUM"]
+    current_consistency = {
+        OLTP_READ: get_consistency(OLTP_READ),
+        OLTP_WRITE: get_consistency(OLTP_WRITE),
+    }
+
+    def consistency_select(label, profile, help_text):
+        current = current_consistency[profile]
+        # Keep a level set elsewhere selectable, so saving never swaps it out
+        options = consistency_options + [
+            level for level in [current] if level not in consistency_options
+        ]
+        return st.selectbox(
+            label, options=options, index=options.index(current), help=help_text
+        )
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        read_consistency = consistency_select(
+            "Read Consistency", OLTP_READ,
+            "Consistency of interactive reads (applied on save)",
+        )
+
     with col2:
-        consistency_level = st.selectbox(
-            "Consistency Level",
-            options=["ONE", "LOCAL_QUORUM", "QUORUM"],
-            index=1,
-            help="Database consistency level"
+        write_consistency = consistency_select(
+            "Write Consistency", OLTP_WRITE,
+            "Consistency of interactive writes (applied on save)",
         )
+    chosen_consistency = {OLTP_READ: read_consistency, OLTP_WRITE: write_consistency}
     
     col1, col2 = st.columns(2)
     
@@ -126,8 +157,48 @@ def render():
     
     with col2:
         if st.button("💾 Save Settings", use_container_width=True):
+            # Only profiles whose level was actually changed are touched
+            changed = {
+                profile: level
+                for profile, level in chosen_consistency.items()
+                if level != current_consistency[profile]
+            }
+            for profile, level in changed.items():
+                set_consistency(level, profile)
             st.success("✅ Settings saved successfully!")
-            logger.info("Settings updated")
+            logger.info(f"Settings updated (consistency changes {changed or 'none'})")
+    
+    # Connection pool statistics for the shared session
+    pool = get_pool_stats()
+    if pool:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Connected Hosts", pool["hosts"])
+        with col2:
+            st.metric("Open Connections", pool["open_connections"])
+        with col3:
+            st.metric("In-flight Requests", pool["in_flight"])
+    else:
+        st.caption("No shared database session has been opened yet.")
+    
+    # Speculative executions of interactive reads
+    speculation = get_speculation_stats()
+    if speculation:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Speculative Reads Fired", speculation["fired"],
+                      help=f"Out of {speculation['requests']} tracked reads")
+        with col2:
+            st.metric("Speculative Reads Won", speculation["won"],
+                      help="Speculative attempt answered before the original")
+        with col3:
+            st.metric("Speculation Delay", f"{speculation['delay_ms']} ms")
+    
+    # Per-statement latency, slowest p99 first
+    query_stats = get_query_metrics().snapshot()
+    if query_stats:
+        with st.expander(f"🐢 Query Statistics ({len(query_stats)} statements)"):
+            st.dataframe(query_stats[:25], use_container_width=True, hide_index=True)
     
     st.markdown("---")
     
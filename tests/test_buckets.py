@@ -0,0 +1,30 @@
+from uuid import UUID, uuid4
+
+from src.config.settings import DatabaseConfig
+from src.database.buckets import all_buckets, bucket_count, bucket_for, concat
+
+
+def test_bucket_for_is_stable_and_in_range():
+    entity_id = uuid4()
+
+    assert bucket_for(entity_id) == bucket_for(entity_id)
+    assert bucket_for(str(entity_id)) == bucket_for(entity_id)
+    assert 0 <= bucket_for(entity_id) < bucket_count()
+
+
+def test_bucket_for_follows_the_configured_count(monkeypatch):
+    monkeypatch.setattr(DatabaseConfig, "PARTITION_BUCKETS", 4)
+    entity_id = UUID(int=4 * 1000 + 3)
+
+    assert bucket_for(entity_id) == 3
+    assert list(all_buckets()) == [0, 1, 2, 3]
+
+
+def test_bucket_for_spreads_ids_over_every_bucket():
+    seen = {bucket_for(uuid4()) for _ in range(500)}
+
+    assert seen == set(all_buckets())
+
+
+def test_concat_joins_per_bucket_results():
+    assert concat([1], [], [2, 3]) == [1, 2, 3]
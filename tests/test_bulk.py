@@ -0,0 +1,51 @@
+from cassandra.query import BatchStatement
+
+from src.database.bulk import BulkRow, _plan
+
+
+class FakeRepository:
+    def _prepare(self, query, profile=None):
+        return f"prepared {query}"
+
+
+def row(entity_id, partition, extras=()):
+    return BulkRow(
+        entity_id=entity_id,
+        partition_key=(partition,),
+        main=("INSERT main %s", [entity_id]),
+        extras=[("INSERT index", [entity_id]) for _ in extras],
+    )
+
+
+def test_plan_batches_main_rows_per_partition():
+    rows = {0: row("a", "p1"), 1: row("b", "p2"), 2: row("c", "p1"), 3: row("d", "p1")}
+
+    units = _plan(FakeRepository(), rows, group_by_partition=True, batch_size=2)
+
+    mains = [(positions, is_main) for statement, _, positions, is_main in units]
+    assert mains == [([0, 2], True), ([3], True), ([1], True)]
+    assert all(isinstance(unit[0], BatchStatement) for unit in units)
+    assert len(units[0][0]) == 2
+
+
+def test_plan_without_grouping_sends_one_statement_per_row():
+    rows = {0: row("a", "p1"), 1: row("b", "p1")}
+
+    units = _plan(FakeRepository(), rows, group_by_partition=False, batch_size=20)
+
+    assert units == [
+        ("prepared INSERT main %s", ["a"], [0], True),
+        ("prepared INSERT main %s", ["b"], [1], True),
+    ]
+
+
+def test_plan_sends_extras_individually_and_marks_them():
+    rows = {0: row("a", "p1", extras=("name", "phone")), 1: row("b", "p2")}
+
+    units = _plan(FakeRepository(), rows, group_by_partition=False, batch_size=20)
+
+    extras = [unit for unit in units if not unit[3]]
+    assert extras == [
+        ("prepared INSERT index", ["a"], [0], False),
+        ("prepared INSERT index", ["a"], [0], False),
+    ]
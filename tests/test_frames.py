@@ -0,0 +1,29 @@
+import pytest
+
+from src.database import frames
+from src.database.frames import to_columns
+
+
+def test_to_columns_transposes_page_by_page(monkeypatch):
+    monkeypatch.setattr(frames, "PAGE_ROWS", 2)
+    rows = iter([(1, "a"), (2, "b"), (3, "c")])
+
+    assert to_columns(rows, 2) == [[1, 2, 3], ["a", "b", "c"]]
+
+
+def test_to_columns_of_no_rows_gives_empty_columns():
+    assert to_columns([], 3) == [[], [], []]
+
+
+def test_to_frame_and_display_helpers():
+    pytest.importorskip("pandas")
+    frame = frames.to_frame(
+        [("d1", "Ada", "Lovelace"), ("d2", "Alan", "Turing"), ("d1", "Grace", "Hopper")],
+        ("department_id", "first_name", "last_name"),
+    )
+
+    assert str(frame["department_id"].dtype) == "category"
+    assert list(frames.full_names(frame)) == ["Ada Lovelace", "Alan Turing", "Grace Hopper"]
+    assert list(frames.short_ids(frame["first_name"], 2)) == ["Ad…", "Al…", "Gr…"]
+    counts = frames.group_counts(frame, "department_id", {"d1": "Cardiology"})
+    assert counts.to_dict() == {"Cardiology": 2, "d2…": 1}
@@ -0,0 +1,196 @@
+import asyncio
+
+import pytest
+from cassandra import InvalidRequest
+
+from src.database.futures import (
+    CombinedFuture,
+    CompletedFuture,
+    FallbackFuture,
+    ReprepareFuture,
+    RepositoryFuture,
+    _AwaitableFuture,
+    all_rows,
+    first_row,
+)
+
+
+class FakeResponseFuture:
+    """Driver future stand-in delivering ``pages`` or failing with ``error``."""
+
+    def __init__(self, pages=(), error=None):
+        self.pages = [list(page) for page in pages]
+        self.error = error
+        self.has_more_pages = False
+
+    def result(self):
+        if self.error is not None:
+            raise self.error
+        return [row for page in self.pages for row in page]
+
+    def add_callbacks(self, callback, errback):
+        if self.error is not None:
+            errback(self.error)
+            return
+        for page in self.pages:
+            callback(page)
+
+
+class Starts:
+    """Records the ``reprepare`` flags and hands out queued futures."""
+
+    def __init__(self, *futures):
+        self.futures = list(futures)
+        self.calls = []
+
+    def __call__(self, reprepare):
+        self.calls.append(reprepare)
+        return self.futures.pop(0)
+
+
+def test_reprepare_future_retries_once_after_invalid_request():
+    start = Starts(
+        FakeResponseFuture(error=InvalidRequest("stale")),
+        FakeResponseFuture(pages=[[1, 2]]),
+    )
+
+    assert ReprepareFuture(start).result() == [1, 2]
+    assert start.calls == [False, True]
+
+
+def test_reprepare_future_gives_up_after_one_retry():
+    start = Starts(
+        FakeResponseFuture(error=InvalidRequest("stale")),
+        FakeResponseFuture(error=InvalidRequest("still stale")),
+    )
+
+    with pytest.raises(InvalidRequest):
+        ReprepareFuture(start).result()
+    assert start.calls == [False, True]
+
+
+def test_reprepare_future_retries_from_errback():
+    start = Starts(
+        FakeResponseFuture(error=InvalidRequest("stale")),
+        FakeResponseFuture(pages=[[1], [2]]),
+    )
+    pages, errors = [], []
+
+    ReprepareFuture(start).add_callbacks(pages.append, errors.append)
+
+    assert pages == [[1], [2]]
+    assert errors == []
+
+
+def test_reprepare_future_passes_other_errors_through():
+    error = RuntimeError("timeout")
+    start = Starts(FakeResponseFuture(error=error))
+    errors = []
+
+    ReprepareFuture(start).add_callbacks(lambda page: None, errors.append)
+
+    assert errors == [error]
+    assert start.calls == [False]
+
+
+def test_fallback_future_skips_fallback_when_first_has_a_value():
+    fallbacks = []
+
+    def fallback():
+        fallbacks.append(True)
+        return CompletedFuture("legacy")
+
+    future = FallbackFuture(CompletedFuture("note"), fallback)
+
+    assert future.result() == "note"
+    assert fallbacks == []
+
+
+def test_fallback_future_reads_fallback_on_none():
+    future = FallbackFuture(CompletedFuture(None), lambda: CompletedFuture("legacy"))
+    values = []
+
+    future.add_callbacks(values.append, values.append)
+
+    assert future.result() == "legacy"
+    assert values == ["legacy"]
+
+
+class PagedResponseFuture(FakeResponseFuture):
+    """Delivers one page per add_callbacks/start_fetching_next_page call."""
+
+    def add_callbacks(self, callback, errback):
+        self.callback = callback
+        self.start_fetching_next_page()
+
+    def start_fetching_next_page(self):
+        page = self.pages.pop(0)
+        self.has_more_pages = bool(self.pages)
+        self.callback(page)
+
+
+def test_repository_future_maps_every_page():
+    future = RepositoryFuture(
+        PagedResponseFuture(pages=[[1, 2], [3], [4]]), all_rows(lambda n: n * 10)
+    )
+    values = []
+
+    future.add_callbacks(values.append, values.append)
+
+    assert values == [[10, 20, 30, 40]]
+
+
+def test_repository_future_result_maps_all_rows():
+    future = RepositoryFuture(FakeResponseFuture(pages=[[1], [2]]), first_row(str))
+
+    assert future.result() == "1"
+
+
+def test_combined_future_combines_in_order():
+    futures = [
+        RepositoryFuture(PagedResponseFuture(pages=[[1], [2]]), all_rows(int)),
+        CompletedFuture([3]),
+    ]
+    values = []
+
+    CombinedFuture(futures, lambda a, b: a + b).add_callbacks(
+        values.append, values.append
+    )
+
+    assert values == [[1, 2, 3]]
+
+
+def test_combined_future_reports_the_first_error_once():
+    error = RuntimeError("down")
+    futures = [
+        RepositoryFuture(FakeResponseFuture(error=error), all_rows(int)),
+        RepositoryFuture(FakeResponseFuture(error=RuntimeError("later")), all_rows(int)),
+    ]
+    values, errors = [], []
+
+    CombinedFuture(futures, lambda a, b: a + b).add_callbacks(
+        values.append, errors.append
+    )
+
+    assert values == []
+    assert errors == [error]
+
+
+def test_futures_are_awaitable():
+    future = CombinedFuture(
+        [CompletedFuture([1]), CompletedFuture([2])], lambda a, b: a + b
+    )
+
+    async def wait():
+        return await future
+
+    assert asyncio.run(wait()) == [1, 2]
+
+
+def test_awaitable_future_requires_add_callbacks():
+    class Incomplete(_AwaitableFuture):
+        def result(self):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
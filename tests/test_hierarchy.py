@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from src.database import hierarchy
+from src.database.buckets import bucket_count
+from src.database.hierarchy import HierarchyLoader
+
+
+class Tracker:
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+
+class TrackedFuture:
+    def __init__(self, tracker, value):
+        self.tracker = tracker
+        self.value = value
+        tracker.in_flight += bucket_count()
+        tracker.peak = max(tracker.peak, tracker.in_flight)
+
+    def result(self):
+        self.tracker.in_flight -= bucket_count()
+        return self.value
+
+
+class MemberRepository:
+    def __init__(self, tracker, kind):
+        self.tracker = tracker
+        self.kind = kind
+
+    def find_by_department_async(self, department_id):
+        return TrackedFuture(self.tracker, [f"{self.kind} of {department_id}"])
+
+
+class Department:
+    def __init__(self, department_id):
+        self.department_id = department_id
+        self.patients = []
+        self.staff_members = []
+
+    def add_patient(self, patient):
+        self.patients.append(patient)
+
+    def add_staff(self, member):
+        self.staff_members.append(member)
+
+
+def test_member_reads_stay_within_max_in_flight(monkeypatch):
+    monkeypatch.setattr(hierarchy, "MAX_IN_FLIGHT", 4 * bucket_count())
+    tracker = Tracker()
+    loader = HierarchyLoader(
+        SimpleNamespace(), SimpleNamespace(),
+        MemberRepository(tracker, "patient"), MemberRepository(tracker, "staff"),
+    )
+    departments = [Department(i) for i in range(7)]
+
+    loader._attach_members_by_partition(departments)
+
+    assert tracker.peak <= hierarchy.MAX_IN_FLIGHT
+    assert [d.patients for d in departments] == [[f"patient of {i}"] for i in range(7)]
+    assert [d.staff_members for d in departments] == [[f"staff of {i}"] for i in range(7)]
@@ -0,0 +1,39 @@
+import pytest
+
+from src.database.instrumentation import LatencyHistogram
+
+
+def test_percentile_of_empty_histogram():
+    assert LatencyHistogram().percentile(99) == 0.0
+
+
+def test_percentile_interpolates_within_bucket():
+    histogram = LatencyHistogram(buckets=(1.0, 2.0))
+    for _ in range(4):
+        histogram.observe(1.5)
+    # All samples fall in (1, 2], capped by the observed max of 1.5
+    assert histogram.percentile(50) == pytest.approx(1.25)
+    assert histogram.percentile(100) == pytest.approx(1.5)
+
+
+def test_percentile_picks_the_right_bucket():
+    histogram = LatencyHistogram(buckets=(0.01, 0.1, 1.0))
+    for _ in range(90):
+        histogram.observe(0.005)
+    for _ in range(10):
+        histogram.observe(0.5)
+    assert histogram.percentile(50) <= 0.01
+    assert 0.1 < histogram.percentile(99) <= 0.5
+
+
+def test_percentile_above_last_bucket_is_max():
+    histogram = LatencyHistogram(buckets=(0.01,))
+    histogram.observe(3.0)
+    assert histogram.percentile(99) == 3.0
+
+
+def test_cumulative_ends_with_inf():
+    histogram = LatencyHistogram(buckets=(1.0,))
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+    assert list(histogram.cumulative()) == [(1.0, 1), (float("inf"), 2)]
@@ -0,0 +1,68 @@
+from uuid import uuid4
+
+from src.database.futures import CompletedFuture
+from src.database.loader import BatchLoader
+
+
+class FakeFetch:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, entity_id):
+        self.calls.append(entity_id)
+        return CompletedFuture(f"entity {entity_id}")
+
+
+def test_load_many_fetches_each_id_once():
+    fetch = FakeFetch()
+    loader = BatchLoader(fetch)
+    first, second = uuid4(), uuid4()
+
+    result = loader.load_many([first, second, first, None, second])
+
+    assert sorted(map(str, fetch.calls)) == sorted([str(first), str(second)])
+    assert result[first] == f"entity {first}"
+    assert loader.fetched == 2
+
+
+def test_string_and_uuid_ids_share_an_entry():
+    fetch = FakeFetch()
+    loader = BatchLoader(fetch)
+    entity_id = uuid4()
+
+    loader.load_many([entity_id])
+    loader.load(str(entity_id))
+
+    assert len(fetch.calls) == 1
+
+
+def test_load_fetches_only_unseen_ids():
+    fetch = FakeFetch()
+    loader = BatchLoader(fetch)
+    entity_id = uuid4()
+
+    loader.load(entity_id)
+    loader.load(entity_id)
+    loader.load_many([entity_id, uuid4()])
+
+    assert len(fetch.calls) == 2
+    assert loader.load(None) is None
+
+
+class FailingFuture:
+    def result(self):
+        raise RuntimeError("database down")
+
+
+def test_failed_lookup_is_memoized_as_none():
+    calls = []
+
+    def fetch(entity_id):
+        calls.append(entity_id)
+        return FailingFuture()
+
+    loader = BatchLoader(fetch)
+    entity_id = uuid4()
+    assert loader.load(entity_id) is None
+    assert loader.load(entity_id) is None
+    assert len(calls) == 1
@@ -0,0 +1,63 @@
+import pytest
+
+from src.database.instrumentation import QUERY_METRICS
+from src.database.metrics_server import render_metrics
+
+
+class FakeRegistry:
+    def __init__(self, speculation=None):
+        self.speculation = speculation
+
+    def pool_stats(self):
+        return {"per_host": {"10.0.0.1:9042": {"in_flight": 3, "open_connections": 2}}}
+
+    def cache_stats(self):
+        return {"statements": {"hits": 9, "misses": 1, "hit_ratio": 0.9}}
+
+    def speculation_stats(self):
+        return self.speculation
+
+
+@pytest.fixture(autouse=True)
+def clean_query_metrics():
+    QUERY_METRICS.reset()
+    yield
+    QUERY_METRICS.reset()
+
+
+def samples(body):
+    """Map ``name{labels}`` to value for every sample line."""
+    return dict(
+        line.rsplit(" ", 1) for line in body.splitlines() if not line.startswith("#")
+    )
+
+
+def test_render_metrics_exposes_query_histograms():
+    QUERY_METRICS.observe('SELECT "x" FROM t', 0.002, rows=5)
+
+    body = render_metrics(FakeRegistry())
+    values = samples(body)
+
+    assert "# TYPE hospital_query_duration_seconds histogram" in body
+    labels = 'statement="SELECT \\"x\\" FROM t"'
+    inf_bucket = f'hospital_query_duration_seconds_bucket{{{labels},le="+Inf"}}'
+    assert values[inf_bucket] == "1"
+    assert values[f"hospital_query_duration_seconds_count{{{labels}}}"] == "1"
+    assert values[f"hospital_query_rows_total{{{labels}}}"] == "5"
+
+
+def test_render_metrics_exposes_pool_and_cache_state():
+    values = samples(render_metrics(FakeRegistry()))
+
+    assert values['hospital_pool_in_flight_requests{host="10.0.0.1:9042"}'] == "3"
+    assert values['hospital_pool_open_connections{host="10.0.0.1:9042"}'] == "2"
+    assert values['hospital_cache_hit_ratio{cache="statements"}'] == "0.9"
+
+
+def test_render_metrics_speculation_only_when_enabled():
+    assert "speculative" not in render_metrics(FakeRegistry())
+
+    values = samples(render_metrics(FakeRegistry({"fired": 4, "won": 1})))
+
+    assert values['hospital_speculative_executions_total{outcome="fired"}'] == "4"
+    assert values['hospital_speculative_executions_total{outcome="won"}'] == "1"
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.database import migrations
+from src.database.migrations import KEYSPACE, LATEST_VERSION, Migration, migrate
+
+
+class FakeSession:
+    """Answers the schema_version read with ``version`` and records DDL."""
+
+    def __init__(self, version):
+        self.version = version
+        self.statements = []
+        self.keyspace = None
+
+    def execute(self, statement, params=None):
+        if "SELECT version" in statement:
+            row = SimpleNamespace(version=self.version) if self.version else None
+            return SimpleNamespace(one=lambda: row)
+        self.statements.append((statement.strip(), params))
+        return None
+
+    def set_keyspace(self, keyspace):
+        self.keyspace = keyspace
+
+
+@pytest.fixture
+def three_migrations(monkeypatch):
+    steps = [
+        Migration(v, f"step {v}", (f"CREATE TABLE t{v} (k int PRIMARY KEY)",))
+        for v in (1, 2, 3)
+    ]
+    monkeypatch.setattr(migrations, "MIGRATIONS", steps)
+
+
+def applied(session):
+    """Versions recorded in schema_version, in order."""
+    return [
+        params[1]
+        for statement, params in session.statements
+        if statement.startswith("INSERT INTO schema_version")
+    ]
+
+
+def test_warm_start_applies_nothing(three_migrations):
+    session = FakeSession(version=3)
+
+    assert migrate(session, target=3) == 0
+    assert session.statements == []
+    assert session.keyspace == KEYSPACE
+
+
+def test_only_versions_after_the_applied_one_run(three_migrations):
+    session = FakeSession(version=1)
+
+    assert migrate(session, target=3) == 2
+    assert applied(session) == [2, 3]
+    assert not any("CREATE KEYSPACE" in stmt for stmt, _ in session.statements)
+
+
+def test_fresh_keyspace_bootstraps_and_stops_at_target(three_migrations):
+    session = FakeSession(version=0)
+
+    assert migrate(session, target=2) == 2
+    assert applied(session) == [1, 2]
+    assert "CREATE KEYSPACE" in session.statements[0][0]
+
+
+def test_migration_versions_are_increasing():
+    versions = [m.version for m in migrations.MIGRATIONS]
+
+    assert versions == sorted(set(versions))
+    assert LATEST_VERSION == versions[-1]
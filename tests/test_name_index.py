@@ -0,0 +1,97 @@
+from collections import namedtuple
+
+from src.database.name_index import (
+    MIN_PREFIX_LENGTH,
+    NameIndex,
+    is_searchable,
+    token_diff,
+)
+
+Row = namedtuple("Row", ["patient_id", "department_id", "first_name", "last_name"])
+
+ROWS = [
+    Row(1, "d1", "Ahmed", "Hassan"),
+    Row(2, "d1", "Ahmad", "Ali"),
+    Row(3, "d2", "Ahmed", "Said"),
+]
+
+
+class FakeRepository:
+    def __init__(self, rows=ROWS):
+        self.rows = rows
+        self.queries = []
+
+    def _execute(self, query, params):
+        self.queries.append(params)
+        return self.rows
+
+
+def make_index(rows=ROWS):
+    repository = FakeRepository(rows)
+    return NameIndex(repository, "patients_by_name", "patient_id"), repository
+
+
+def statement_tokens(statements, verb):
+    return {params[0] for query, params in statements if query.strip().startswith(verb)}
+
+
+def test_token_diff():
+    removed, added = token_diff({"f:ah", "f:ahm"}, {"f:ah", "f:ab"})
+    assert removed == {"f:ahm"}
+    assert added == {"f:ab"}
+
+
+def test_tokens_skip_short_prefixes():
+    tokens = NameIndex._tokens("Li", "Wu")
+    assert tokens == {"f:li", "l:wu"}
+    assert all(len(t.split(":", 1)[1]) >= MIN_PREFIX_LENGTH for t in tokens)
+
+
+def test_update_never_deletes_tokens_it_keeps():
+    index, _ = make_index()
+    statements = index.update_statements(
+        1, "d1", ("Ahmed", "Hassan"), ("Ahmed", "Hassen")
+    )
+    deleted = statement_tokens(statements, "DELETE")
+    inserted = statement_tokens(statements, "INSERT")
+
+    assert deleted == {"l:hassa", "l:hassan"}
+    assert not deleted & inserted
+    assert {"f:ahmed", "l:has", "l:hassen"} <= inserted
+
+
+def test_update_with_same_names_deletes_nothing():
+    index, _ = make_index()
+    statements = index.update_statements(1, "d1", ("Ahmed", "Hassan"), ("ahmed", "HASSAN"))
+    assert not statement_tokens(statements, "DELETE")
+
+
+def test_search_reads_only_the_longest_term():
+    index, repository = make_index()
+    assert index.search("ahm", "h") == {1: "d1"}
+    assert repository.queries == [["f:ahm"]]
+
+
+def test_search_ignores_terms_that_are_too_short():
+    index, repository = make_index()
+    assert index.search("a") == {}
+    assert repository.queries == []
+
+
+def test_search_stops_at_limit():
+    index, _ = make_index()
+    assert len(index.search("ahmed", limit=1)) == 1
+
+
+def test_combined_search_finds_matches_deep_in_a_partition():
+    rows = [Row(i, "d1", "Ahmed", "Mostafa") for i in range(1500)]
+    rows.append(Row("late", "d2", "Ahmed", "Hassan"))
+    index, _ = make_index(rows)
+    assert index.search("ahmed", "hassan") == {"late": "d2"}
+
+
+def test_is_searchable():
+    assert is_searchable("ah", None)
+    assert is_searchable("a", "ha")
+    assert not is_searchable("a", " b ")
+    assert not is_searchable(None, None)
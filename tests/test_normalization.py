@@ -0,0 +1,37 @@
+from src.utils.normalization import (
+    matches_name_prefix,
+    name_prefixes,
+    normalize_name,
+    normalize_phone,
+)
+
+
+def test_normalize_phone_keeps_digits_only():
+    assert normalize_phone("+20 123-4567890") == "201234567890"
+    assert normalize_phone("(555) 123 4567") == "5551234567"
+
+
+def test_normalize_phone_handles_none():
+    assert normalize_phone(None) == ""
+
+
+def test_normalize_name_casefolds_and_strips_accents():
+    assert normalize_name("  Ahmed  Él-Sayed ") == "ahmed el-sayed"
+    assert normalize_name("STRASSE") == normalize_name("straße")
+    assert normalize_name(None) == ""
+
+
+def test_name_prefixes_cover_every_word():
+    prefixes = name_prefixes("Abdel Rahman", max_length=12, min_length=2)
+    assert {"ab", "abd", "abdel", "abdel rahman", "ra", "rah", "rahman"} <= prefixes
+
+
+def test_name_prefixes_respect_length_bounds():
+    prefixes = name_prefixes("Alexandra", max_length=4, min_length=2)
+    assert prefixes == {"al", "ale", "alex"}
+
+
+def test_matches_name_prefix_checks_whole_name_and_words():
+    assert matches_name_prefix("Abdel Rahman", "abdel r")
+    assert matches_name_prefix("Abdel Rahman", "rah")
+    assert not matches_name_prefix("Abdel Rahman", "man")
@@ -0,0 +1,34 @@
+import pytest
+
+from src.config.settings import AppConfig
+from src.database.pagination import clamp_page_size, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    paging_state = b"\x00\x10\xff binary paging state"
+    cursor = encode_cursor(paging_state)
+    assert isinstance(cursor, str)
+    assert decode_cursor(cursor) == paging_state
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(b"\xfb\xff\xfe")
+    assert "+" not in cursor and "/" not in cursor
+
+
+def test_empty_cursor_means_last_page():
+    assert encode_cursor(None) is None
+    assert encode_cursor(b"") is None
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
+
+
+def test_invalid_cursor_raises_value_error():
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor!")
+
+
+def test_clamp_page_size():
+    assert clamp_page_size(None) == AppConfig.DEFAULT_PAGE_SIZE
+    assert clamp_page_size(0) == AppConfig.DEFAULT_PAGE_SIZE
+    assert clamp_page_size(AppConfig.MAX_PAGE_SIZE + 1) == AppConfig.MAX_PAGE_SIZE
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.database.policies import PercentileSpeculativePolicy
+
+HOST = "10.0.0.1"
+
+
+def complete(policy, latency, hosts=(HOST,)):
+    future = SimpleNamespace(attempted_hosts=list(hosts), coordinator_host=hosts[-1])
+    plan = policy.new_plan("hospital", "SELECT 1")
+    policy.on_complete(plan, future, latency)
+    return plan
+
+
+def test_initial_delay_until_enough_samples():
+    policy = PercentileSpeculativePolicy(initial_delay=0.05, min_samples=10, refresh=1)
+
+    for _ in range(9):
+        complete(policy, 0.001)
+
+    assert policy.current_delay() == 0.05
+
+
+def test_delay_follows_the_percentile_every_refresh():
+    policy = PercentileSpeculativePolicy(
+        percentile=90, min_delay=0.0, min_samples=10, refresh=5
+    )
+    for latency in range(1, 11):
+        complete(policy, latency / 1000)
+
+    assert policy.current_delay() == pytest.approx(0.010)
+
+    for _ in range(4):
+        complete(policy, 0.1)
+    assert policy.current_delay() == pytest.approx(0.010)  # not refreshed yet
+    complete(policy, 0.1)
+    assert policy.current_delay() == pytest.approx(0.1)
+
+
+def test_delay_never_drops_below_min_delay():
+    policy = PercentileSpeculativePolicy(min_delay=0.005, min_samples=3, refresh=1)
+
+    for _ in range(3):
+        complete(policy, 0.0001)
+
+    assert policy.current_delay() == 0.005
+
+
+def test_window_forgets_old_latencies():
+    policy = PercentileSpeculativePolicy(
+        percentile=50, min_delay=0.0, window=4, min_samples=4, refresh=1
+    )
+    for latency in (1.0, 1.0, 1.0, 1.0, 0.01, 0.01, 0.01):
+        complete(policy, latency)
+
+    assert policy.current_delay() == pytest.approx(0.01)
+
+
+def test_speculation_outcomes_are_counted():
+    policy = PercentileSpeculativePolicy()
+
+    complete(policy, 0.01)
+    plan = complete(policy, 0.01, hosts=(HOST, "10.0.0.2"))
+
+    assert (plan.fired, plan.won) == (1, True)
+    assert policy.stats.snapshot()["fired"] == 1
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+
+from src.database.futures import CompletedFuture
+from src.database.recent import WAVE_DAYS, RecentFeed
+
+
+class FakeRepository:
+    """Serves ``rows_per_day[offset]`` rows for the day ``offset`` days ago."""
+
+    def __init__(self, rows_per_day):
+        self.rows_per_day = rows_per_day
+        self.days = []
+
+    def _execute_async(self, query, params, profile=None):
+        day, limit = params
+        self.days.append(day)
+        offset = (datetime.now(timezone.utc).date() - day).days
+        count = min(self.rows_per_day.get(offset, 0), limit)
+        return CompletedFuture([(offset, n) for n in range(count)])
+
+
+def feed(repository):
+    return RecentFeed(repository, "things_by_created_day", "thing_id", ["thing_id"])
+
+
+def test_recent_stops_after_the_wave_that_fills_the_limit():
+    repository = FakeRepository({0: 2, 3: 5, 10: 5})
+
+    rows = feed(repository).recent(5, lambda row: row, lookback_days=30)
+
+    assert rows == [(0, 0), (0, 1), (3, 0), (3, 1), (3, 2)]
+    assert len(repository.days) == WAVE_DAYS
+
+
+def test_recent_reads_later_waves_newest_first():
+    repository = FakeRepository({1: 1, 9: 3})
+
+    rows = feed(repository).recent(3, lambda row: row, lookback_days=30)
+
+    assert rows == [(1, 0), (9, 0), (9, 1)]
+    assert len(repository.days) == 2 * WAVE_DAYS
+    today = datetime.now(timezone.utc).date()
+    assert repository.days[:2] == [today, today - timedelta(days=1)]
+
+
+def test_recent_respects_the_lookback():
+    repository = FakeRepository({})
+
+    assert feed(repository).recent(5, lambda row: row, lookback_days=10) == []
+    assert len(repository.days) == 10
@@ -0,0 +1,55 @@
+from src.database.reference_cache import TTLCache
+
+
+def test_get_or_load_caches_values():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def load():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_load("k", load) == "value"
+    assert cache.get_or_load("k", load) == "value"
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_empty_values_are_not_cached():
+    cache = TTLCache(ttl=60)
+    cache.get_or_load("k", lambda: None)
+    assert cache.stats()["size"] == 0
+
+
+def test_invalidate_drops_entries():
+    cache = TTLCache(ttl=60)
+    cache.get_or_load("k", lambda: "old")
+    cache.invalidate()
+    assert cache.get_or_load("k", lambda: "new") == "new"
+
+
+def test_load_started_before_invalidate_is_not_stored():
+    cache = TTLCache(ttl=60)
+
+    def stale_load():
+        # A write invalidates the cache while this read is in flight
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get_or_load("k", stale_load) == "stale"
+    assert cache.get_or_load("k", lambda: "fresh") == "fresh"
+
+
+def test_store_checks_generation():
+    cache = TTLCache(ttl=60)
+    found, _, generation = cache.lookup("k")
+    assert not found
+    cache.invalidate()
+    cache.store("k", "stale", generation)
+    assert cache.lookup("k")[0] is False
+
+
+def test_zero_ttl_disables_caching():
+    cache = TTLCache(ttl=0)
+    cache.get_or_load("k", lambda: "value")
+    assert cache.stats()["size"] == 0
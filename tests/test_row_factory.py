@@ -0,0 +1,63 @@
+from collections import namedtuple
+from datetime import datetime
+from uuid import uuid4
+
+from src.database.row_factory import model_row_factory
+from src.models.department import Department
+from src.models.patient import Patient
+from src.models.staff import Staff
+
+STAFF_COLUMNS = [
+    "department_id", "staff_id", "age", "created_at", "first_name",
+    "last_name", "name", "position",
+]
+
+
+def test_row_builder_rejects_incomplete_column_sets():
+    assert Staff.row_builder(("staff_id", "first_name")) is None
+    assert Patient.row_builder(("department_id", "patient_id")) is None
+
+
+def test_model_row_factory_builds_models_for_entity_rows():
+    dept, sid, created = uuid4(), uuid4(), datetime(2026, 1, 2)
+    rows = [(dept, sid, 41, created, "Ada", "Lovelace", None, "Surgeon")]
+
+    (staff,) = model_row_factory(STAFF_COLUMNS, rows)
+
+    assert isinstance(staff, Staff)
+    assert (staff.staff_id, staff.person_id) == (sid, sid)
+    assert staff.department_id == dept
+    assert staff.name == "Ada Lovelace"
+    assert staff.position == "Surgeon"
+
+
+def test_model_row_factory_falls_back_to_namedtuples():
+    (row,) = model_row_factory(["phone", "patient_id"], [("555", "p1")])
+
+    assert row.phone == "555"
+    assert row.patient_id == "p1"
+
+
+def test_patient_record_is_pending_unless_the_row_carries_it():
+    columns = list(Patient.ROW_COLUMNS[:-1])
+    values = (uuid4(), 30, None, "Alan", "Turing", "1990-01-01", "555", uuid4())
+
+    (patient,) = model_row_factory(columns, [values])
+    (inline,) = model_row_factory(columns + ["medical_record"], [values + ("notes",)])
+
+    assert not patient.record_loaded
+    assert inline.medical_record == "notes"
+
+
+def test_from_row_matches_the_row_builder():
+    Row = namedtuple("Row", Department.ROW_COLUMNS)
+    row = Row(uuid4(), uuid4(), "Cardiology", "Heart", None, datetime(2026, 1, 2))
+
+    department = Department.from_row(row)
+    copy = Department.from_row(department)
+
+    for model in (department, copy):
+        assert model.department_id == row.department_id
+        assert model.name == "Cardiology"
+        assert model.patients == [] and model.staff_members == []
+    assert copy.patients is not department.patients
@@ -0,0 +1,19 @@
+from src.database.scanner import MAX_TOKEN, MIN_TOKEN, split_token_ring
+
+
+def test_split_token_ring_covers_the_whole_ring():
+    ranges = split_token_ring(7)
+    assert len(ranges) == 7
+    assert ranges[0][0] == MIN_TOKEN
+    assert ranges[-1][1] == MAX_TOKEN
+
+
+def test_split_token_ring_ranges_are_contiguous():
+    ranges = split_token_ring(16)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+    assert all(start < end for start, end in ranges)
+
+
+def test_split_token_ring_single_range():
+    assert split_token_ring(1) == [(MIN_TOKEN, MAX_TOKEN)]